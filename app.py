@@ -8,10 +8,25 @@ import os
 import sys
 import logging
 import asyncio
+import gzip
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import anyio
+import httpx
+import uvicorn
+import orjson
 from dotenv import load_dotenv
-from flask import Flask, render_template_string, request, jsonify, redirect, url_for
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import minify_html
+except ImportError:  # Optional; the page is served unminified without it
+    minify_html = None
 
 # Add src directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,25 +36,54 @@ from src.agents.zane import Zane
 from src.agents.mira import Mira
 from src.agents.chloe import Chloe
 from src.agents.axel import Axel
-from src.core.config import Config
+from src.core.config import config
+from src.core.logging_setup import configure_logging
+from src.tools.web_search import WebSearchTool
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
-app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key')
+@dataclass(frozen=True)
+class RuntimeCfg:
+    """Server settings, read from the environment once at import"""
+    port: int
+    debug: bool
+    secret: str
+    threadpool_size: int  # Worker threads available to run_in_threadpool
+    serve: str  # 'prod' runs one worker process per CPU without auto-reload
+
+CFG = RuntimeCfg(
+    port=int(os.getenv('PORT', 5000)),
+    debug=os.getenv('FLASK_ENV', 'development') == 'development',
+    secret=os.getenv('FLASK_SECRET_KEY', 'dev-secret-key'),
+    threadpool_size=int(os.getenv('HELIUM_THREADPOOL_SIZE', 300)),
+    serve=os.getenv('HELIUM_SERVE', 'dev')
+)
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Helium AI",
+    description="Multi-Agent Collaboration Platform",
+    default_response_class=ORJSONResponse
+)
+app.state.secret_key = CFG.secret
+
+@dataclass
+class ConversationEntry:
+    """A single message in the conversation history"""
+    __slots__ = ('role', 'content', 'agent', 'timestamp')
+    role: str
+    content: str
+    agent: str
+    timestamp: str
 
 # Initialize agents
 agents = {}
-conversation_history = []
+conversation_history = deque(maxlen=50)  # Keeps only the last 50 messages
 
 class AgentManager:
     """Manages the lifecycle and interactions of all agents"""
@@ -47,19 +91,38 @@ class AgentManager:
     def __init__(self):
         self.agents = {}
         self.zane = None
+        self.initialized = False
+        self._init_lock = None  # Created lazily so it binds to the server's event loop
+        self.http_client = None  # Shared by all agents so connections are reused across requests
         
     async def initialize(self):
-        """Initialize all agents and set up their relationships"""
+        """Initialize all agents once and set up their relationships"""
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        
+        async with self._init_lock:
+            if self.initialized:
+                return True
+            return await self._create_agents()
+    
+    async def _create_agents(self):
+        """Create the agent pool shared by all requests"""
         try:
             # Load configuration
-            Config.validate()
-            llm_config = Config.get_llm_config()
+            llm_config = config.get_llm_config()
+            
+            # One connection pool for every outbound request the agents make
+            if self.http_client is None:
+                self.http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(10.0)
+                )
             
             # Initialize agents
             self.zane = Zane(llm_config=llm_config)
-            mira = Mira(llm_config=llm_config)
-            chloe = Chloe(llm_config=llm_config)
-            axel = Axel(llm_config=llm_config)
+            mira = Mira(llm_config=llm_config, http_client=self.http_client)
+            chloe = Chloe(llm_config=llm_config, http_client=self.http_client)
+            axel = Axel(llm_config=llm_config, http_client=self.http_client)
             
             # Set up the team
             self.zane.add_team_member(mira)
@@ -74,6 +137,7 @@ class AgentManager:
                 'axel': axel
             }
             
+            self.initialized = True
             logger.info("All agents initialized successfully")
             return True
             
@@ -88,6 +152,13 @@ class AgentManager:
     async def process_message(self, message: str, agent_id: str, context: Optional[Dict] = None) -> Dict:
         """Process a message with the specified agent"""
         try:
+            # Agents live on the server's event loop; initialize them on first use if startup failed
+            if not self.initialized and not await self.initialize():
+                return {
+                    "success": False,
+                    "error": "Agents are not available. Check the server logs for details."
+                }
+            
             agent = self.get_agent(agent_id)
             response = await agent.process(message, context or {})
             return {
@@ -103,26 +174,56 @@ class AgentManager:
                 "success": False,
                 "error": f"An error occurred: {str(e)}"
             }
+    
+    async def stream_message(self, message: str, agent_id: str, context: Optional[Dict] = None):
+        """Stream a message's result from the specified agent, in process_message's format"""
+        try:
+            if not self.initialized and not await self.initialize():
+                yield {
+                    "success": False,
+                    "error": "Agents are not available. Check the server logs for details."
+                }
+                return
+            
+            agent = self.get_agent(agent_id)
+            async for response in agent.stream(message, context or {}):
+                yield {
+                    "success": True,
+                    "response": {
+                        "content": response.content,
+                        "metadata": response.metadata
+                    }
+                }
+        except Exception as e:
+            logger.error(f"Error streaming message: {str(e)}", exc_info=True)
+            yield {
+                "success": False,
+                "error": f"An error occurred: {str(e)}"
+            }
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
 
 # Initialize the agent manager
 agent_manager = AgentManager()
 
-def initialize_agents():
+async def initialize_agents():
     """Initialize all Helium AI agents"""
     try:
-        # Run the async initialization
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        success = loop.run_until_complete(agent_manager.initialize())
-        loop.close()
+        # Run the initialization on the server's event loop
+        success = await agent_manager.initialize()
         
         if not success:
             logger.error("Failed to initialize agents")
             return False
             
-        # Store agents in the global agents dict for backward compatibility
-        global agents
-        agents = agent_manager.agents
+        # Mirror the pool into the module-level agents dict for backward compatibility;
+        # updating it in place keeps references imported elsewhere valid
+        agents.clear()
+        agents.update(agent_manager.agents)
         return True
         
     except Exception as e:
@@ -329,7 +430,10 @@ HTML_TEMPLATE = """
                 }
                 
                 const contentDiv = document.createElement('div');
-                contentDiv.innerHTML = header + content;
+                contentDiv.innerHTML = header;
+                const bodyDiv = document.createElement('div');
+                bodyDiv.innerHTML = content;
+                contentDiv.appendChild(bodyDiv);
                 
                 const timeDiv = document.createElement('div');
                 timeDiv.className = 'message-time';
@@ -340,6 +444,7 @@ HTML_TEMPLATE = """
                 
                 chatMessages.appendChild(messageDiv);
                 chatMessages.scrollTop = chatMessages.scrollHeight;
+                return bodyDiv;
             }
             
             // Helper function to get agent role
@@ -353,8 +458,8 @@ HTML_TEMPLATE = """
                 return roles[agentId] || 'AI';
             }
             
-            // Function to send a message
-            async function sendMessage() {
+            // Function to send a message; the reply is streamed in as it is generated
+            function sendMessage() {
                 const message = userInput.value.trim();
                 const agentId = agentSelector.value;
                 
@@ -364,40 +469,38 @@ HTML_TEMPLATE = """
                 addMessage(message, true, getAgentRole(agentId));
                 userInput.value = '';
                 
-                try {
-                    // Show typing indicator
-                    statusElement.textContent = `${getAgentRole(agentId)} is thinking...`;
-                    
-                    // Send message to the server
-                    const response = await fetch('/chat', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            message: message,
-                            agent: agentId
-                        })
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error('Network response was not ok');
-                    }
-                    
-                    const data = await response.json();
-                    
-                    // Add assistant's response to chat
-                    if (data.success && data.response) {
-                        addMessage(data.response.content, false, agentId);
-                    } else {
-                        addMessage('I encountered an error processing your request.', false, 'System');
-                    }
-                } catch (error) {
-                    console.error('Error:', error);
-                    addMessage('Sorry, there was an error connecting to the server.', false, 'System');
-                } finally {
+                // Show typing indicator
+                statusElement.textContent = `${getAgentRole(agentId)} is thinking...`;
+                
+                const params = new URLSearchParams({ message: message, agent: agentId });
+                const source = new EventSource(`/chat/stream?${params}`);
+                let replyDiv = null;
+                let reply = '';
+                
+                function finish() {
+                    source.close();  // Stop EventSource from reconnecting and resending the message
                     statusElement.textContent = 'Connected';
                 }
+                
+                // Append each fragment to the assistant's message as it arrives
+                source.onmessage = function(event) {
+                    reply += JSON.parse(event.data).t;
+                    if (replyDiv) {
+                        replyDiv.innerHTML = reply;
+                        chatMessages.scrollTop = chatMessages.scrollHeight;
+                    } else {
+                        replyDiv = addMessage(reply, false, agentId);
+                    }
+                };
+                
+                source.addEventListener('done', finish);
+                
+                source.onerror = function() {
+                    if (!replyDiv) {
+                        addMessage('Sorry, there was an error connecting to the server.', false, 'System');
+                    }
+                    finish();
+                };
             }
             
             // Event listeners
@@ -416,159 +519,254 @@ HTML_TEMPLATE = """
 </html>
 """
 
-@app.route('/')
-def home():
+# The page has no template variables, so minify, encode and compress it once and serve the bytes as-is
+_HOME_HTML = (
+    minify_html.minify(HTML_TEMPLATE, minify_css=True, minify_js=True)
+    if minify_html is not None else HTML_TEMPLATE
+)
+_HOME_BYTES = _HOME_HTML.encode('utf-8')
+_HOME_GZIP = gzip.compress(_HOME_BYTES, compresslevel=9)
+_HOME_HEADERS = {
+    'Content-Length': str(len(_HOME_BYTES)),
+    'Cache-Control': 'public, max-age=300',
+    'Vary': 'Accept-Encoding'
+}
+_HOME_GZIP_HEADERS = {
+    'Content-Length': str(len(_HOME_GZIP)),
+    'Cache-Control': 'public, max-age=300',
+    'Vary': 'Accept-Encoding',
+    'Content-Encoding': 'gzip'
+}
+
+@app.on_event("startup")
+async def startup_event():
+    """Initialize the agents once the server's event loop is running."""
+    # Allow more concurrent worker threads for response formatting than anyio's default of 40
+    anyio.to_thread.current_default_thread_limiter().total_tokens = CFG.threadpool_size
+    if not await initialize_agents():
+        logger.error("Failed to initialize agents")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources before the server exits."""
+    await agent_manager.aclose()
+    await WebSearchTool.aclose_shared()
+
+@app.get('/', response_class=HTMLResponse)
+async def home(request: Request):
     """Render the main chat interface."""
-    return render_template_string(HTML_TEMPLATE)
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        return Response(content=_HOME_GZIP, media_type='text/html', headers=_HOME_GZIP_HEADERS)
+    return Response(content=_HOME_BYTES, media_type='text/html', headers=_HOME_HEADERS)
 
-@app.route('/chat', methods=['POST'])
-async def chat():
-    """Handle chat messages."""
-    global conversation_history
+# Translation table used to title-case response keys, e.g. 'net_income' -> 'Net Income'
+_TITLE_TRANS = str.maketrans('_', ' ')
+
+@lru_cache(maxsize=256)
+def _title(key: str) -> str:
+    """Turn a response key into a display title; agents reuse a small set of keys."""
+    return key.translate(_TITLE_TRANS).title()
+
+# Keys that mark a financial data response
+_FINANCIAL_KEYS = frozenset(('period', 'revenue', 'gross_profit_margin'))
+
+_FINANCIAL_TEMPLATE = (
+    "📊 **Financial Overview - {period}**\n"
+    "• Revenue: ${revenue:,.2f}\n"
+    "• Gross Profit Margin: {gross_profit_margin:.1%}\n"
+    "• EBITDA Margin: {ebitda_margin:.1%}\n"
+    "• Net Income: ${net_income:,.2f}\n\n"
+    "📈 **Key Metrics**"
+)
+
+def _format_financial(data: Dict) -> str:
+    """Format a financial data response in a clean, readable way."""
+    parts = [_FINANCIAL_TEMPLATE.format(
+        period=data.get('period'),
+        revenue=float(data['revenue']),
+        gross_profit_margin=float(data['gross_profit_margin']),
+        ebitda_margin=float(data.get('ebitda_margin', 0)),
+        net_income=float(data.get('net_income', 0))
+    )]
     
+    # Add key metrics if available
+    metrics = data.get('key_metrics')
+    if isinstance(metrics, dict):
+        parts.append("\n".join(
+            f"• {_title(k)}: {v:.2f}" if isinstance(v, (int, float)) else f"• {_title(k)}: {v}"
+            for k, v in metrics.items()
+        ))
+    else:
+        parts.append("")
+    
+    # Add trends if available
+    trends = data.get('trends')
+    if isinstance(trends, list):
+        parts.append("\n📊 **Trends**")
+        parts.extend("• " + trend for trend in trends)
+    return "\n".join(parts)
+
+def _format_message(data: Dict) -> str:
+    """Format a message-based response, with suggestions if available."""
+    parts = [data['message']]
+    suggestions = data.get('suggestions')
+    if isinstance(suggestions, list):
+        parts.append("\n💡 Suggestions:")
+        parts.extend("• " + suggestion for suggestion in suggestions)
+    return "\n".join(parts)
+
+def _fmt_bullets(data: Dict) -> str:
+    """Format a dictionary as key-value bullet points, skipping private and empty fields."""
+    return '\n'.join(
+        f"• {_title(k)}: {v}"
+        for k, v in data.items()
+        if v is not None and not k.startswith('_')
+    )
+
+def _format_content(data: Dict) -> str:
+    """Format a response that carries its payload in a content field."""
+    content = data['content']
+    if isinstance(content, dict):
+        return _fmt_bullets(content)
+    return str(content)
+
+# Response shape -> formatter
+_FORMATTERS = {
+    'financial': _format_financial,
+    'message': _format_message,
+    'content': _format_content,
+    'fields': _fmt_bullets,
+}
+
+def _response_shape(data: Dict) -> str:
+    """Detect which of the known response formats a payload uses."""
+    if _FINANCIAL_KEYS <= data.keys():
+        return 'financial'
+    if 'message' in data:
+        return 'message'
+    if 'content' in data:
+        return 'content'
+    # If no specific content found, use the whole response
+    return 'fields'
+
+def _format_response_data(response_data: Any) -> str:
+    """Render an agent's response payload as chat text."""
+    if not isinstance(response_data, dict):
+        return str(response_data)
+    return _FORMATTERS[_response_shape(response_data)](response_data)
+
+def _build_response(response: Dict) -> Tuple[str, Dict]:
+    """Turn the result of AgentManager.process_message into chat text and metadata."""
+    if response.get('success', False):
+        response_content = _format_response_data(response.get('response', {}))
+        
+        # If we still don't have content, provide a default response
+        if not response_content.strip():
+            response_content = "I've processed your request. How can I assist you further?"
+    else:
+        response_content = response.get('error', 'An error occurred while processing your request.')
+    return response_content, response.get('metadata', {})
+
+@app.post('/chat')
+async def chat(request: Request):
+    """Handle chat messages."""
     try:
-        data = request.get_json()
+        data = orjson.loads(await request.body())
         message = data.get('message', '').strip()
         agent_id = data.get('agent', 'zane')
         
         if not message:
-            return jsonify({"success": False, "error": "Empty message"}), 400
+            return ORJSONResponse({"success": False, "error": "Empty message"}, status_code=400)
         
         # Process the message with the selected agent
         response = await agent_manager.process_message(message, agent_id)
         
-        # Get the agent's response content
-        response_content = ""
-        if response.get('success', False):
-            response_data = response.get('response', {})
-            
-            # Extract content from different possible response formats
-            if isinstance(response_data, dict):
-                # Format financial data response
-                if all(k in response_data for k in ['period', 'revenue', 'gross_profit_margin']):
-                    # Format financial data in a clean, readable way
-                    response_content = (
-                        f"📊 **Financial Overview - {response_data.get('period')}**\n"
-                        f"• Revenue: ${float(response_data['revenue']):,.2f}\n"
-                        f"• Gross Profit Margin: {float(response_data['gross_profit_margin']) * 100:.1f}%\n"
-                        f"• EBITDA Margin: {float(response_data.get('ebitda_margin', 0)) * 100:.1f}%\n"
-                        f"• Net Income: ${float(response_data.get('net_income', 0)):,.2f}\n\n"
-                        "📈 **Key Metrics**\n"
-                    )
-                    
-                    # Add key metrics if available
-                    if 'key_metrics' in response_data and isinstance(response_data['key_metrics'], dict):
-                        metrics = response_data['key_metrics']
-                        response_content += "\n".join(
-                            f"• {k.replace('_', ' ').title()}: {v:.2f}" 
-                            if isinstance(v, (int, float)) 
-                            else f"• {k.replace('_', ' ').title()}: {v}" 
-                            for k, v in metrics.items()
-                        )
-                    
-                    # Add trends if available
-                    if 'trends' in response_data and isinstance(response_data['trends'], list):
-                        response_content += "\n\n📊 **Trends**\n• " + "\n• ".join(response_data['trends'])
-                        
-                # Handle message-based responses
-                elif 'message' in response_data:
-                    response_content = response_data['message']
-                    
-                    # Add suggestions if available
-                    if 'suggestions' in response_data and isinstance(response_data['suggestions'], list):
-                        response_content += "\n\n💡 Suggestions:\n• " + "\n• ".join(response_data['suggestions'])
-                
-                # Handle content field
-                elif 'content' in response_data:
-                    content = response_data['content']
-                    if isinstance(content, dict):
-                        # Format dictionary content as key-value pairs
-                        response_content = '\n'.join(
-                            f"• {k.replace('_', ' ').title()}: {v}" 
-                            for k, v in content.items() 
-                            if not k.startswith('_') and v is not None
-                        )
-                    else:
-                        response_content = str(content)
-                
-                # If no specific content found, use the whole response
-                else:
-                    response_content = '\n'.join(
-                        f"• {k.replace('_', ' ').title()}: {v}" 
-                        for k, v in response_data.items() 
-                        if not k.startswith('_') and v is not None
-                    )
-            else:
-                response_content = str(response_data)
-                
-            # If we still don't have content, provide a default response
-            if not response_content.strip():
-                response_content = "I've processed your request. How can I assist you further?"
-        else:
-            response_content = response.get('error', 'An error occurred while processing your request.')
-        
-        # Add to conversation history
-        conversation_entry = {
-            "role": "user",
-            "content": message,
-            "agent": agent_id,
-            "timestamp": str(datetime.now())
-        }
-        conversation_history.append(conversation_entry)
-        
-        # Add agent's response to history
-        conversation_history.append({
-            "role": "assistant",
-            "content": response_content,
-            "agent": agent_id,
-            "timestamp": str(datetime.now())
-        })
+        # Format the reply in a worker thread so the event loop keeps serving other requests
+        response_content, metadata = await run_in_threadpool(_build_response, response)
         
-        # Keep only the last 50 messages
-        if len(conversation_history) > 50:
-            conversation_history = conversation_history[-50:]
+        # Add to conversation history, with one timestamp for the whole exchange
+        timestamp = datetime.now().isoformat(timespec='milliseconds')
+        conversation_history.extend((
+            ConversationEntry("user", message, agent_id, timestamp),
+            ConversationEntry("assistant", response_content, agent_id, timestamp)
+        ))
         
-        return jsonify({
+        return {
             "success": True,
             "response": {
                 "content": response_content,
-                "metadata": response.get('metadata', {})
+                "metadata": metadata
             }
-        })
+        }
         
     except Exception as e:
         logger.error(f"Error in chat endpoint: {str(e)}", exc_info=True)
-        return jsonify({
+        return ORJSONResponse({
             "success": False, 
             "error": f"An error occurred: {str(e)}"
-        }), 500
+        }, status_code=500)
+
+# The agent roster is fixed, so serialize it once at import
+_AGENTS_BODY = orjson.dumps({
+    "success": True,
+    "agents": [
+        {"id": "zane", "name": "Zane", "role": "Team Leader"},
+        {"id": "mira", "name": "Mira", "role": "Data Scientist"},
+        {"id": "chloe", "name": "Chloe", "role": "Financial Analyst"},
+        {"id": "axel", "name": "Axel", "role": "Business Strategist"}
+    ]
+})
+_AGENTS_HEADERS = {'Cache-Control': 'public, max-age=3600'}
+
+def _sse_event(data: Dict, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Events message."""
+    prefix = b'event: ' + event.encode('utf-8') + b'\n' if event else b''
+    return prefix + b'data: ' + orjson.dumps(data) + b'\n\n'
 
-@app.route('/api/agents', methods=['GET'])
-def list_agents():
+@app.get('/chat/stream')
+async def chat_stream(message: str = '', agent: str = 'zane'):
+    """Stream the reply to a chat message as Server-Sent Events."""
+    message = message.strip()
+    if not message:
+        return ORJSONResponse({"success": False, "error": "Empty message"}, status_code=400)
+    
+    async def events():
+        # Each message carries a text fragment to append; 'done' closes the exchange
+        parts = []
+        async for response in agent_manager.stream_message(message, agent):
+            text, _ = await run_in_threadpool(_build_response, response)
+            parts.append(text)
+            yield _sse_event({"t": text})
+        
+        timestamp = datetime.now().isoformat(timespec='milliseconds')
+        conversation_history.extend((
+            ConversationEntry("user", message, agent, timestamp),
+            ConversationEntry("assistant", "".join(parts), agent, timestamp)
+        ))
+        yield _sse_event({}, event='done')
+    
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.get('/api/agents')
+async def list_agents():
     """List all available agents."""
-    return jsonify({
-        "success": True,
-        "agents": [
-            {"id": "zane", "name": "Zane", "role": "Team Leader"},
-            {"id": "mira", "name": "Mira", "role": "Data Scientist"},
-            {"id": "chloe", "name": "Chloe", "role": "Financial Analyst"},
-            {"id": "axel", "name": "Axel", "role": "Business Strategist"}
-        ]
-    })
+    return Response(content=_AGENTS_BODY, media_type='application/json', headers=_AGENTS_HEADERS)
 
 def main():
     """Main entry point for the application."""
-    # Initialize agents
-    if not initialize_agents():
-        logger.error("Failed to initialize agents. Exiting...")
-        return
-    
-    # Start the web server
-    port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('FLASK_ENV', 'development') == 'development'
-    
-    logger.info(f"Starting Helium AI on http://localhost:{port}")
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    # Agents are initialized by the startup hook on the server's event loop
+    logger.info(f"Starting Helium AI on http://localhost:{CFG.port}")
+    # uvloop and httptools are picked up automatically when installed
+    if CFG.serve == 'prod':
+        # One event loop per core; each worker process builds its own agent pool
+        uvicorn.run("app:app", host='0.0.0.0', port=CFG.port, workers=os.cpu_count() or 1,
+                    loop="auto", http="auto")
+    else:
+        uvicorn.run("app:app", host='0.0.0.0', port=CFG.port, reload=CFG.debug, loop="auto", http="auto")
 
 if __name__ == '__main__':
     main()
@@ -1,31 +1,35 @@
 """
 A minimal web interface for Helium AI using Flask.
 """
-from flask import Flask, render_template_string, request, jsonify
-import json
+from flask import Flask, Response, request
+from waitress import serve
+import orjson
+import re
+from collections import deque
 from datetime import datetime
 
 app = Flask(__name__)
 
-# Global variable for conversation history
-conversation_history = []
+# Global variable for conversation history (keeps only the last 20 messages)
+conversation_history = deque(maxlen=20)
 
 # Mock agent class for demonstration
+_RESPONSES = {
+    "hello": "Hello! I'm Helium AI. How can I help you today?",
+    "hi": "Hi there! I'm Helium AI. What would you like to know?",
+    "help": "I can help you with various tasks. Try asking me something!",
+    "default": "I'm a simple AI assistant. In a full version, I would process your request with advanced AI capabilities."
+}
+
+# Matches any of the keywords above in a single pass over the input
+_KEYWORD_PATTERN = re.compile(r'\b(hello|hi|help)\b', re.IGNORECASE)
+
 class MockAgent:
     def process(self, task):
         """Process a task and return a response."""
-        responses = {
-            "hello": "Hello! I'm Helium AI. How can I help you today?",
-            "hi": "Hi there! I'm Helium AI. What would you like to know?",
-            "help": "I can help you with various tasks. Try asking me something!",
-            "default": "I'm a simple AI assistant. In a full version, I would process your request with advanced AI capabilities."
-        }
-        
-        task_lower = task.lower()
-        for key in responses:
-            if key in task_lower:
-                return {"content": responses[key], "success": True}
-        return {"content": responses["default"], "success": True}
+        match = _KEYWORD_PATTERN.search(task)
+        key = match.group(1).lower() if match else "default"
+        return {"content": _RESPONSES[key], "success": True}
 
 # Initialize a mock agent
 agent = MockAgent()
@@ -202,43 +206,52 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page has no template variables, so encode it once and serve the bytes as-is
+_HOME_BYTES = HTML_TEMPLATE.encode('utf-8')
+_HOME_HEADERS = {
+    'Content-Length': str(len(_HOME_BYTES)),
+    'Cache-Control': 'public, max-age=300'
+}
+
+def ojsonify(obj, status=200):
+    """Serialize obj to a JSON response with orjson."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 @app.route('/')
 def home():
     """Render the chat interface."""
-    return render_template_string(HTML_TEMPLATE)
+    return Response(_HOME_BYTES, mimetype='text/html', headers=_HOME_HEADERS)
 
 @app.route('/chat', methods=['POST'])
 def chat():
     """Handle chat messages."""
-    global conversation_history  # Declare as global at the start of the function
-    
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data(cache=False))
         message = data.get('message', '').strip()
         
         if not message:
-            return jsonify({"success": False, "error": "Empty message"}), 400
+            return ojsonify({"success": False, "error": "Empty message"}, 400)
         
         # Process the message with the mock agent
         response = agent.process(message)
         
         # Add to conversation history
-        conversation_history.append({"role": "user", "content": message, "timestamp": str(datetime.now())})
-        conversation_history.append({"role": "assistant", "content": response["content"], "timestamp": str(datetime.now())})
-        
-        # Keep only the last 20 messages
-        if len(conversation_history) > 20:
-            conversation_history = conversation_history[-20:]
+        timestamp = datetime.now().isoformat(timespec='milliseconds')
+        conversation_history.extend((
+            {"role": "user", "content": message, "timestamp": timestamp},
+            {"role": "assistant", "content": response["content"], "timestamp": timestamp}
+        ))
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "response": response["content"]
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return ojsonify({"success": False, "error": str(e)}, 500)
 
 if __name__ == '__main__':
     print("\n🚀 Starting Helium AI (Minimal Version) at http://localhost:5000")
     print("Press Ctrl+C to stop\n")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Multi-threaded production WSGI server; no debugger or reloader
+    serve(app, host='0.0.0.0', port=5000, threads=16)
@@ -13,6 +13,7 @@ echo Starting Helium AI...
 echo.
 
 set PYTHONPATH=%CD%
+python src\build_assets.py
 python -m src.web_app
 
 if %ERRORLEVEL% neq 0 (
@@ -12,10 +12,8 @@ echo.
 echo Starting Helium AI (Simple Web Interface)...
 echo.
 
-set FLASK_APP=simple_web.py
-set FLASK_DEBUG=1
 set PYTHONPATH=%CD%
-python -m flask run --host=0.0.0.0 --port=5000
+python simple_web.py
 
 if %ERRORLEVEL% neq 0 (
     echo.
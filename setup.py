@@ -1,8 +1,20 @@
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional: compile the text splitter with mypyc (requires mypy) by running
+#   HELIUM_MYPYC=1 python setup.py build_ext --inplace
+# The app imports src.core.text_splitter, so the extension is built next to the source
+# and picked up in place of it. Without the extension the pure-Python module is used.
+package_dir = {"": "src"}
+ext_modules = []
+if os.environ.get("HELIUM_MYPYC"):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--ignore-missing-imports", "src/core/text_splitter.py"])
+    package_dir["src"] = "src"
+
 setup(
     name="helium-ai",
     version="0.1.0",
@@ -13,12 +25,13 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/helium-ai",
     packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    package_dir=package_dir,
     python_requires=">=3.8",
     install_requires=[
         # Core Dependencies
         "python-dotenv>=1.0.0",
         "pydantic>=2.0.0",
+        "msgspec>=0.18.0",
         
         # LLM and AI
         "langchain>=0.1.0",
@@ -52,6 +65,7 @@ setup(
         "Topic :: Scientific/Engineering",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
     ],
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "helium-ai=main:main",
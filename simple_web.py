@@ -1,42 +1,78 @@
 """
-A simple web interface for Helium AI using Flask (lighter than FastAPI for Windows).
+A simple web interface for Helium AI using FastAPI, served by uvicorn.
 """
 import os
 import sys
+import gzip
+import hashlib
 import json
+from collections import deque
 from datetime import datetime
-from flask import Flask, render_template_string, request, jsonify
+import msgspec
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from src.agents import Zane, Mira, Chloe, Axel
-except ImportError as e:
-    print(f"Error importing agents: {e}")
-    print("Make sure you're running from the project root directory and have installed the requirements.")
-    sys.exit(1)
+from src.agents import fastpath
+from src.agents.cache import LLMCache
+from src.tools.web_search import WebSearchTool
+from src.core.config import config
 
-app = Flask(__name__)
+app = FastAPI(title="Helium AI", description="Simple Web Interface")
 
-# Initialize agents
-try:
-    zane = Zane()
-    mira = Mira()
-    chloe = Chloe()
-    axel = Axel()
+# The agent team is created by the serving process on startup, not at import
+zane = None
+
+def init_agents():
+    """Create Zane and the specialist team, once per process."""
+    global zane
+    if zane is not None:
+        return zane
+    
+    try:
+        from src.agents import Zane, Mira, Chloe, Axel
+    except ImportError as e:
+        print(f"Error importing agents: {e}")
+        print("Make sure you're running from the project root directory and have installed the requirements.")
+        raise
+    
+    team_leader = Zane(llm_config=config.get_llm_config())
     
     # Set up the team
-    zane.add_team_member(mira)
-    zane.add_team_member(chloe)
-    zane.add_team_member(axel)
+    team_leader.add_team_member(Mira())
+    team_leader.add_team_member(Chloe())
+    team_leader.add_team_member(Axel())
     
-except Exception as e:
-    print(f"Error initializing agents: {e}")
-    sys.exit(1)
+    zane = team_leader
+    return zane
 
-# Store conversation history
-conversation_history = []
+# Store conversation history (keeps only the last 20 messages)
+conversation_history = deque(maxlen=20)
+
+def _build_embed_fn():
+    """Embed messages with Gemini for semantic cache matching, if HELIUM_SEMANTIC_CACHE is enabled."""
+    if os.getenv('HELIUM_SEMANTIC_CACHE', 'false').lower() not in ('true', '1') or config.LLM_PROVIDER != 'google':
+        return None
+    import google.generativeai as genai
+    genai.configure(api_key=config.GOOGLE_API_KEY)
+    
+    async def embed(text):
+        result = await run_in_threadpool(
+            genai.embed_content,
+            model="models/embedding-001",
+            content=text,
+            task_type="semantic_similarity"
+        )
+        return result["embedding"]
+    return embed
+
+# Cache of Zane's replies, keyed by message (and by meaning when embeddings are enabled)
+response_cache = LLMCache(embed_fn=_build_embed_fn(), threshold=0.92, ttl=3600)
 
 # HTML template
 HTML_TEMPLATE = """
@@ -176,6 +212,7 @@ HTML_TEMPLATE = """
                 
                 chatMessages.appendChild(messageDiv);
                 chatMessages.scrollTop = chatMessages.scrollHeight;
+                return contentDiv;
             }
             
             // Function to send a message
@@ -191,34 +228,34 @@ HTML_TEMPLATE = """
                 typingIndicator.style.display = 'block';
                 chatMessages.scrollTop = chatMessages.scrollHeight;
                 
-                try {
-                    const response = await fetch('/chat', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({ message: message })
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error('Network response was not ok');
-                    }
-                    
-                    const data = await response.json();
-                    
-                    // Add assistant's response to chat
-                    if (data.success && data.response) {
-                        addMessage(data.response);
-                    } else {
-                        addMessage('I encountered an error processing your request.');
-                    }
-                } catch (error) {
-                    console.error('Error:', error);
-                    addMessage('Sorry, there was an error connecting to the server.');
-                } finally {
-                    // Hide typing indicator
+                // Stream the reply, appending each delta as it arrives
+                const source = new EventSource(`/chat/stream?message=${encodeURIComponent(message)}`);
+                let contentDiv = null;
+                
+                function finish() {
+                    source.close();  // Stop EventSource from reconnecting and resending the message
                     typingIndicator.style.display = 'none';
                 }
+                
+                source.onmessage = function(event) {
+                    const delta = JSON.parse(event.data).delta;
+                    if (contentDiv) {
+                        contentDiv.textContent += delta;
+                        chatMessages.scrollTop = chatMessages.scrollHeight;
+                    } else {
+                        typingIndicator.style.display = 'none';
+                        contentDiv = addMessage(delta);
+                    }
+                };
+                
+                source.addEventListener('done', finish);
+                
+                source.onerror = function() {
+                    if (!contentDiv) {
+                        addMessage('Sorry, there was an error connecting to the server.');
+                    }
+                    finish();
+                };
             }
             
             // Event listeners
@@ -256,50 +293,128 @@ HTML_TEMPLATE = """
 </html>
 """
 
-@app.route('/')
-def home():
+# The page has no template variables, so encode and compress it once at import
+_HTML_BYTES = HTML_TEMPLATE.encode("utf-8")
+_HTML_GZIP = gzip.compress(_HTML_BYTES, compresslevel=9)
+_HTML_ETAG = f'"{hashlib.md5(_HTML_BYTES).hexdigest()}"'
+_HTML_HEADERS = {"ETag": _HTML_ETAG, "Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+_HTML_GZIP_HEADERS = dict(_HTML_HEADERS, **{"Content-Encoding": "gzip"})
+
+@app.on_event("startup")
+async def startup_event():
+    """Create the agent team before serving requests."""
+    try:
+        init_agents()
+    except Exception as e:
+        print(f"Error initializing agents: {e}")
+        raise
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled connections before the server exits."""
+    await WebSearchTool.aclose_shared()
+
+@app.get('/', response_class=HTMLResponse)
+async def home(request: Request):
     """Render the chat interface."""
-    return render_template_string(HTML_TEMPLATE)
+    if request.headers.get("if-none-match") == _HTML_ETAG:
+        return Response(status_code=304, headers=_HTML_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(content=_HTML_GZIP, media_type="text/html", headers=_HTML_GZIP_HEADERS)
+    return Response(content=_HTML_BYTES, media_type="text/html", headers=_HTML_HEADERS)
 
-@app.route('/chat', methods=['POST'])
-async def chat():
+@app.post('/chat')
+async def chat(request: Request):
     """Handle chat messages."""
     try:
-        data = request.get_json()
+        data = await request.json()
         message = data.get('message', '').strip()
         
         if not message:
-            return jsonify({"success": False, "error": "Empty message"}), 400
+            return JSONResponse({"success": False, "error": "Empty message"}, status_code=400)
         
-        # Process the message with Zane
-        response = await zane.process(message)
+        # Answer greetings and invalid input directly, then repeated questions from the cache,
+        # otherwise process the message with Zane
+        content = fastpath.classify(message)
+        if content is None:
+            content = await response_cache.get(message)
+        if content is None:
+            response = await zane.process(message)
+            content = str(response.content)
+            if response.success:
+                await response_cache.set(message, content)
         
         # Add to conversation history
         conversation_history.append({"role": "user", "content": message})
-        conversation_history.append({"role": "assistant", "content": str(response.content)})
-        
-        # Keep only the last 20 messages
-        global conversation_history
-        conversation_history = conversation_history[-20:]
+        conversation_history.append({"role": "assistant", "content": content})
         
-        return jsonify({
-            "success": True,
-            "response": str(response.content)
-        })
+        return Response(msgspec.json.encode({"success": True, "response": content}), media_type="application/json")
         
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+def _sse_event(data, event=None):
+    """Encode one Server-Sent Events message."""
+    prefix = b'event: ' + event.encode('utf-8') + b'\n' if event else b''
+    return prefix + b'data: ' + orjson.dumps(data) + b'\n\n'
 
-@app.route('/history')
-def history():
+@app.get('/chat/stream')
+async def chat_stream(message: str = ''):
+    """Stream the reply to a chat message as Server-Sent Events."""
+    message = message.strip()
+    if not message:
+        return JSONResponse({"success": False, "error": "Empty message"}, status_code=400)
+    
+    async def events():
+        # Each message carries a text delta to append; 'done' closes the exchange
+        content = fastpath.classify(message)
+        if content is None:
+            content = await response_cache.get(message)
+        if content is not None:
+            yield _sse_event({"delta": content})
+        else:
+            parts = []
+            success = True
+            try:
+                async for response in zane.stream(message):
+                    delta = str(response.content)
+                    success = success and response.success
+                    parts.append(delta)
+                    yield _sse_event({"delta": delta})
+            except Exception as e:
+                success = False
+                parts.append(f"Error: {e}")
+                yield _sse_event({"delta": parts[-1]})
+            content = "".join(parts)
+            if success:
+                await response_cache.set(message, content)
+        
+        conversation_history.append({"role": "user", "content": message})
+        conversation_history.append({"role": "assistant", "content": content})
+        yield _sse_event({}, event='done')
+    
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.get('/history')
+async def history():
     """Get the conversation history."""
-    return jsonify({"history": conversation_history})
+    return Response(orjson.dumps({"history": list(conversation_history)}), media_type="application/json")
+
+@app.get('/cache/stats')
+async def cache_stats():
+    """Get response cache hit and miss counts, and fast-path classification counts."""
+    return {**response_cache.stats, "fastpath": fastpath.stats}
 
 def start_server(host='0.0.0.0', port=5000):
-    """Start the Flask server."""
+    """Start the uvicorn server."""
     print(f"\n🚀 Starting Helium AI server at http://{host}:{port}")
     print("Press Ctrl+C to stop\n")
-    app.run(host=host, port=port, debug=True)
+    # uvloop and httptools are picked up automatically when installed
+    uvicorn.run("simple_web:app", host=host, port=port, loop="auto", http="auto", workers=1)
 
 if __name__ == '__main__':
     start_server()
@@ -8,11 +8,25 @@ This package contains the implementation of the Helium AI agents:
 - Axel (Business Strategist): Provides strategic insights and competitive analysis
 """
 
-from .base_agent import BaseAgent, AgentResponse
-from .zane import Zane
-from .mira import Mira
-from .chloe import Chloe
-from .axel import Axel
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent, AgentResponse
+    from .zane import Zane
+    from .mira import Mira
+    from .chloe import Chloe
+    from .axel import Axel
+
+# Exported name -> submodule defining it; agents are imported on first access (PEP 562)
+_LAZY = {
+    'BaseAgent': '.base_agent',
+    'AgentResponse': '.base_agent',
+    'Zane': '.zane',
+    'Mira': '.mira',
+    'Chloe': '.chloe',
+    'Axel': '.axel'
+}
 
 __all__ = [
     'BaseAgent',
@@ -22,3 +36,15 @@ __all__ = [
     'Chloe',
     'Axel'
 ]
+
+def __getattr__(name):
+    """Import an exported agent class the first time it is accessed."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    """List exported names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
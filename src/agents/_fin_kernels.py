@@ -0,0 +1,23 @@
+"""Numeric kernels for Chloe's projections, compiled with numba when it is installed."""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional; the NumPy versions below are used without it
+    njit = None
+
+def _project_market(bases: np.ndarray, growth: float) -> np.ndarray:
+    """Scale year i's base market size by (1 + i * growth)."""
+    return bases * (1.0 + growth * np.arange(bases.shape[0]))
+
+if njit is not None:
+    @njit(cache=True)
+    def _project_market_loop(bases, growth):
+        out = np.empty_like(bases)
+        for i in range(bases.shape[0]):
+            out[i] = bases[i] * (1.0 + i * growth)
+        return out
+
+    project_market = _project_market_loop
+else:
+    project_market = _project_market
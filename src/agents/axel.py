@@ -1,52 +1,219 @@
+import asyncio
+import copy
 import logging
-from typing import Dict, Any, List, Optional
-import random
+import re
+from typing import Dict, Any, Final, List, Optional, Sequence, Tuple
 from datetime import datetime
+import httpx
+import numpy as np
 from .base_agent import BaseAgent, AgentResponse
 from ..tools.web_search import WebSearchTool
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_RNG = np.random.default_rng()
+
+# Task routing: one named group per handler, listed in priority order
+_TASK_ROUTER = re.compile(
+    r"(?P<competitive>competit|rival|benchmark)"
+    r"|(?P<strategy>strategy|strategic|plan)"
+    r"|(?P<industry>market|industry|sector)"
+    r"|(?P<business_model>business model|revenue)",
+    re.IGNORECASE
+)
+_ROUTE_PRIORITY = {name: i for i, name in enumerate(("competitive", "strategy", "industry", "business_model"))}
+
+_FRAMEWORKS: Final = (
+    "Porter's Five Forces",
+    "SWOT Analysis",
+    "PESTEL Analysis",
+    "Business Model Canvas",
+    "Blue Ocean Strategy",
+    "Value Chain Analysis"
+)
+_KEY_PLAYERS: Final = tuple(f"Company {chr(65 + i)}" for i in range(5))
+_TIMEFRAME: Final = (("short_term", "3-6 months"), ("medium_term", "6-18 months"), ("long_term", "18+ months"))
+
+# Option tables for the placeholder analyses, indexed by batched RNG draws
+_COMPETITORS: Final = ("Competitor A", "Competitor B", "Competitor C")
+_MARKET_PLAYERS: Final = ("Our Company",) + _COMPETITORS
+_STRENGTH_AREAS: Final = ("brand", "distribution", "technology")
+_LOYALTY_LEVELS: Final = ("High", "Moderate", "Strong")
+_LIMITATIONS: Final = ("product range", "geographic presence")
+_PRICING_LEVELS: Final = ("High", "Premium", "Above-market")
+_ADVANTAGE_SOURCES: Final = (
+    "Superior technology",
+    "Cost leadership",
+    "Customer service excellence",
+    "First-mover advantage",
+    "Strong intellectual property"
+)
+_SUSTAINABILITY: Final = ("High", "Medium", "Low")
+_GENERIC_STRATEGIES: Final = ("differentiation", "cost leadership", "niche market")
+_COUNTER_MOVES: Final = ("partnerships", "acquisitions", "new market entry")
+
+_LEADER_ROLES: Final = ("provider", "brand", "innovator")
+_MISSION_VERBS: Final = ("deliver", "create", "provide")
+_MISSION_MEANS: Final = ("innovation", "excellence", "sustainability")
+_CORE_VALUES: Final = ("Customer Centricity", "Innovation", "Integrity", "Sustainability", "Collaboration", "Excellence")
+_INITIATIVE_VERBS: Final = ("Expand", "Develop", "Enhance")
+_INITIATIVE_AREAS: Final = ("product line", "market presence", "digital capabilities")
+_INITIATIVE_OWNERS: Final = ("Product", "Marketing", "Technology")
+_GROWTH_AREAS: Final = ("revenue", "user base", "market penetration")
+
+_ADOPTED_TECH: Final = ("AI", "blockchain", "IoT", "cloud computing")
+_FOCUS_SOURCES: Final = ("regulatory", "consumer")
+_FOCUS_TOPICS: Final = ("sustainability", "data privacy", "security")
+_MODEL_SHIFTS: Final = ("subscription", "as-a-service", "platform")
+_RISING_PRIORITIES: Final = ("customer experience", "supply chain resilience", "talent acquisition")
+_EXPANSION_TARGETS: Final = ("emerging markets", "adjacent sectors", "new customer segments")
+_LEVERAGED_TECH: Final = ("AI", "blockchain", "big data")
+_TECH_BENEFITS: Final = ("efficiency", "personalization", "automation")
+_MODEL_NOVELTY: Final = ("New", "Disruptive")
+_MODEL_AREAS: Final = ("supply chain", "customer engagement", "revenue streams")
+_COMPETITION_TRENDS: Final = ("Increasing", "Intensifying")
+_COMPETITION_SOURCES: Final = ("startups", "tech giants", "non-traditional players")
+_UNCERTAINTY_TYPES: Final = ("Regulatory", "Geopolitical", "Economic")
+_UNCERTAINTY_IMPACTS: Final = ("supply chains", "market access", "cost structures")
+_CHANGE_PACES: Final = ("Rapid", "Disruptive")
+_INVESTMENT_LEVELS: Final = ("continuous", "significant")
+
+# Templates for strategy output
+_INITIATIVE_TMPL: Final = "{} {}"
+_TIMELINE_TMPL: Final = "Q{} {}"
+_OWNER_TMPL: Final = "{} Team"
+_SUCCESS_METRIC_TMPLS: Final = (
+    "{}% increase in market share",
+    "{}% improvement in customer satisfaction",
+    "{}% growth in {}"
+)
+
+_REVENUE_STREAMS: Final = (
+    "Product sales",
+    "Subscription fees",
+    "Licensing",
+    "Advertising",
+    "Data monetization",
+    "Transaction fees"
+)
+_BUSINESS_SIZES: Final = ("Small", "Medium", "Large")
+_BUSINESS_KINDS: Final = ("businesses", "enterprises")
+_CONSUMER_KINDS: Final = ("Tech-savvy", "Budget-conscious", "Premium")
+_OFFERING_KINDS: Final = ("Affordable", "Premium", "Innovative")
+_PROPOSITION_STRENGTHS: Final = ("Strong", "Differentiated")
+_REVENUE_STRENGTHS: Final = ("Recurring", "Diversified")
+_CUSTOMER_STRENGTHS: Final = ("Loyal", "Growing")
+_COST_WEAKNESSES: Final = ("High", "Increasing")
+_REVENUE_WEAKNESSES: Final = ("Limited", "Concentrated")
+_COMPETITION_WEAKNESSES: Final = ("Intense", "Growing")
+_PRICING_MODELS: Final = ("a freemium model", "usage-based pricing", "a marketplace component")
+_GROWTH_PATHS: Final = ("new customer segments", "geographic expansion", "strategic partnerships")
+_IMPROVEMENT_AREAS: Final = ("customer retention", "operational efficiency", "monetization strategies")
+
+_OUTLOOKS: Final = ("promising", "challenging", "transformative")
+_CONDITIONS: Final = ("favorable", "neutral", "challenging")
+_DYNAMICS_TYPES: Final = ("Market", "Regulatory", "Competitive")
+_DYNAMICS_STATES: Final = ("evolving", "stable", "uncertain")
+_CUSTOMER_NEEDS: Final = ("personalization", "sustainability", "convenience")
+_EMERGING_TECH: Final = ("AI", "blockchain", "cloud computing")
+_PLAN_VERBS: Final = ("Develop", "Refine")
+_PLAN_KINDS: Final = ("go-to-market", "digital transformation")
+_BUILD_VERBS: Final = ("Strengthen", "Build")
+_BUILD_TARGETS: Final = ("partnerships", "capabilities")
+_BUILD_AREAS: Final = ("emerging markets", "new technologies")
+_DIFFERENTIATORS: Final = ("customer experience", "operational excellence", "innovation")
+
+def _route(task: str) -> int:
+    """Find the index of the handler for a task in a single pass; the highest-priority match wins."""
+    route = len(_ROUTE_PRIORITY)
+    for match in _TASK_ROUTER.finditer(task):
+        route = min(route, _ROUTE_PRIORITY[match.lastgroup])
+        if route == 0:
+            break
+    return route
+
+def _draw(*tables: Sequence[Any]) -> List[Any]:
+    """Pick one entry from each table with a single batched RNG call."""
+    sizes = np.fromiter((len(table) for table in tables), dtype=np.int64, count=len(tables))
+    picks = (_RNG.random(len(tables)) * sizes).astype(np.int64)
+    return [table[i] for table, i in zip(tables, picks.tolist())]
+
+def _randints(*bounds: Tuple[int, int]) -> List[int]:
+    """Draw one integer per inclusive (low, high) pair with a single RNG call."""
+    lows, highs = zip(*bounds)
+    return _RNG.integers(lows, np.add(highs, 1)).tolist()
+
+def _sample(table: Sequence[Any], k: int) -> List[Any]:
+    """Pick k distinct entries from a table."""
+    return [table[i] for i in _RNG.choice(len(table), size=k, replace=False).tolist()]
 
 class Axel(BaseAgent):
     """Axel - The Business Strategist Agent"""
     
-    def __init__(self, llm_config: Optional[Dict] = None):
+    def __init__(self, llm_config: Optional[Dict] = None, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(
             name="Axel",
             role="Business Strategist",
             llm_config=llm_config or {}
         )
-        self.web_search = WebSearchTool()
-        self.strategic_frameworks = [
-            "Porter's Five Forces",
-            "SWOT Analysis",
-            "PESTEL Analysis",
-            "Business Model Canvas",
-            "Blue Ocean Strategy",
-            "Value Chain Analysis"
-        ]
+        self.web_search = WebSearchTool(client=http_client)
+        self.strategic_frameworks = _FRAMEWORKS
         
     async def process(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
         """Process a business strategy task."""
-        logger.info(f"Axel received task: {task}")
-        context = context or {}
+        logger.info("Axel received task: %s", task)
+        return await self._handle(_route(task), task, context or {})
+    
+    async def process_batch(self, tasks: List[str], contexts: Optional[List[Optional[Dict]]] = None) -> List[AgentResponse]:
+        """Process several strategy tasks, routing them all first and dispatching each category together.
         
-        try:
-            task_lower = task.lower()
-            
-            if any(keyword in task_lower for keyword in ["competit", "rival", "benchmark"]):
-                return await self.competitive_analysis(task, context)
-            elif any(keyword in task_lower for keyword in ["strategy", "strategic", "plan"]):
-                return await self.develop_strategy(task, context)
-            elif any(keyword in task_lower for keyword in ["market", "industry", "sector"]):
-                return await self.analyze_industry(task, context)
-            elif any(keyword in task_lower for keyword in ["business model", "revenue"]):
-                return await self.evaluate_business_model(task, context)
+        As in BaseAgent.process_batch, a task that raised has its exception in its place.
+        """
+        logger.info("Axel received %d tasks", len(tasks))
+        contexts = contexts or [None] * len(tasks)
+        responses: List[Optional[AgentResponse]] = [None] * len(tasks)
+        
+        # Serve cached tasks, then group the distinct remaining ones by handler
+        groups: Dict[int, List[Tuple[int, str]]] = {}
+        duplicates: Dict[str, List[int]] = {}
+        for i, (task, context) in enumerate(zip(tasks, contexts)):
+            key = self._cache_key(task, context)
+            responses[i] = self._cached_response(key)
+            if responses[i] is not None:
+                continue
+            if key in duplicates:
+                duplicates[key].append(i)
             else:
-                return await self.general_strategic_advice(task, context)
-                
+                duplicates[key] = [i]
+                groups.setdefault(_route(task), []).append((i, key))
+        
+        async def run_group(route: int, members: List[Tuple[int, str]]) -> None:
+            results = await asyncio.gather(
+                *(self._handle(route, tasks[i], contexts[i] or {}) for i, _ in members),
+                return_exceptions=True
+            )
+            for (_, key), response in zip(members, results):
+                first, *rest = duplicates[key]
+                if isinstance(response, BaseException):
+                    # Only the callers of the failed task see its error
+                    for i in duplicates[key]:
+                        responses[i] = response
+                    continue
+                self._cache_response(key, response)
+                responses[first] = response
+                for i in rest:
+                    responses[i] = copy.deepcopy(response)
+        
+        await asyncio.gather(*(run_group(route, members) for route, members in groups.items()))
+        return responses
+    
+    async def _handle(self, route: int, task: str, context: Dict) -> AgentResponse:
+        """Run the handler for a routed task, turning errors into a failed response."""
+        try:
+            return await self._HANDLERS[route](self, task, context)
         except Exception as e:
-            logger.error(f"Error in Axel's process: {str(e)}", exc_info=True)
+            logger.error("Error in Axel's process: %s", e, exc_info=True)
             return AgentResponse(
                 success=False,
                 content=f"Error processing strategy task: {str(e)}"
@@ -54,45 +221,44 @@ class Axel(BaseAgent):
     
     async def competitive_analysis(self, task: str, context: Dict) -> AgentResponse:
         """Perform competitive analysis."""
-        logger.info(f"Performing competitive analysis: {task}")
+        logger.info("Performing competitive analysis: %s", task)
         
         # In a real implementation, this would analyze actual competitor data
-        competitors = ["Competitor A", "Competitor B", "Competitor C"]
+        competitors = _COMPETITORS
+        shares = _randints(*[(5, 40)] * len(_MARKET_PLAYERS))
+        picks = _draw(
+            *(_STRENGTH_AREAS, _LOYALTY_LEVELS, _LIMITATIONS, _PRICING_LEVELS) * len(competitors),
+            _SUSTAINABILITY, _GENERIC_STRATEGIES, _COUNTER_MOVES, competitors
+        )
+        sustainability, generic_strategy, counter_move, rival = picks[-4:]
         
         analysis = {
             "focus_area": task,
             "competitive_landscape": {
                 "market_share": {
-                    comp: f"{random.randint(5, 40)}%" for comp in ["Our Company"] + competitors
+                    comp: f"{share}%" for comp, share in zip(_MARKET_PLAYERS, shares)
                 },
                 "key_competitors": [
                     {
                         "name": comp,
                         "strengths": [
-                            f"Strong {random.choice(['brand', 'distribution', 'technology'])} presence",
-                            f"{random.choice(['High', 'Moderate', 'Strong'])} customer loyalty"
+                            f"Strong {picks[4 * i]} presence",
+                            f"{picks[4 * i + 1]} customer loyalty"
                         ],
                         "weaknesses": [
-                            f"Limited {random.choice(['product range', 'geographic presence'])}",
-                            f"{random.choice(['High', 'Premium', 'Above-market'])} pricing"
+                            f"Limited {picks[4 * i + 2]}",
+                            f"{picks[4 * i + 3]} pricing"
                         ]
-                    } for comp in competitors
+                    } for i, comp in enumerate(competitors)
                 ]
             },
             "competitive_advantage": {
-                "sources": random.sample([
-                    "Superior technology",
-                    "Cost leadership",
-                    "Customer service excellence",
-                    "First-mover advantage",
-                    "Strong intellectual property"
-                ], 2),
-                "sustainability": random.choice(["High", "Medium", "Low"])
+                "sources": _sample(_ADVANTAGE_SOURCES, 2),
+                "sustainability": sustainability
             },
             "recommendations": [
-                f"Focus on {random.choice(['differentiation', 'cost leadership', 'niche market'])} strategy",
-                f"Consider {random.choice(['partnerships', 'acquisitions', 'new market entry'])} "
-                f"to counter {random.choice(competitors)}",
+                f"Focus on {generic_strategy} strategy",
+                f"Consider {counter_move} to counter {rival}",
                 "Enhance customer value proposition through innovation"
             ]
         }
@@ -104,40 +270,39 @@ class Axel(BaseAgent):
     
     async def develop_strategy(self, task: str, context: Dict) -> AgentResponse:
         """Develop business strategy."""
-        logger.info(f"Developing strategy: {task}")
+        logger.info("Developing strategy: %s", task)
         
-        # Select a strategic framework
-        framework = random.choice(self.strategic_frameworks)
+        # Select a strategic framework along with the rest of the options
+        framework, leader_role, verb, means, growth_area, *initiative_picks = _draw(
+            self.strategic_frameworks, _LEADER_ROLES, _MISSION_VERBS, _MISSION_MEANS, _GROWTH_AREAS,
+            *(_INITIATIVE_VERBS, _INITIATIVE_AREAS, _INITIATIVE_OWNERS) * 3
+        )
+        share_gain, satisfaction_gain, growth, *timing = _randints(
+            (10, 30), (15, 40), (20, 50), *[(1, 4), (1, 3)] * 3
+        )
+        year = datetime.now().year
+        share_tmpl, satisfaction_tmpl, growth_tmpl = _SUCCESS_METRIC_TMPLS
         
         strategy = {
             "objective": task,
             "strategic_framework": framework,
             "key_elements": {
-                "vision": f"Become the leading {random.choice(['provider', 'brand', 'innovator'])} "
+                "vision": f"Become the leading {leader_role} "
                          f"in the {task.split('in ')[-1] if 'in ' in task else 'target market'} by 2030",
-                "mission": f"To {random.choice(['deliver', 'create', 'provide'])} {task} through "
-                          f"{random.choice(['innovation', 'excellence', 'sustainability'])}",
-                "core_values": random.sample([
-                    "Customer Centricity",
-                    "Innovation",
-                    "Integrity",
-                    "Sustainability",
-                    "Collaboration",
-                    "Excellence"
-                ], 3)
+                "mission": f"To {verb} {task} through {means}",
+                "core_values": _sample(_CORE_VALUES, 3)
             },
             "strategic_initiatives": [
                 {
-                    "initiative": f"{random.choice(['Expand', 'Develop', 'Enhance'])} "
-                                 f"{random.choice(['product line', 'market presence', 'digital capabilities'])}",
-                    "timeline": f"Q{random.randint(1,4)} {datetime.now().year + random.randint(1,3)}",
-                    "owner": random.choice(["Product", "Marketing", "Technology"]) + " Team"
-                } for _ in range(3)
+                    "initiative": _INITIATIVE_TMPL.format(initiative_picks[3 * i], initiative_picks[3 * i + 1]),
+                    "timeline": _TIMELINE_TMPL.format(timing[2 * i], year + timing[2 * i + 1]),
+                    "owner": _OWNER_TMPL.format(initiative_picks[3 * i + 2])
+                } for i in range(3)
             ],
             "success_metrics": [
-                f"{random.randint(10, 30)}% increase in market share",
-                f"{random.randint(15, 40)}% improvement in customer satisfaction",
-                f"{random.randint(20, 50)}% growth in {random.choice(['revenue', 'user base', 'market penetration'])}"
+                share_tmpl.format(share_gain),
+                satisfaction_tmpl.format(satisfaction_gain),
+                growth_tmpl.format(growth, growth_area)
             ]
         }
         
@@ -148,32 +313,40 @@ class Axel(BaseAgent):
     
     async def analyze_industry(self, task: str, context: Dict) -> AgentResponse:
         """Analyze industry trends and dynamics."""
-        logger.info(f"Analyzing industry: {task}")
+        logger.info("Analyzing industry: %s", task)
+        
+        picks = _draw(
+            _ADOPTED_TECH, _FOCUS_SOURCES, _FOCUS_TOPICS, _MODEL_SHIFTS, _RISING_PRIORITIES,
+            _EXPANSION_TARGETS, _LEVERAGED_TECH, _TECH_BENEFITS, _MODEL_NOVELTY, _MODEL_AREAS,
+            _COMPETITION_TRENDS, _COMPETITION_SOURCES, _UNCERTAINTY_TYPES, _UNCERTAINTY_IMPACTS,
+            _CHANGE_PACES, _INVESTMENT_LEVELS
+        )
+        market_size, growth_rate = _randints((10, 500), (3, 15))
         
         trends = [
-            f"Growing adoption of {random.choice(['AI', 'blockchain', 'IoT', 'cloud computing'])}",
-            f"Increasing {random.choice(['regulatory', 'consumer'])} focus on {random.choice(['sustainability', 'data privacy', 'security'])}",
-            f"Shift towards {random.choice(['subscription', 'as-a-service', 'platform'])} business models",
-            f"Rising importance of {random.choice(['customer experience', 'supply chain resilience', 'talent acquisition'])}"
+            f"Growing adoption of {picks[0]}",
+            f"Increasing {picks[1]} focus on {picks[2]}",
+            f"Shift towards {picks[3]} business models",
+            f"Rising importance of {picks[4]}"
         ]
         
         analysis = {
             "industry": task,
             "current_state": {
-                "market_size": f"${random.randint(10, 500)}B",
-                "growth_rate": f"{random.randint(3, 15)}% CAGR",
-                "key_players": [f"Company {chr(65+i)}" for i in range(5)]
+                "market_size": f"${market_size}B",
+                "growth_rate": f"{growth_rate}% CAGR",
+                "key_players": list(_KEY_PLAYERS)
             },
-            "key_trends": random.sample(trends, 3),
+            "key_trends": _sample(trends, 3),
             "opportunities": [
-                f"Expansion into {random.choice(['emerging markets', 'adjacent sectors', 'new customer segments'])}",
-                f"Leveraging {random.choice(['AI', 'blockchain', 'big data'])} for {random.choice(['efficiency', 'personalization', 'automation'])}",
-                f"{random.choice(['New', 'Disruptive'])} business models in {random.choice(['supply chain', 'customer engagement', 'revenue streams'])}"
+                f"Expansion into {picks[5]}",
+                f"Leveraging {picks[6]} for {picks[7]}",
+                f"{picks[8]} business models in {picks[9]}"
             ],
             "threats": [
-                f"{random.choice(['Increasing', 'Intensifying'])} competition from {random.choice(['startups', 'tech giants', 'non-traditional players'])}",
-                f"{random.choice(['Regulatory', 'Geopolitical', 'Economic'])} uncertainties impacting {random.choice(['supply chains', 'market access', 'cost structures'])}",
-                f"{random.choice(['Rapid', 'Disruptive'])} technological changes requiring {random.choice(['continuous', 'significant'])} investment"
+                f"{picks[10]} competition from {picks[11]}",
+                f"{picks[12]} uncertainties impacting {picks[13]}",
+                f"{picks[14]} technological changes requiring {picks[15]} investment"
             ]
         }
         
@@ -184,39 +357,39 @@ class Axel(BaseAgent):
     
     async def evaluate_business_model(self, task: str, context: Dict) -> AgentResponse:
         """Evaluate and suggest improvements for business models."""
-        logger.info(f"Evaluating business model: {task}")
+        logger.info("Evaluating business model: %s", task)
+        
+        picks = _draw(
+            _BUSINESS_SIZES, _BUSINESS_KINDS, _CONSUMER_KINDS, _OFFERING_KINDS,
+            _PROPOSITION_STRENGTHS, _REVENUE_STRENGTHS, _CUSTOMER_STRENGTHS,
+            _COST_WEAKNESSES, _REVENUE_WEAKNESSES, _COMPETITION_WEAKNESSES,
+            _PRICING_MODELS, _GROWTH_PATHS, _IMPROVEMENT_AREAS
+        )
         
         evaluation = {
             "business_model": task,
             "current_state": {
-                "revenue_streams": random.sample([
-                    "Product sales",
-                    "Subscription fees",
-                    "Licensing",
-                    "Advertising",
-                    "Data monetization",
-                    "Transaction fees"
-                ], random.randint(1, 3)),
+                "revenue_streams": _sample(_REVENUE_STREAMS, _randints((1, 3))[0]),
                 "customer_segments": [
-                    f"{random.choice(['Small', 'Medium', 'Large'])} {random.choice(['businesses', 'enterprises'])}",
-                    f"{random.choice(['Tech-savvy', 'Budget-conscious', 'Premium'])} consumers"
+                    f"{picks[0]} {picks[1]}",
+                    f"{picks[2]} consumers"
                 ],
-                "value_proposition": f"{random.choice(['Affordable', 'Premium', 'Innovative'])} {task.split('for ')[0] if 'for ' in task else 'solution'}"
+                "value_proposition": f"{picks[3]} {task.split('for ')[0] if 'for ' in task else 'solution'}"
             },
             "strengths": [
-                f"{random.choice(['Strong', 'Differentiated'])} value proposition",
-                f"{random.choice(['Recurring', 'Diversified'])} revenue streams",
-                f"{random.choice(['Loyal', 'Growing'])} customer base"
+                f"{picks[4]} value proposition",
+                f"{picks[5]} revenue streams",
+                f"{picks[6]} customer base"
             ],
             "weaknesses": [
-                f"{random.choice(['High', 'Increasing'])} customer acquisition costs",
-                f"{random.choice(['Limited', 'Concentrated'])} revenue sources",
-                f"{random.choice(['Intense', 'Growing'])} competition"
+                f"{picks[7]} customer acquisition costs",
+                f"{picks[8]} revenue sources",
+                f"{picks[9]} competition"
             ],
             "recommendations": [
-                f"Consider adding {random.choice(['a freemium model', 'usage-based pricing', 'a marketplace component'])}",
-                f"Explore {random.choice(['new customer segments', 'geographic expansion', 'strategic partnerships'])}",
-                f"Enhance {random.choice(['customer retention', 'operational efficiency', 'monetization strategies'])}"
+                f"Consider adding {picks[10]}",
+                f"Explore {picks[11]}",
+                f"Enhance {picks[12]}"
             ]
         }
         
@@ -227,28 +400,39 @@ class Axel(BaseAgent):
     
     async def general_strategic_advice(self, task: str, context: Dict) -> AgentResponse:
         """Provide general strategic advice."""
-        logger.info(f"Providing strategic advice: {task}")
+        logger.info("Providing strategic advice: %s", task)
+        
+        picks = _draw(
+            _OUTLOOKS, _CONDITIONS, _DYNAMICS_TYPES, _DYNAMICS_STATES, _CUSTOMER_NEEDS, _EMERGING_TECH,
+            _PLAN_VERBS, _PLAN_KINDS, _BUILD_VERBS, _BUILD_TARGETS, _BUILD_AREAS, _DIFFERENTIATORS
+        )
         
         return AgentResponse(
             success=True,
             content={
-                "analysis": f"Strategic analysis of '{task}' suggests a {random.choice(['promising', 'challenging', 'transformative'])} "
-                          f"opportunity. The current market conditions appear {random.choice(['favorable', 'neutral', 'challenging'])} "
+                "analysis": f"Strategic analysis of '{task}' suggests a {picks[0]} "
+                          f"opportunity. The current market conditions appear {picks[1]} "
                           f"for this initiative.",
                 "key_considerations": [
-                    f"{random.choice(['Market', 'Regulatory', 'Competitive'])} dynamics are {random.choice(['evolving', 'stable', 'uncertain'])}",
-                    f"Customer needs are shifting towards {random.choice(['personalization', 'sustainability', 'convenience'])}",
-                    f"Technological advancements in {random.choice(['AI', 'blockchain', 'cloud computing'])} present new possibilities"
+                    f"{picks[2]} dynamics are {picks[3]}",
+                    f"Customer needs are shifting towards {picks[4]}",
+                    f"Technological advancements in {picks[5]} present new possibilities"
                 ],
                 "recommendations": [
-                    f"{random.choice(['Develop', 'Refine'])} a comprehensive {random.choice(['go-to-market', 'digital transformation'])} strategy",
-                    f"{random.choice(['Strengthen', 'Build'])} {random.choice(['partnerships', 'capabilities'])} in {random.choice(['emerging markets', 'new technologies'])}",
-                    f"Focus on {random.choice(['customer experience', 'operational excellence', 'innovation'])} as a key differentiator"
+                    f"{picks[6]} a comprehensive {picks[7]} strategy",
+                    f"{picks[8]} {picks[9]} in {picks[10]}",
+                    f"Focus on {picks[11]} as a key differentiator"
                 ],
-                "timeframe": {
-                    "short_term": "3-6 months",
-                    "medium_term": "6-18 months",
-                    "long_term": "18+ months"
-                }
+                "timeframe": dict(_TIMEFRAME)
             }
         )
+    
+    # Handlers in route priority order, shared by all instances; the last one handles
+    # tasks no route matches
+    _HANDLERS = (
+        competitive_analysis,
+        develop_strategy,
+        analyze_industry,
+        evaluate_business_model,
+        general_strategic_advice
+    )
@@ -1,16 +1,116 @@
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from collections import OrderedDict, defaultdict, deque
+from typing import Dict, Any, AsyncIterator, List, Optional, Set, Tuple
+import msgspec
 
-class AgentResponse(BaseModel):
+class AgentResponse(msgspec.Struct):
     """Standard response format for agent operations."""
     success: bool
     content: Any
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    
+    def dict(self) -> Dict[str, Any]:
+        """Return the response as a dictionary."""
+        return msgspec.structs.asdict(self)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+@functools.lru_cache(maxsize=1024)
+def normalize_task(task: str) -> str:
+    """Lowercase and strip a task, once per distinct task.
+    
+    The result is interned and cached, so repeated tasks and every agent that
+    handles the same task reuse one normalized string.
+    """
+    return sys.intern(task.lower().strip())
+
+def cached_process(process):
+    """Wrap an agent's process method with the shared exact-match response cache.
+    
+    Only successful responses are cached, for BaseAgent.cache_ttl seconds; the key covers
+    the agent name, task and context.
+    Each caller gets its own copy of a cached response, so changing it leaves the cache intact.
+    """
+    @functools.wraps(process)
+    async def wrapper(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
+        key = self._cache_key(task, context)
+        response = self._cached_response(key)
+        if response is None:
+            response = await process(self, task, context)
+            self._cache_response(key, response)
+        return response
+    
+    wrapper.__wrapped_by_cache__ = True
+    return wrapper
 
 class BaseAgent(ABC):
     """Base class for all Helium AI agents."""
     
+    # Exact-match LRU cache of responses with their expiry times, shared by all agents
+    _response_cache: "OrderedDict[str, Tuple[float, AgentResponse]]" = OrderedDict()
+    cache_size = 256
+    cache_ttl = 300.0  # Seconds a cached response is served before it is recomputed
+    # Whether process() is routed through the response cache; agents whose process()
+    # has side effects on every call, or that keep their own expiring cache, turn this off
+    cache_responses = True
+    
+    # Number of memories kept per agent; the oldest are dropped first
+    memory_size = 1024
+    
+    def __init_subclass__(cls, **kwargs):
+        """Route each concrete process() implementation through the response cache."""
+        super().__init_subclass__(**kwargs)
+        process = cls.__dict__.get('process')
+        if process is not None and cls.cache_responses and not getattr(process, '__wrapped_by_cache__', False):
+            cls.process = cached_process(process)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove all cached responses."""
+        BaseAgent._response_cache.clear()
+    
+    def _cache_key(self, task: str, context: Optional[Dict]) -> str:
+        """Build the response cache key for a task sent to this agent.
+        
+        A missing context and an empty one give the same key.
+        """
+        context = dict(context) if context else {}
+        return hashlib.sha256(
+            "\0".join((self.name, task, json.dumps(context, sort_keys=True, default=str))).encode('utf-8')
+        ).hexdigest()
+    
+    @staticmethod
+    def _cached_response(key: str) -> Optional[AgentResponse]:
+        """Get a copy of an unexpired cached response, marking it as recently used."""
+        cache = BaseAgent._response_cache
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires <= time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return copy.deepcopy(response)
+    
+    @staticmethod
+    def _cache_response(key: str, response: AgentResponse) -> None:
+        """Cache a successful response, evicting the least recently used one if full."""
+        if not response.success:
+            return
+        cache = BaseAgent._response_cache
+        cache[key] = (time.monotonic() + BaseAgent.cache_ttl, copy.deepcopy(response))
+        if len(cache) > BaseAgent.cache_size:
+            cache.popitem(last=False)
+    
     def __init__(self, name: str, role: str, llm_config: Optional[Dict] = None):
         """Initialize the base agent.
         
@@ -22,7 +122,8 @@ class BaseAgent(ABC):
         self.name = name
         self.role = role
         self.llm_config = llm_config or {}
-        self.memory = []  # Simple in-memory storage, can be replaced with a vector DB
+        self.memory = deque(maxlen=self.memory_size)  # Simple in-memory storage, can be replaced with a vector DB
+        self._reset_memory_index()
     
     @abstractmethod
     async def process(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
@@ -37,6 +138,42 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def process_batch(self, tasks: List[str], contexts: Optional[List[Optional[Dict]]] = None) -> List[AgentResponse]:
+        """Process several tasks together.
+        
+        The default implementation runs process() for each task concurrently. Agents
+        backed by a provider batch API can override this to send the tasks in one call.
+        
+        Args:
+            tasks: The tasks to process
+            contexts: Additional context for each task, aligned with tasks
+            
+        Returns:
+            One AgentResponse per task, in the same order; a task that raised has its
+            exception in its place, so the error reaches only that task's caller
+        """
+        contexts = contexts or [None] * len(tasks)
+        return list(await asyncio.gather(
+            *(self.process(task, context) for task, context in zip(tasks, contexts)),
+            return_exceptions=True
+        ))
+    
+    async def stream(self, task: str, context: Optional[Dict] = None) -> AsyncIterator[AgentResponse]:
+        """Process a task, yielding the result as it becomes available.
+        
+        The default implementation yields the complete result of process() once.
+        Agents backed by a streaming model can override this to yield partial
+        responses as output arrives.
+        
+        Args:
+            task: The task to process
+            context: Additional context for the task
+            
+        Yields:
+            AgentResponse objects whose contents, in order, make up the result
+        """
+        yield await self.process(task, context)
+    
     def add_to_memory(self, content: Any, metadata: Optional[Dict] = None) -> None:
         """Add information to the agent's memory.
         
@@ -44,21 +181,83 @@ class BaseAgent(ABC):
             content: The content to remember
             metadata: Additional metadata about the content
         """
-        self.memory.append({
+        entry = {
             'content': content,
             'metadata': metadata or {}
-        })
+        }
+        self._refresh_memory_index()
+        self.memory.append(entry)
+        self._index_memory(entry)
+    
+    def _reset_memory_index(self) -> None:
+        """Clear the memory index.
+        
+        Memories are indexed by sequence number, so positions stay valid as the
+        oldest entries are evicted from the front of the deque.
+        """
+        # Lowercased text of each memory, aligned with self.memory
+        self._memory_text: "deque[str]" = deque(maxlen=getattr(self.memory, "maxlen", None))
+        self._token_index: Dict[str, Set[int]] = defaultdict(set)
+        self._memory_seq = 0  # Sequence number of the next memory
+        self._last_indexed: Optional[Dict] = None
+    
+    def _refresh_memory_index(self) -> None:
+        """Rebuild the index if memory was changed without add_to_memory()."""
+        if len(self._memory_text) == len(self.memory) and (not self.memory or self.memory[-1] is self._last_indexed):
+            return
+        self._reset_memory_index()
+        for entry in self.memory:
+            self._index_memory(entry)
+    
+    def _index_memory(self, entry: Dict) -> None:
+        """Record a memory's lowercased text and add its words to the token index."""
+        texts = self._memory_text
+        if texts.maxlen is not None and len(texts) == texts.maxlen:
+            # The oldest memory is about to be evicted; drop its postings
+            evicted = self._memory_seq - len(texts)
+            for token in set(_TOKEN_PATTERN.findall(texts[0])):
+                postings = self._token_index[token]
+                postings.discard(evicted)
+                if not postings:
+                    del self._token_index[token]
+        
+        text = str(entry).lower()
+        texts.append(text)
+        for token in _TOKEN_PATTERN.findall(text):
+            self._token_index[token].add(self._memory_seq)
+        self._memory_seq += 1
+        self._last_indexed = entry
     
     def get_memory(self, query: Optional[str] = None) -> List[Dict]:
         """Retrieve relevant memories.
         
+        Matching is by substring, as before. Words that sit inside the query, with
+        text on both sides, must appear whole in any match, so the token index
+        narrows the scan to memories containing them; the first and last words
+        may be partial ("market" matches "markets") and are not used to filter.
+        Queries without such inner words scan all of the precomputed memory text.
+        
         Args:
             query: Optional query to filter memories
             
         Returns:
             List of relevant memories
         """
-        # Simple implementation - can be enhanced with vector similarity search
         if query is None:
-            return self.memory
-        return [m for m in self.memory if query.lower() in str(m).lower()]
+            return list(self.memory)
+        self._refresh_memory_index()
+        
+        query = query.lower()
+        end = len(query)
+        postings = [
+            self._token_index.get(m.group(), set())
+            for m in _TOKEN_PATTERN.finditer(query)
+            if m.start() > 0 and m.end() < end
+        ]
+        if postings:
+            postings.sort(key=len)
+            first_seq = self._memory_seq - len(self.memory)
+            candidates = [seq - first_seq for seq in sorted(set.intersection(*postings))]
+        else:
+            candidates = range(len(self.memory))
+        return [self.memory[i] for i in candidates if query in self._memory_text[i]]
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from ..core.query_cache import SemanticQueryCache
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[str], Awaitable[Sequence[float]]]
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache for exact-match entries."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under key, or None if it is missing or expired."""
+        ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value under key, expiring after ttl seconds if given."""
+        ...
+
+class InMemoryBackend:
+    """In-process cache backend with per-entry expiry, evicting the least recently used entry when full."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+class RedisBackend:
+    """Cache backend storing JSON-encoded values in Redis (requires the redis package)."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "helium:llm:"):
+        import redis.asyncio as redis  # Optional dependency
+
+        self._client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._client.set(self.prefix + key, json.dumps(value), ex=int(ttl) if ttl else None)
+
+class LLMCache:
+    """Response cache for agent calls with exact and semantic (embedding) matching.
+
+    Values live in the backend under their message's exact key. Semantic matching uses
+    a SemanticQueryCache, the same index as the RAG and web app caches, mapping message
+    embeddings to those keys.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        embed_fn: Optional[EmbedFn] = None,
+        threshold: float = 0.92,
+        ttl: Optional[float] = 3600.0,
+        max_vectors: int = 1024
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: Storage for cached values; defaults to an in-memory backend
+            embed_fn: Optional coroutine function returning an embedding for a message.
+                Without it only exact matches are served.
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Seconds before a cached value expires, or None to keep it
+            max_vectors: Number of most recently used message embeddings kept for matching
+        """
+        self.backend = backend or InMemoryBackend()
+        self.embed_fn = embed_fn
+        self.ttl = ttl
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+        # Message embedding -> backend key of its value
+        self._index = SemanticQueryCache(max_entries=max_vectors, threshold=threshold)
+        self._last_embedding: Optional[Tuple[str, np.ndarray]] = None
+
+    @property
+    def threshold(self) -> float:
+        """Minimum cosine similarity for a semantic hit."""
+        return self._index.threshold
+
+    @staticmethod
+    def make_key(message: str) -> str:
+        """Build the exact-match key for a message."""
+        return hashlib.sha256(json.dumps({"message": message}, sort_keys=True).encode('utf-8')).hexdigest()
+
+    async def get(self, message: str) -> Optional[Any]:
+        """Look up a cached value for a message.
+
+        Args:
+            message: The message sent to the agent
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        value = await self.backend.get(self.make_key(message))
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+
+        if len(self._index):
+            embedding = await self._embed(message)
+            if embedding is not None:
+                key = self._index.match(embedding)
+                if key is not None:
+                    value = await self.backend.get(key)
+                    if value is not None:
+                        self.stats["semantic_hits"] += 1
+                        return value
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, message: str, value: Any) -> None:
+        """Cache a value for a message.
+
+        Args:
+            message: The message sent to the agent
+            value: The value to return for this and similar messages
+        """
+        key = self.make_key(message)
+        await self.backend.set(key, value, self.ttl)
+
+        if self.embed_fn is None:
+            return
+        embedding = await self._embed(message)
+        if embedding is not None:
+            # Re-caching a message reuses its index slot rather than adding a row
+            self._index.put(message, embedding, key)
+
+    async def _embed(self, message: str) -> Optional[np.ndarray]:
+        """Embed a message, reusing the last result for repeated calls."""
+        if self._last_embedding is not None and self._last_embedding[0] == message:
+            return self._last_embedding[1]
+        try:
+            vector = np.asarray(await self.embed_fn(message), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache lookup: {str(e)}")
+            return None
+        self._last_embedding = (message, vector)
+        return vector
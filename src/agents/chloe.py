@@ -1,22 +1,62 @@
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import random
+import httpx
+import numpy as np
+from ._fin_kernels import project_market
 from .base_agent import BaseAgent, AgentResponse
+from .routing import KeywordRouter
 from ..tools.web_search import WebSearchTool
 
 logger = logging.getLogger(__name__)
 
+_RNG = np.random.default_rng()
+
+# Bounds of analyze_financials' mock figures, drawn together
+_FIN_AMOUNT_LOW = np.array([1e6, 0.5e6])     # revenue, net income
+_FIN_AMOUNT_HIGH = np.array([100e6, 20e6])
+_FIN_RATIO_LOW = np.array([0.3, 0.1, 1.0, 0.5, 0.05, 0.03])  # gross margin, EBITDA margin, current ratio, D/E, ROI, ROA
+_FIN_RATIO_HIGH = np.array([0.7, 0.3, 3.0, 2.0, 0.25, 0.15])
+_FIN_TREND_LOW = np.array([5, 1, 2])         # revenue growth, margin gain, opex cut (%)
+_FIN_TREND_HIGH = np.array([26, 6, 11])      # exclusive
+
+# create_forecast's fixed five-year horizon: year offsets and 10% compound growth factors
+_FORECAST_YEAR_OFFSETS = np.arange(1, 6)
+_FORECAST_GROWTH = 1.1 ** np.arange(5)
+
+# Cached (expiry on the monotonic clock, ISO date, year) for _today()
+_date_cache = [0.0, "", 0]
+
+def _today() -> Tuple[str, int]:
+    """Return today's date as YYYY-MM-DD and the current year, refreshed at most once a minute."""
+    if time.monotonic() >= _date_cache[0]:
+        now = datetime.now()
+        # Refresh after a minute, or at midnight if that comes first
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        ttl = min(60.0, (midnight - now).total_seconds())
+        _date_cache[:] = [time.monotonic() + ttl, now.strftime("%Y-%m-%d"), now.year]
+    return _date_cache[1], _date_cache[2]
+
+# Handler method -> keywords that route a task to it, in priority order
+_TASK_ROUTER = KeywordRouter((
+    ("perform_valuation", ("valuation", "value", "worth")),
+    ("analyze_market", ("market", "size", "growth")),
+    ("analyze_financials", ("financial", "statement", "income", "balance")),
+    ("create_forecast", ("forecast", "projection")),
+), default="general_financial_analysis")
+
 class Chloe(BaseAgent):
     """Chloe - The Financial Analyst Agent"""
     
-    def __init__(self, llm_config: Optional[Dict] = None):
+    def __init__(self, llm_config: Optional[Dict] = None, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(
             name="Chloe",
             role="Financial Analyst",
             llm_config=llm_config or {}
         )
-        self.web_search = WebSearchTool()
+        self.web_search = WebSearchTool(client=http_client)
         self.financial_models = {}
         
     async def process(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
@@ -25,18 +65,7 @@ class Chloe(BaseAgent):
         context = context or {}
         
         try:
-            task_lower = task.lower()
-            
-            if any(keyword in task_lower for keyword in ["valuation", "value", "worth"]):
-                return await self.perform_valuation(task, context)
-            elif any(keyword in task_lower for keyword in ["market", "size", "growth"]):
-                return await self.analyze_market(task, context)
-            elif any(keyword in task_lower for keyword in ["financial", "statement", "income", "balance"]):
-                return await self.analyze_financials(task, context)
-            elif any(keyword in task_lower for keyword in ["forecast", "projection"]):
-                return await self.create_forecast(task, context)
-            else:
-                return await self.general_financial_analysis(task, context)
+            return await self._HANDLERS[_TASK_ROUTER.route(task)](self, task, context)
                 
         except Exception as e:
             logger.error(f"Error in Chloe's process: {str(e)}", exc_info=True)
@@ -58,7 +87,7 @@ class Chloe(BaseAgent):
                 "enterprise_value": {
                     "value": random.uniform(1e6, 1e9),
                     "currency": "USD",
-                    "as_of": datetime.now().strftime("%Y-%m-%d")
+                    "as_of": _today()[0]
                 },
                 "revenue_multiple": round(random.uniform(2.0, 10.0), 2),
                 "ebitda_multiple": round(random.uniform(5.0, 15.0), 2),
@@ -78,9 +107,9 @@ class Chloe(BaseAgent):
         logger.info(f"Analyzing market: {task}")
         
         # Generate mock market data
-        current_year = datetime.now().year
-        years = [current_year + i for i in range(5)]
-        market_size = [random.uniform(1e9, 10e9) * (1 + i * 0.15) for i in range(5)]
+        current_year = _today()[1]
+        years = range(current_year, current_year + 5)
+        market_size = project_market(_RNG.uniform(1e9, 10e9, 5), 0.15).tolist()
         
         market_analysis = {
             "market_segment": task.split("market")[0].strip() or "General",
@@ -89,7 +118,7 @@ class Chloe(BaseAgent):
                 "currency": "USD",
                 "year": current_year
             },
-            "projected_cagr": round(random.uniform(0.05, 0.25), 2),
+            "projected_cagr": round(_RNG.uniform(0.05, 0.25), 2),
             "key_drivers": [
                 "Increasing digital transformation",
                 "Growing demand for automation",
@@ -111,22 +140,28 @@ class Chloe(BaseAgent):
         logger.info(f"Analyzing financials: {task}")
         
         # Generate mock financial data
+        revenue, net_income = _RNG.uniform(_FIN_AMOUNT_LOW, _FIN_AMOUNT_HIGH).tolist()
+        gross_margin, ebitda_margin, current_ratio, debt_to_equity, roi, roa = np.round(
+            _RNG.uniform(_FIN_RATIO_LOW, _FIN_RATIO_HIGH), 2
+        ).tolist()
+        revenue_growth, margin_gain, opex_cut = _RNG.integers(_FIN_TREND_LOW, _FIN_TREND_HIGH).tolist()
+        
         financials = {
             "period": "FY 2023",
-            "revenue": random.uniform(1e6, 100e6),
-            "gross_profit_margin": round(random.uniform(0.3, 0.7), 2),
-            "ebitda_margin": round(random.uniform(0.1, 0.3), 2),
-            "net_income": random.uniform(0.5e6, 20e6),
+            "revenue": revenue,
+            "gross_profit_margin": gross_margin,
+            "ebitda_margin": ebitda_margin,
+            "net_income": net_income,
             "key_metrics": {
-                "current_ratio": round(random.uniform(1.0, 3.0), 2),
-                "debt_to_equity": round(random.uniform(0.5, 2.0), 2),
-                "roi": round(random.uniform(0.05, 0.25), 2),
-                "roa": round(random.uniform(0.03, 0.15), 2)
+                "current_ratio": current_ratio,
+                "debt_to_equity": debt_to_equity,
+                "roi": roi,
+                "roa": roa
             },
             "trends": [
-                f"{round(random.uniform(5, 25))}% year-over-year revenue growth",
-                f"Improving gross margin by {round(random.uniform(1, 5))}%",
-                f"Reduced operating expenses by {round(random.uniform(2, 10))}%"
+                f"{revenue_growth}% year-over-year revenue growth",
+                f"Improving gross margin by {margin_gain}%",
+                f"Reduced operating expenses by {opex_cut}%"
             ]
         }
         
@@ -140,26 +175,30 @@ class Chloe(BaseAgent):
         logger.info(f"Creating forecast: {task}")
         
         # Generate forecast data
-        current_year = datetime.now().year
-        years = [current_year + i for i in range(1, 6)]
+        current_year = _today()[1]
+        years = (current_year + _FORECAST_YEAR_OFFSETS).tolist()
+        amounts = (_RNG.uniform(1e6, 100e6, 5) * _FORECAST_GROWTH).tolist()
+        growth_rate, ebitda_current, ebitda_target, capex = np.round(
+            _RNG.uniform((0.05, 0.1, 0.15, 0.05), (0.25, 0.3, 0.4, 0.15)), 2
+        ).tolist()
         
         forecast = {
             "forecast_period": f"{years[0]}-{years[-1]}",
             "base_year": current_year,
             "projections": {
                 "revenue": {
-                    "growth_rate": round(random.uniform(0.05, 0.25), 2),
+                    "growth_rate": growth_rate,
                     "values": [
-                        {"year": year, "amount": random.uniform(1e6, 100e6) * (1.1 ** i)}
-                        for i, year in enumerate(years)
+                        {"year": year, "amount": amount}
+                        for year, amount in zip(years, amounts)
                     ]
                 },
                 "ebitda_margin": {
-                    "current": round(random.uniform(0.1, 0.3), 2),
-                    "target": round(random.uniform(0.15, 0.4), 2)
+                    "current": ebitda_current,
+                    "target": ebitda_target
                 },
                 "capex": {
-                    "as_percent_of_revenue": round(random.uniform(0.05, 0.15), 2)
+                    "as_percent_of_revenue": capex
                 }
             },
             "key_assumptions": [
@@ -193,3 +232,12 @@ class Chloe(BaseAgent):
                 "confidence": round(random.uniform(0.7, 0.95), 2)
             }
         )
+    
+    # _TASK_ROUTER route -> handler function, shared by all instances
+    _HANDLERS = {
+        "perform_valuation": perform_valuation,
+        "analyze_market": analyze_market,
+        "analyze_financials": analyze_financials,
+        "create_forecast": create_forecast,
+        "general_financial_analysis": general_financial_analysis,
+    }
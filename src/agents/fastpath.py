@@ -0,0 +1,55 @@
+import re
+from typing import Dict, Optional, Tuple
+
+# Actions: answer from the canned table, refuse, or send the message to the agents
+DIRECT = "direct"
+REJECT = "reject"
+RENDER = "render"
+
+MAX_MESSAGE_LENGTH = 4000
+
+_GREETING = re.compile(r"^\s*(hi|hello|hey|thanks?|thank you|ty|ok|okay)\W*$", re.IGNORECASE)
+_EMPTY_ISH = re.compile(r"^\W*$")
+
+_CANNED_REPLIES: Dict[str, str] = {
+    "hi": "Hello! I'm Helium AI. Ask me about data, financials or business strategy.",
+    "hello": "Hello! I'm Helium AI. Ask me about data, financials or business strategy.",
+    "hey": "Hey! What would you like the team to look into?",
+    "thanks": "You're welcome! Let me know if there's anything else.",
+    "thank": "You're welcome! Let me know if there's anything else.",
+    "thank you": "You're welcome! Let me know if there's anything else.",
+    "ty": "You're welcome! Let me know if there's anything else.",
+    "ok": "Great. What would you like to do next?",
+    "okay": "Great. What would you like to do next?",
+}
+_EMPTY_REPLY = "Please enter a question or task for the team."
+_TOO_LONG_REPLY = f"Messages are limited to {MAX_MESSAGE_LENGTH} characters. Please shorten your request."
+
+# Number of messages classified with each action, for tuning the patterns
+stats: Dict[str, int] = {DIRECT: 0, REJECT: 0, RENDER: 0}
+
+def route(message: str) -> Tuple[str, Optional[str]]:
+    """Decide how to handle a chat message without calling an agent.
+
+    Args:
+        message: The user's message
+
+    Returns:
+        Tuple of (action, reply). The reply is None when the action is RENDER.
+    """
+    if _EMPTY_ISH.match(message):
+        action, reply = REJECT, _EMPTY_REPLY
+    elif len(message) > MAX_MESSAGE_LENGTH:
+        action, reply = REJECT, _TOO_LONG_REPLY
+    else:
+        match = _GREETING.match(message)
+        if match:
+            action, reply = DIRECT, _CANNED_REPLIES[match.group(1).lower()]
+        else:
+            action, reply = RENDER, None
+    stats[action] += 1
+    return action, reply
+
+def classify(message: str) -> Optional[str]:
+    """Return a canned or rejection reply for a message, or None if it needs the agents."""
+    return route(message)[1]
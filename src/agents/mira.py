@@ -1,23 +1,55 @@
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
-import pandas as pd
-import numpy as np
-from .base_agent import BaseAgent, AgentResponse
-from ..tools.web_search import WebSearchTool
+import httpx
+from .base_agent import BaseAgent, AgentResponse, normalize_task
+from .routing import KeywordRouter
+from ..core import kv
+from ..tools.web_search import WebSearchTool, is_search_error
 
 logger = logging.getLogger(__name__)
 
+# Handler method -> keywords that route a task to it, in priority order
+_TASK_ROUTER = KeywordRouter((
+    ("collect_data", ("collect", "gather", "find")),
+    ("analyze_data", ("analyze", "process", "examine")),
+    ("visualize_data", ("visualize", "graph", "chart")),
+), default="general_analysis")
+
+# Placeholder chart returned by visualize_data; shared between responses, so read-only
+_SAMPLE_VISUALIZATION = {
+    "type": "bar_chart",
+    "title": "Sample Data Visualization",
+    "description": "This would be a visualization in a real implementation.",
+    "data": {
+        "labels": ["Q1", "Q2", "Q3", "Q4"],
+        "values": [125, 180, 210, 165],
+        "x_label": "Quarter",
+        "y_label": "Value"
+    }
+}
+
 class Mira(BaseAgent):
     """Mira - The Data Scientist Agent"""
     
-    def __init__(self, llm_config: Optional[Dict] = None):
+    # Live search results expire from Mira's own caches, so process() is not cached again
+    cache_responses = False
+    
+    def __init__(self, llm_config: Optional[Dict] = None, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(
             name="Mira",
             role="Data Scientist",
             llm_config=llm_config or {}
         )
-        self.web_search = WebSearchTool()
-        self.data_cache = {}  # Simple in-memory data cache
+        self.web_search = WebSearchTool(client=http_client)
+        # Search results keyed by normalized task digest, least recently used first
+        self.data_cache: "OrderedDict[bytes, List[Dict]]" = OrderedDict()
+        self._cache_max = 256
+        self._cache_lock: Optional[asyncio.Lock] = None  # Created on first use, on the running loop
+        # Search results shared with other processes and restarts (None without diskcache)
+        self._shared_cache = kv.get_store("mira_cache")
+        self._shared_cache_ttl = 3600
         
     async def process(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
         """Process a data-related task."""
@@ -26,16 +58,7 @@ class Mira(BaseAgent):
         
         try:
             # Simple task routing based on keywords
-            task_lower = task.lower()
-            
-            if any(keyword in task_lower for keyword in ["collect", "gather", "find"]):
-                return await self.collect_data(task, context)
-            elif any(keyword in task_lower for keyword in ["analyze", "process", "examine"]):
-                return await self.analyze_data(task, context)
-            elif any(keyword in task_lower for keyword in ["visualize", "graph", "chart"]):
-                return await self.visualize_data(task, context)
-            else:
-                return await self.general_analysis(task, context)
+            return await self._HANDLERS[_TASK_ROUTER.route(task)](self, task, context)
                 
         except Exception as e:
             logger.error(f"Error in Mira's process: {str(e)}", exc_info=True)
@@ -48,26 +71,40 @@ class Mira(BaseAgent):
         """Collect data from various sources."""
         logger.info(f"Collecting data for: {task}")
         
-        # Check cache first
-        cache_key = hash(task)
-        if cache_key in self.data_cache:
+        # Check the in-process cache, then the shared one; the digest is stable across processes, unlike hash()
+        cache_key = kv.digest(normalize_task(task), person=b"mira-cache")
+        if self._cache_lock is None:
+            self._cache_lock = asyncio.Lock()
+        async with self._cache_lock:
+            cached = self.data_cache.get(cache_key)
+            if cached is not None:
+                self.data_cache.move_to_end(cache_key)
+        if cached is None and self._shared_cache is not None:
+            cached = await kv.aget(self._shared_cache, cache_key)
+            if cached is not None:
+                await self._remember(cache_key, cached)
+        if cached is not None:
             logger.info("Returning cached data")
             return AgentResponse(
                 success=True,
                 content={
                     "message": "Data retrieved from cache",
-                    "data": self.data_cache[cache_key]
+                    "data": cached
                 }
             )
         
         # Perform web search
         search_results = await self.web_search.search(task, num_results=3)
+        failed = is_search_error(search_results)
         
-        # Store in cache
-        self.data_cache[cache_key] = search_results
+        # Store real results in both caches; errors are retried on the next request
+        if not failed:
+            await self._remember(cache_key, search_results)
+            if self._shared_cache is not None:
+                await kv.aset(self._shared_cache, cache_key, search_results, expire=self._shared_cache_ttl)
         
         return AgentResponse(
-            success=True,
+            success=not failed,
             content={
                 "message": "Data collected successfully",
                 "sources": [r["link"] for r in search_results],
@@ -75,6 +112,14 @@ class Mira(BaseAgent):
             }
         )
     
+    async def _remember(self, cache_key: bytes, search_results: List[Dict]) -> None:
+        """Store search results in the in-process cache, evicting the least recently used entry when full."""
+        async with self._cache_lock:
+            self.data_cache[cache_key] = search_results
+            self.data_cache.move_to_end(cache_key)
+            if len(self.data_cache) > self._cache_max:
+                self.data_cache.popitem(last=False)
+    
     async def analyze_data(self, task: str, context: Dict) -> AgentResponse:
         """Analyze data using statistical methods."""
         logger.info(f"Analyzing data: {task}")
@@ -105,21 +150,9 @@ class Mira(BaseAgent):
         logger.info(f"Creating visualization for: {task}")
         
         # In a real implementation, this would generate actual visualizations
-        visualization = {
-            "type": "bar_chart",
-            "title": "Sample Data Visualization",
-            "description": "This would be a visualization in a real implementation.",
-            "data": {
-                "labels": ["Q1", "Q2", "Q3", "Q4"],
-                "values": [125, 180, 210, 165],
-                "x_label": "Quarter",
-                "y_label": "Value"
-            }
-        }
-        
         return AgentResponse(
             success=True,
-            content=visualization
+            content=_SAMPLE_VISUALIZATION
         )
     
     async def general_analysis(self, task: str, context: Dict) -> AgentResponse:
@@ -141,3 +174,11 @@ class Mira(BaseAgent):
                 ]
             }
         )
+    
+    # _TASK_ROUTER route -> handler function, shared by all instances
+    _HANDLERS = {
+        "collect_data": collect_data,
+        "analyze_data": analyze_data,
+        "visualize_data": visualize_data,
+        "general_analysis": general_analysis,
+    }
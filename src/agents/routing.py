@@ -0,0 +1,50 @@
+from typing import Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+class KeywordRouter:
+    """Route text by keyword tables using substring checks on the lowercased text.
+
+    Matching follows ``keyword in text.lower()``: keywords match anywhere in the text,
+    including inside longer words.
+    """
+
+    def __init__(self, table: Sequence[Tuple[Hashable, Sequence[str]]], default: Optional[Hashable] = None):
+        """Build the matcher.
+
+        Args:
+            table: (route, keywords) pairs in priority order
+            default: Route returned by route() when no keyword matches
+        """
+        self.routes: Tuple[Hashable, ...] = tuple(route for route, _ in table)
+        self.default = default
+        self._tables: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(keyword.lower() for keyword in keywords) for _, keywords in table
+        )
+
+        # Each distinct keyword is searched for once, even if several routes share it
+        owners: Dict[str, set] = {}
+        for priority, keywords in enumerate(self._tables):
+            for keyword in keywords:
+                owners.setdefault(keyword, set()).add(priority)
+        self._keyword_routes: Dict[str, FrozenSet[int]] = {
+            keyword: frozenset(priorities) for keyword, priorities in owners.items()
+        }
+
+    def _priorities(self, text: str) -> FrozenSet[int]:
+        """Return the priorities of all routes with a keyword in the text."""
+        lowered = text.lower()
+        return frozenset().union(*(
+            priorities for keyword, priorities in self._keyword_routes.items() if keyword in lowered
+        ))
+
+    def matches(self, text: str) -> List[Hashable]:
+        """Return every route with a keyword in the text, in priority order."""
+        return [self.routes[i] for i in sorted(self._priorities(text))]
+
+    def route(self, text: str) -> Optional[Hashable]:
+        """Return the highest-priority route with a keyword in the text, or the default."""
+        lowered = text.lower()
+        for route, keywords in zip(self.routes, self._tables):
+            for keyword in keywords:
+                if keyword in lowered:
+                    return route
+        return self.default
@@ -1,42 +1,129 @@
-from typing import Dict, Any, Optional, List
-from ..core.config import Config
-from .base_agent import BaseAgent, AgentResponse
+import asyncio
+import os
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple, Union
+from ..core.config import config
+from .base_agent import BaseAgent, AgentResponse, normalize_task
+from .routing import KeywordRouter
 import logging
 
 logger = logging.getLogger(__name__)
 
+class AgentSlot(IntEnum):
+    """Position of each specialist in Zane's team array."""
+    MIRA = 0
+    CHLOE = 1
+    AXEL = 2
+
+_SLOT_NAMES = tuple(slot.name.capitalize() for slot in AgentSlot)
+_NAME_SLOTS = {name: AgentSlot(i) for i, name in enumerate(_SLOT_NAMES)}
+
+# (team slot, delegate?) -> keywords, in priority order. Delegation keywords send the
+# task to the member; suggestion keywords only name them when Zane handles a task directly.
+_TEAM_ROUTER = KeywordRouter((
+    ((AgentSlot.MIRA, True), ("data", "analyze", "collect")),
+    ((AgentSlot.CHLOE, True), ("financial", "market size", "valuation")),
+    ((AgentSlot.AXEL, True), ("strategy", "competitive", "business model")),
+    ((AgentSlot.MIRA, False), ("data", "analyze", "research")),
+    ((AgentSlot.CHLOE, False), ("financial", "market", "valuation", "revenue")),
+    ((AgentSlot.AXEL, False), ("strategy", "business", "plan", "market", "competitive")),
+))
+
+# Default cap on concurrent delegations; llm_config's 'max_concurrency' overrides it
+FANOUT = int(os.getenv("HELIUM_FANOUT", "10"))
+
+_GREETINGS = frozenset(("hi", "hello", "hey", "greetings"))
+
+# Static parts of handle_directly's replies. The content dicts are shared between
+# responses and must be treated as read-only.
+_GREETING_CONTENT: Dict[str, Any] = {
+    "message": "Hello! I'm Zane, your team leader. I can help you with:"
+             "\n• Data analysis and research (ask Mira)"
+             "\n• Financial insights and valuations (ask Chloe)"
+             "\n• Business strategy and planning (ask Axel)"
+             "\n\nHow can I assist you today?",
+    "suggestions": [
+        "Analyze market data",
+        "Financial projections",
+        "Business strategy"
+    ]
+}
+_DELEGATE_PREFIXES = tuple(
+    f"I'll connect you with {name}, our {role}, to help with: "
+    for name, role in zip(_SLOT_NAMES, ("Data Scientist", "Financial Analyst", "Business Strategist"))
+)
+_GENERAL_PREFIX = "I've received your request about: "
+_GENERAL_SUFFIX = ("\n\nI can help connect you with the right expert. "
+                   "Could you tell me more about what you're looking for?")
+_GENERAL_SUGGESTIONS = [
+    "I need data analysis",
+    "I need financial insights",
+    "I need business strategy"
+]
+
+def _classify(task: str) -> Tuple[Optional[AgentSlot], Optional[AgentSlot]]:
+    """Find the team member to delegate a task to, or else the one to suggest, in one pass.
+    
+    Delegation routes come first in the table, so the highest-priority match decides.
+    """
+    route = _TEAM_ROUTER.route(task)
+    if route is None:
+        return None, None
+    slot, delegate = route
+    return (slot, None) if delegate else (None, slot)
+
+TeamMember = Union[AgentSlot, str]
+ProcessFn = Callable[[str, Optional[Dict]], Awaitable[AgentResponse]]
+
+def _member_name(member: TeamMember) -> str:
+    """Return the agent name for a team slot or name."""
+    return _SLOT_NAMES[member] if isinstance(member, int) else member
+
 class Zane(BaseAgent):
     """Zane - The Team Leader Agent"""
     
+    # Every delegation is logged to memory, so Zane's own replies are not cached;
+    # the team members still serve repeated tasks from the response cache
+    cache_responses = False
+    
     def __init__(self, llm_config: Optional[Dict] = None):
         super().__init__(
             name="Zane",
             role="Team Leader",
-            llm_config=llm_config or Config.get_llm_config()
+            llm_config=llm_config or config.get_llm_config()
         )
         self.team_members = {}  # Will store references to other agents
+        # Bound process methods of the team, by AgentSlot and by name
+        self._team: List[Optional[ProcessFn]] = [None] * len(AgentSlot)
+        self._process_fns: Dict[str, ProcessFn] = {}
+        self._semaphore = None  # Limits concurrent delegations; created lazily on the running loop
     
     async def process(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
         """Process a task by delegating to the appropriate team member."""
         logger.info(f"Zane received task: {task}")
         
+        # Greetings never match a specialist, so answer them before routing
+        if normalize_task(task) in _GREETINGS:
+            return self._direct_response(task, None)
+        
         # Simple task routing based on keywords
         # This can be enhanced with more sophisticated routing logic
-        task_lower = task.lower()
+        specialist, suggestion = _classify(task)
         
-        if any(keyword in task_lower for keyword in ["data", "analyze", "collect"]):
-            return await self.delegate_to("Mira", task, context)
-        elif any(keyword in task_lower for keyword in ["financial", "market size", "valuation"]):
-            return await self.delegate_to("Chloe", task, context)
-        elif any(keyword in task_lower for keyword in ["strategy", "competitive", "business model"]):
-            return await self.delegate_to("Axel", task, context)
+        if specialist is not None:
+            return await self.delegate_to(specialist, task, context)
         else:
             # If no clear delegation, handle it directly
-            return await self.handle_directly(task, context)
+            return self._direct_response(task, suggestion)
     
-    async def delegate_to(self, agent_name: str, task: str, context: Optional[Dict] = None) -> AgentResponse:
-        """Delegate a task to a specific team member."""
-        if agent_name not in self.team_members:
+    async def delegate_to(self, member: TeamMember, task: str, context: Optional[Dict] = None) -> AgentResponse:
+        """Delegate a task to a specific team member, given by AgentSlot or by name."""
+        if isinstance(member, int):
+            process = self._team[member]
+        else:
+            process = self._process_fns.get(member)
+        agent_name = _member_name(member)
+        if process is None:
             return AgentResponse(
                 success=False,
                 content=f"Error: {agent_name} is not part of the team yet."
@@ -44,8 +131,7 @@ class Zane(BaseAgent):
         
         logger.info(f"Delegating to {agent_name}: {task}")
         try:
-            agent = self.team_members[agent_name]
-            result = await agent.process(task, context or {})
+            result = await process(task, context or {})
             
             # Log the delegation
             self.add_to_memory({
@@ -64,58 +150,61 @@ class Zane(BaseAgent):
                 content=f"Error processing task with {agent_name}: {str(e)}"
             )
     
+    async def delegate_many(self, members: List[TeamMember], task: str, context: Optional[Dict] = None) -> Dict[str, AgentResponse]:
+        """Delegate a task to several team members concurrently.
+        
+        Concurrency is capped by the llm_config key 'max_concurrency', defaulting to the
+        HELIUM_FANOUT environment variable (10 if unset). The cap is shared by all tasks
+        this Zane handles at once. With
+        'batch_size' set, members are called in batches of that size, waiting
+        'delay_between_batches' seconds between batches.
+        
+        Args:
+            members: Team members to delegate to, as AgentSlot values or names
+            task: The task to delegate
+            context: Additional context for the task
+            
+        Returns:
+            Mapping of agent name to that agent's response, in the order given
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.llm_config.get("max_concurrency", FANOUT))
+        batch_size = self.llm_config.get("batch_size") or len(members)
+        delay = self.llm_config.get("delay_between_batches", 0)
+        
+        async def delegate(member: TeamMember) -> AgentResponse:
+            async with self._semaphore:
+                return await self.delegate_to(member, task, context)
+        
+        results = []
+        for start in range(0, len(members), batch_size):
+            if start and delay:
+                await asyncio.sleep(delay)
+            batch = members[start:start + batch_size]
+            results.extend(await asyncio.gather(*(delegate(member) for member in batch)))
+        return dict(zip(map(_member_name, members), results))
+    
     async def handle_directly(self, task: str, context: Optional[Dict] = None) -> AgentResponse:
         """Handle a task directly when no clear delegation is possible."""
+        return self._direct_response(task, _classify(task)[1])
+    
+    def _direct_response(self, task: str, suggestion: Optional[AgentSlot]) -> AgentResponse:
+        """Answer a task without delegating, pointing to the suggested team member if any."""
         logger.info(f"Handling task directly: {task}")
-        task_lower = task.lower().strip()
+        task_lower = normalize_task(task)
         
         # Simple response mapping for common greetings
-        greetings = ["hi", "hello", "hey", "greetings"]
-        if any(greeting == task_lower for greeting in greetings):
-            return AgentResponse(
-                success=True,
-                content={
-                    "message": "Hello! I'm Zane, your team leader. I can help you with:"
-                             "\n• Data analysis and research (ask Mira)"
-                             "\n• Financial insights and valuations (ask Chloe)"
-                             "\n• Business strategy and planning (ask Axel)"
-                             "\n\nHow can I assist you today?",
-                    "suggestions": [
-                        "Analyze market data",
-                        "Financial projections",
-                        "Business strategy"
-                    ]
-                }
-            )
+        if task_lower in _GREETINGS:
+            return AgentResponse(success=True, content=_GREETING_CONTENT)
         
         # Check for specific types of queries
-        if any(word in task_lower for word in ["data", "analyze", "research"]):
-            return AgentResponse(
-                success=True,
-                content={
-                    "message": f"I'll connect you with Mira, our Data Scientist, to help with: {task}",
-                    "action": "delegate",
-                    "delegate_to": "Mira",
-                    "original_task": task
-                }
-            )
-        elif any(word in task_lower for word in ["financial", "market", "valuation", "revenue"]):
-            return AgentResponse(
-                success=True,
-                content={
-                    "message": f"I'll connect you with Chloe, our Financial Analyst, to help with: {task}",
-                    "action": "delegate",
-                    "delegate_to": "Chloe",
-                    "original_task": task
-                }
-            )
-        elif any(word in task_lower for word in ["strategy", "business", "plan", "market", "competitive"]):
+        if suggestion is not None:
             return AgentResponse(
                 success=True,
                 content={
-                    "message": f"I'll connect you with Axel, our Business Strategist, to help with: {task}",
+                    "message": _DELEGATE_PREFIXES[suggestion] + task,
                     "action": "delegate",
-                    "delegate_to": "Axel",
+                    "delegate_to": _SLOT_NAMES[suggestion],
                     "original_task": task
                 }
             )
@@ -124,26 +213,24 @@ class Zane(BaseAgent):
         return AgentResponse(
             success=True,
             content={
-                "message": f"I've received your request about: {task}"
-                          "\n\nI can help connect you with the right expert. "
-                          "Could you tell me more about what you're looking for?",
-                "suggestions": [
-                    "I need data analysis",
-                    "I need financial insights",
-                    "I need business strategy"
-                ]
+                "message": _GENERAL_PREFIX + task + _GENERAL_SUFFIX,
+                "suggestions": _GENERAL_SUGGESTIONS
             }
         )
     
     def add_team_member(self, agent) -> None:
         """Add a team member that Zane can delegate to."""
         self.team_members[agent.name] = agent
+        self._process_fns[agent.name] = agent.process
+        slot = _NAME_SLOTS.get(agent.name)
+        if slot is not None:
+            self._team[slot] = agent.process
         logger.info(f"Added team member: {agent.name} ({agent.role})")
     
     def get_team_status(self) -> Dict[str, Any]:
         """Get the status of the team."""
         return {
             "team_members": list(self.team_members.keys()),
-            "recent_activities": self.memory[-5:],  # Last 5 activities
+            "recent_activities": list(self.memory)[-5:],  # Last 5 activities
             "status": "operational"
         }
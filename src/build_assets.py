@@ -0,0 +1,266 @@
+"""Generate the static files and template served by web_app.
+
+Run once after installing, before starting the server:
+
+    python src/build_assets.py
+"""
+import os
+
+def build_assets():
+    """Write the web interface's CSS, JavaScript and HTML template, replacing older copies."""
+    # Create static directory if it doesn't exist
+    static_dir = os.path.join(os.path.dirname(__file__), "static")
+    os.makedirs(static_dir, exist_ok=True)
+    
+    # Create CSS file
+    css_path = os.path.join(static_dir, "style.css")
+    with open(css_path, "w") as f:
+        f.write("""
+            body {
+                font-family: Arial, sans-serif;
+                max-width: 800px;
+                margin: 0 auto;
+                padding: 20px;
+                background-color: #f5f5f5;
+            }
+            .chat-container {
+                background: white;
+                border-radius: 10px;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                overflow: hidden;
+            }
+            .chat-header {
+                background: #4a6fa5;
+                color: white;
+                padding: 15px 20px;
+                font-size: 1.2em;
+            }
+            .chat-messages {
+                height: 500px;
+                overflow-y: auto;
+                padding: 20px;
+            }
+            .message {
+                margin-bottom: 15px;
+                padding: 10px 15px;
+                border-radius: 18px;
+                max-width: 70%;
+                word-wrap: break-word;
+            }
+            .user-message {
+                background: #e3f2fd;
+                margin-left: auto;
+                border-bottom-right-radius: 0;
+            }
+            .assistant-message {
+                background: #f1f1f1;
+                margin-right: auto;
+                border-bottom-left-radius: 0;
+            }
+            .message-sender {
+                font-weight: bold;
+                margin-bottom: 5px;
+                font-size: 0.9em;
+            }
+            .message-time {
+                font-size: 0.7em;
+                color: #666;
+                text-align: right;
+                margin-top: 5px;
+            }
+            .input-area {
+                display: flex;
+                padding: 15px;
+                background: #f9f9f9;
+                border-top: 1px solid #eee;
+            }
+            #user-input {
+                flex-grow: 1;
+                padding: 10px 15px;
+                border: 1px solid #ddd;
+                border-radius: 20px;
+                outline: none;
+            }
+            #send-button {
+                background: #4a6fa5;
+                color: white;
+                border: none;
+                border-radius: 20px;
+                padding: 0 20px;
+                margin-left: 10px;
+                cursor: pointer;
+            }
+            #send-button:hover {
+                background: #3a5a80;
+            }
+            .typing-indicator {
+                display: none;
+                padding: 10px 15px;
+                color: #666;
+                font-style: italic;
+            }
+            """)
+    
+    # Create JavaScript file
+    js_path = os.path.join(static_dir, "script.js")
+    with open(js_path, "w") as f:
+        f.write("""
+            document.addEventListener('DOMContentLoaded', function() {
+                const chatMessages = document.getElementById('chat-messages');
+                const userInput = document.getElementById('user-input');
+                const sendButton = document.getElementById('send-button');
+                const typingIndicator = document.getElementById('typing-indicator');
+                
+                // Auto-scroll to bottom of chat
+                function scrollToBottom() {
+                    chatMessages.scrollTop = chatMessages.scrollHeight;
+                }
+                
+                // Add a message to the chat
+                function addMessage(content, isUser = false) {
+                    const messageDiv = document.createElement('div');
+                    messageDiv.className = `message ${isUser ? 'user-message' : 'assistant-message'}`;
+                    
+                    const senderDiv = document.createElement('div');
+                    senderDiv.className = 'message-sender';
+                    senderDiv.textContent = isUser ? 'You' : 'Helium AI';
+                    
+                    const contentDiv = document.createElement('div');
+                    contentDiv.className = 'message-content';
+                    
+                    // Check if content is an object (from the API response)
+                    if (typeof content === 'object') {
+                        contentDiv.textContent = JSON.stringify(content, null, 2);
+                    } else {
+                        contentDiv.textContent = content;
+                    }
+                    
+                    const timeDiv = document.createElement('div');
+                    timeDiv.className = 'message-time';
+                    timeDiv.textContent = new Date().toLocaleTimeString();
+                    
+                    messageDiv.appendChild(senderDiv);
+                    messageDiv.appendChild(contentDiv);
+                    messageDiv.appendChild(timeDiv);
+                    
+                    chatMessages.appendChild(messageDiv);
+                    scrollToBottom();
+                    return contentDiv;
+                }
+                
+                // Send message to the server and show the reply as it streams in
+                function sendMessage() {
+                    const message = userInput.value.trim();
+                    if (!message) return;
+                    
+                    // Add user message to chat
+                    addMessage(message, true);
+                    userInput.value = '';
+                    
+                    // Show typing indicator
+                    typingIndicator.style.display = 'block';
+                    scrollToBottom();
+                    
+                    const source = new EventSource(`/api/chat/stream?message=${encodeURIComponent(message)}`);
+                    let contentDiv = null;
+                    
+                    function finish(fallback) {
+                        source.close();
+                        // Hide typing indicator
+                        typingIndicator.style.display = 'none';
+                        if (!contentDiv) {
+                            addMessage(fallback);
+                        }
+                    }
+                    
+                    // Each message carries a piece of the reply; the first one opens the reply bubble
+                    source.onmessage = function(event) {
+                        const data = JSON.parse(event.data);
+                        if (contentDiv) {
+                            contentDiv.textContent += typeof data.content === 'object'
+                                ? JSON.stringify(data.content, null, 2)
+                                : data.content;
+                            scrollToBottom();
+                        } else {
+                            contentDiv = addMessage(data.content);
+                        }
+                    };
+                    source.addEventListener('done', function() {
+                        finish('I encountered an error processing your request.');
+                    });
+                    source.onerror = function(error) {
+                        console.error('Error:', error);
+                        finish('Sorry, there was an error connecting to the server.');
+                    };
+                }
+                
+                // Event listeners
+                sendButton.addEventListener('click', sendMessage);
+                userInput.addEventListener('keypress', function(e) {
+                    if (e.key === 'Enter') {
+                        sendMessage();
+                    }
+                });
+                
+                // Load any existing conversation history
+                async function loadHistory() {
+                    try {
+                        const response = await fetch('/api/history');
+                        const data = await response.json();
+                        
+                        if (data.history && Array.isArray(data.history)) {
+                            data.history.forEach(item => {
+                                if (item.type === 'user') {
+                                    addMessage(item.content, true);
+                                } else if (item.type === 'assistant') {
+                                    addMessage(item.content.content);
+                                }
+                            });
+                        }
+                    } catch (error) {
+                        console.error('Error loading history:', error);
+                    }
+                }
+                
+                loadHistory();
+            });
+            """)
+    
+    # Create templates directory if it doesn't exist
+    templates_dir = os.path.join(os.path.dirname(__file__), "templates")
+    os.makedirs(templates_dir, exist_ok=True)
+    
+    # Create HTML template
+    html_path = os.path.join(templates_dir, "index.html")
+    with open(html_path, "w") as f:
+        f.write("""
+            <!DOCTYPE html>
+            <html lang="en">
+            <head>
+                <meta charset="UTF-8">
+                <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                <title>Helium AI - Multi-agent Research Assistant</title>
+                <link rel="stylesheet" href="/static/style.css">
+            </head>
+            <body>
+                <div class="chat-container">
+                    <div class="chat-header">
+                        Helium AI Research Assistant
+                    </div>
+                    <div id="chat-messages" class="chat-messages">
+                        <div id="typing-indicator" class="typing-indicator">
+                            Helium AI is typing...
+                        </div>
+                    </div>
+                    <div class="input-area">
+                        <input type="text" id="user-input" placeholder="Type your message here..." autofocus>
+                        <button id="send-button">Send</button>
+                    </div>
+                </div>
+                <script src="/static/script.js"></script>
+            </body>
+            </html>
+            """)
+
+if __name__ == "__main__":
+    build_assets()
@@ -0,0 +1,66 @@
+"""Paragraph and sentence splitting for SimpleTextSplitter; the sentence scan is compiled with numba when it is installed."""
+import re
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional; sentences are split with SENT_RE without it
+    njit = None
+
+PARA_RE = re.compile(r'\n\s*\n')
+SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split text on blank lines; re.split already beats a compiled scan for this pattern."""
+    return PARA_RE.split(text)
+
+def _split_sentences_regex(text: str) -> List[str]:
+    """Split text after terminal punctuation."""
+    return SENT_RE.split(text)
+
+def _slice(text: str, bounds: np.ndarray) -> List[str]:
+    """Cut text at (start, end) separator spans, dropping the separators."""
+    pieces = []
+    prev = 0
+    for start, end in bounds.tolist():
+        pieces.append(text[prev:start])
+        prev = end
+    pieces.append(text[prev:])
+    return pieces
+
+if njit is not None:
+    @njit(cache=True)
+    def _is_space(c):
+        # ASCII characters matched by the str-pattern \s
+        return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+    @njit(cache=True)
+    def _sentence_breaks(buf):
+        # Spans matching (?<=[.!?])\s+: whitespace runs following terminal punctuation
+        n = buf.shape[0]
+        out = np.empty((n // 2 + 1, 2), dtype=np.int64)
+        count = 0
+        i = 1
+        while i < n:
+            prev = buf[i - 1]
+            if _is_space(buf[i]) and (prev == 46 or prev == 33 or prev == 63):
+                j = i + 1
+                while j < n and _is_space(buf[j]):
+                    j += 1
+                out[count, 0] = i
+                out[count, 1] = j
+                count += 1
+                i = j + 1
+            else:
+                i += 1
+        return out[:count]
+
+    def split_sentences(text: str) -> List[str]:
+        """Split text after terminal punctuation, like SENT_RE.split."""
+        if not text.isascii():
+            return _split_sentences_regex(text)
+        return _slice(text, _sentence_breaks(np.frombuffer(text.encode("ascii"), dtype=np.uint8)))
+else:
+    split_sentences = _split_sentences_regex
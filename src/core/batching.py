@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """Collect concurrent submissions and hand them to a handler in small batches."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_size: int = 8,
+        max_wait: float = 0.010
+    ):
+        """Initialize the batcher.
+
+        Args:
+            handler: Coroutine function mapping a list of items to a list of results
+                (one per item, in order). Exceptions in the result list are raised
+                to the matching caller only.
+            max_size: Maximum number of items per batch
+            max_wait: Seconds to wait for more items after the first one arrives
+        """
+        self.handler = handler
+        self.max_size = max(1, max_size)
+        self.max_wait = max(0.0, max_wait)
+        # Created lazily so they bind to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Batches being handled; kept so they are not garbage collected mid-run
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The handler's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A queue cannot move between event loops; fail whatever the old one held
+            self._fail_queued(RuntimeError("Batcher moved to another event loop"))
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            try:
+                while len(batch) < self.max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Items already taken off the queue are not seen by aclose()
+                _fail(batch, RuntimeError("Batcher closed"))
+                raise
+            # Each batch runs as its own task so a slow one never holds up the next
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[tuple]) -> None:
+        """Run the handler on one batch and resolve the waiting futures."""
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except asyncio.CancelledError:
+            _fail(batch, RuntimeError("Batcher closed"))
+            raise
+        except Exception as e:
+            logger.error(f"Batch handler failed: {str(e)}", exc_info=True)
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue  # Caller went away
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Stop the worker and fail any submissions still waiting."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        inflight = list(self._inflight)
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        self._fail_queued(RuntimeError("Batcher closed"))
+
+    def _fail_queued(self, error: Exception) -> None:
+        """Fail every submission still waiting in the queue."""
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            _fail([self._queue.get_nowait()], error)
+
+def _fail(batch: List[tuple], error: Exception) -> None:
+    """Fail the futures of a batch that have not been resolved yet."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error)
@@ -0,0 +1,41 @@
+"""Bounded offloading of blocking calls made from async code.
+
+Blocking work (model inference, disk caches, client construction) runs on worker threads
+under one CapacityLimiter, separate from the thread pool the web framework uses for
+its own sync handlers, so a burst of such calls cannot starve request handling.
+"""
+import asyncio
+import os
+from functools import partial
+from typing import Any, Callable, Optional
+
+import anyio
+import anyio.to_thread
+
+# Most blocking calls allowed to run at once
+SYNC_LIMIT = int(os.getenv("HELIUM_SYNC_LIMIT", "32"))
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+_limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_limiter() -> anyio.CapacityLimiter:
+    """Get the limiter for blocking calls, creating it on first use in the running event loop."""
+    global _limiter, _limiter_loop
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter_loop is not loop:
+        _limiter = anyio.CapacityLimiter(SYNC_LIMIT)
+        _limiter_loop = loop
+    return _limiter
+
+async def run_sync(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on a worker thread, at most SYNC_LIMIT at a time.
+
+    Args:
+        fn: The blocking function
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    return await anyio.to_thread.run_sync(partial(fn, *args, **kwargs), limiter=get_limiter())
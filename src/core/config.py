@@ -1,64 +1,146 @@
 import os
 from dotenv import load_dotenv
 from pathlib import Path
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Directories already created in this process, so each is created at most once
+_ready_dirs = set()
+
+@dataclass(frozen=True, repr=False)
 class Config:
-    """Application configuration."""
+    """Application configuration, read from the environment once by from_env()."""
+    
+    # Fields are listed in __slots__ so instances carry no __dict__
+    __slots__ = (
+        "LLM_PROVIDER", "GOOGLE_API_KEY", "OPENAI_API_KEY", "VECTOR_DB_TYPE", "VECTOR_DB_PATH",
+        "CHUNK_SIZE", "CHUNK_OVERLAP", "DEBUG", "LOG_LEVEL", "SEARCH_API_KEY", "SEARCH_ENGINE_ID",
+        "_llm_config"
+    )
+    
+    # LLM Configuration
+    LLM_PROVIDER: str  # 'google' or 'openai'
+    GOOGLE_API_KEY: Optional[str]
+    OPENAI_API_KEY: Optional[str]
+    
+    # Vector Database Configuration
+    VECTOR_DB_TYPE: str
+    VECTOR_DB_PATH: str
+    
+    # RAG Configuration
+    CHUNK_SIZE: int
+    CHUNK_OVERLAP: int
+    
+    # Application Settings
+    DEBUG: bool
+    LOG_LEVEL: str
+    
+    # Web Search (Optional)
+    SEARCH_API_KEY: Optional[str]
+    SEARCH_ENGINE_ID: Optional[str]
+    
+    # Provider -> (attribute holding its API key, model settings)
+    _PROVIDER_DEFAULTS: ClassVar[Dict[str, Tuple[str, Dict[str, Any]]]] = {
+        "google": ("GOOGLE_API_KEY", {
+            "model": "gemini-pro",
+            "temperature": 0.7,
+            "max_tokens": 2048
+        }),
+        "openai": ("OPENAI_API_KEY", {
+            "model": "gpt-4-turbo-preview",
+            "temperature": 0.7,
+            "max_tokens": 2048
+        }),
+    }
     
-    def __init__(self):
-        # LLM Configuration
-        self.LLM_PROVIDER = os.getenv("LLM_PROVIDER", "google").lower()  # 'google' or 'openai'
+    def __post_init__(self):
+        # LLM settings for the selected provider, built once and shared read-only
+        provider = self._PROVIDER_DEFAULTS.get(self.LLM_PROVIDER)
+        llm_config = None
+        if provider is not None:
+            key_attr, settings = provider
+            llm_config = MappingProxyType({"api_key": getattr(self, key_attr), **settings})
+        object.__setattr__(self, "_llm_config", llm_config)
+    
+    def __repr__(self) -> str:
+        # Keep API keys out of logs and tracebacks
+        return f"Config({self.to_dict()})"
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build the configuration from environment variables.
+        
+        Returns:
+            The configuration
+            
+        Raises:
+            ValueError: If the API key for the selected LLM provider is missing
+        """
+        env = os.environ
+        provider = env.get("LLM_PROVIDER", "google").lower()
         
         # Google Gemini API (Required if using Google's LLM)
-        self.GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-        if not self.GOOGLE_API_KEY and self.LLM_PROVIDER == "google":
+        google_api_key = env.get("GOOGLE_API_KEY")
+        if not google_api_key and provider == "google":
             raise ValueError("GOOGLE_API_KEY is required when using Google's LLM provider")
         
         # OpenAI API (Required if using OpenAI's LLM)
-        self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-        if not self.OPENAI_API_KEY and self.LLM_PROVIDER == "openai":
+        openai_api_key = env.get("OPENAI_API_KEY")
+        if not openai_api_key and provider == "openai":
             raise ValueError("OPENAI_API_KEY is required when using OpenAI's LLM provider")
         
-        # Vector Database Configuration
-        self.VECTOR_DB_TYPE = os.getenv("VECTOR_DB_TYPE", "chroma").lower()
-        self.VECTOR_DB_PATH = os.path.abspath(os.getenv("VECTOR_DB_PATH", "./data/vector_db"))
-        
-        # Create vector DB directory if it doesn't exist
-        os.makedirs(self.VECTOR_DB_PATH, exist_ok=True)
+        # The directory is created on first use, see vector_db_path
+        vector_db_path = os.path.abspath(env.get("VECTOR_DB_PATH", "./data/vector_db"))
         
-        # RAG Configuration
-        self.CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
-        self.CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "200"))
-        
-        # Application Settings
-        self.DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+        return cls(
+            LLM_PROVIDER=provider,
+            GOOGLE_API_KEY=google_api_key,
+            OPENAI_API_KEY=openai_api_key,
+            VECTOR_DB_TYPE=env.get("VECTOR_DB_TYPE", "chroma").lower(),
+            VECTOR_DB_PATH=vector_db_path,
+            CHUNK_SIZE=int(env.get("CHUNK_SIZE", "1000")),
+            CHUNK_OVERLAP=int(env.get("CHUNK_OVERLAP", "200")),
+            DEBUG=env.get("DEBUG", "False").lower() in ("true", "1", "t"),
+            LOG_LEVEL=env.get("LOG_LEVEL", "INFO"),
+            SEARCH_API_KEY=env.get("SEARCH_API_KEY"),
+            SEARCH_ENGINE_ID=env.get("SEARCH_ENGINE_ID")
+        )
+    
+    @classmethod
+    def validate(cls) -> "Config":
+        """Check that the current environment yields a valid configuration.
         
-        # Web Search (Optional)
-        self.SEARCH_API_KEY = os.getenv("SEARCH_API_KEY")
-        self.SEARCH_ENGINE_ID = os.getenv("SEARCH_ENGINE_ID")
+        Returns:
+            The configuration built from the environment
+            
+        Raises:
+            ValueError: If a required setting is missing or the LLM provider is unsupported
+        """
+        settings = cls.from_env()
+        settings.get_llm_config()
+        return settings
     
-    def get_llm_config(self) -> Dict[str, Any]:
-        """Get LLM configuration based on the selected provider."""
-        if self.LLM_PROVIDER == "google":
-            return {
-                "api_key": self.GOOGLE_API_KEY,
-                "model": "gemini-pro",
-                "temperature": 0.7,
-                "max_tokens": 2048
-            }
-        elif self.LLM_PROVIDER == "openai":
-            return {
-                "api_key": self.OPENAI_API_KEY,
-                "model": "gpt-4-turbo-preview",
-                "temperature": 0.7,
-                "max_tokens": 2048
-            }
-        raise ValueError(f"Unsupported LLM provider: {self.LLM_PROVIDER}")
+    @property
+    def vector_db_path(self) -> str:
+        """VECTOR_DB_PATH, creating the directory the first time it is used in this process."""
+        path = self.VECTOR_DB_PATH
+        if path not in _ready_dirs:
+            Path(path).mkdir(parents=True, exist_ok=True)
+            _ready_dirs.add(path)
+        return path
+    
+    def get_llm_config(self) -> Mapping[str, Any]:
+        """Get LLM configuration based on the selected provider.
+        
+        The same read-only mapping is returned on every call; copy it with dict() to modify it.
+        """
+        if self._llm_config is None:
+            raise ValueError(f"Unsupported LLM provider: {self.LLM_PROVIDER}")
+        return self._llm_config
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary, excluding sensitive information."""
@@ -74,7 +156,7 @@ class Config:
         }
 
 # Create a singleton instance
-config = Config()
+config = Config.from_env()
 
 # For backward compatibility
 LLM_PROVIDER = config.LLM_PROVIDER
@@ -0,0 +1,216 @@
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+logger = logging.getLogger(__name__)
+
+class BatchedONNXEmbedder(ONNXMiniLM_L6_V2):
+    """Chroma's default all-MiniLM-L6-v2 embedding function, tuned for ingest throughput.
+
+    Embeddings match the default's, so existing collections keep working. Each batch is
+    tokenized in one call and padded to its longest text instead of to 256 tokens, and the
+    ONNX Runtime session runs on CUDA when available, otherwise on every CPU core.
+    """
+
+    def __init__(self, batch_size: int = 64, num_threads: Optional[int] = None,
+                 preferred_providers: Optional[List[str]] = None):
+        """Initialize the embedder; the model is loaded on first use.
+
+        Args:
+            batch_size: Texts per model run
+            num_threads: Threads per model run on CPU; defaults to the number of cores
+            preferred_providers: ONNX Runtime providers to use, in order; defaults to
+                CUDA (if installed) then CPU
+        """
+        super().__init__(preferred_providers=preferred_providers)
+        self.batch_size = max(1, batch_size)
+        self.num_threads = num_threads or os.cpu_count() or 1
+
+    @cached_property
+    def tokenizer(self) -> Any:
+        tokenizer = super().tokenizer
+        # Pad each batch only to its longest text
+        tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+        return tokenizer
+
+    @cached_property
+    def model(self) -> Any:
+        if not self._preferred_providers:
+            available = self.ort.get_available_providers()
+            self._preferred_providers = [
+                provider for provider in ("CUDAExecutionProvider", "CPUExecutionProvider") if provider in available
+            ]
+        so = self.ort.SessionOptions()
+        so.log_severity_level = 3
+        so.graph_optimization_level = self.ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = self.num_threads
+        return self.ort.InferenceSession(
+            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "model.onnx"),
+            providers=self._preferred_providers,
+            sess_options=so
+        )
+
+    def _forward(self, documents: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """Embed documents batch by batch with attention-weighted mean pooling."""
+        batch_size = batch_size or self.batch_size
+        embeddings = []
+        for start in range(0, len(documents), batch_size):
+            encoded = self.tokenizer.encode_batch(documents[start:start + batch_size])
+            input_ids = np.array([e.ids for e in encoded], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+            last_hidden_state = self.model.run(None, {
+                "input_ids": input_ids,
+                "attention_mask": attention_mask,
+                "token_type_ids": np.zeros_like(input_ids)
+            })[0]
+
+            mask = attention_mask[:, :, np.newaxis].astype(last_hidden_state.dtype)
+            pooled = (last_hidden_state * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            embeddings.append(self._normalize(pooled).astype(np.float32))
+        if not embeddings:
+            return np.empty((0, 384), dtype=np.float32)
+        return np.concatenate(embeddings)
+
+def quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Scale a vector to int8 codes so its largest component maps to +-127.
+
+    Returns:
+        The codes and the scale that maps them back to the vector
+    """
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    scale = peak / 127.0 if peak else 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+def dequantize(codes: np.ndarray, scale: float) -> np.ndarray:
+    """Map int8 codes from quantize() back to a float32 vector."""
+    return codes.astype(np.float32) * np.float32(scale)
+
+class EmbeddingCache:
+    """LRU cache of text embeddings keyed by SHA-256 digest, persisted to an .npz file.
+
+    Repeated text (boilerplate headers, duplicated pages) is embedded once. Embeddings
+    are held as int8 codes with one scale per vector, a quarter of the float32 size;
+    for unit-length embeddings the round trip changes cosine similarities by well under
+    0.1%. The cache is saved at interpreter exit and loaded again on startup.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 50_000, model_name: str = ""):
+        """Initialize the cache, loading it from path if the file exists.
+
+        Args:
+            path: .npz file the cache is persisted to, or None to keep it in memory only
+            max_entries: Maximum number of cached embeddings
+            model_name: Name of the embedding model; a saved cache from another model is ignored
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.model_name = model_name
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: "OrderedDict[bytes, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    @staticmethod
+    def make_key(text: str) -> bytes:
+        """Build the cache key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def embed(self, texts: Sequence[str], embed_fn: Callable[[List[str]], Sequence[Any]]) -> List[np.ndarray]:
+        """Embed texts, running embed_fn only on distinct texts that are not cached.
+
+        Args:
+            texts: The texts to embed
+            embed_fn: Function embedding a list of texts, one embedding per text
+
+        Returns:
+            One float32 embedding per text, in order
+        """
+        keys = [self.make_key(text) for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        missing: Dict[bytes, List[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    embeddings[i] = dequantize(*entry)
+                else:
+                    missing.setdefault(key, []).append(i)
+            self.stats["hits"] += len(texts) - sum(len(positions) for positions in missing.values())
+            self.stats["misses"] += len(missing)
+
+        if missing:
+            computed = embed_fn([texts[positions[0]] for positions in missing.values()])
+            with self._lock:
+                for (key, positions), vector in zip(missing.items(), computed):
+                    vector = np.asarray(vector, dtype=np.float32)
+                    self._entries[key] = quantize(vector)
+                    for i in positions:
+                        embeddings[i] = vector
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return embeddings
+
+    def save(self) -> None:
+        """Write the cache to its .npz file, least recently used entries first."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._entries:
+                return
+            keys = np.frombuffer(b"".join(self._entries), dtype=np.uint8).reshape(-1, 32)
+            codes = np.stack([codes for codes, _ in self._entries.values()])
+            scales = np.array([scale for _, scale in self._entries.values()], dtype=np.float32)
+        # Each process writes its own temp file, so workers saving at exit never share one
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, keys=keys, codes=codes, scales=scales, model=np.array(self.model_name))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save embedding cache to {self.path}: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def load(self) -> None:
+        """Load entries saved by save(); a missing or unreadable file leaves the cache empty."""
+        try:
+            with np.load(self.path) as data:
+                # Files from another model, or written before embeddings were quantized, are skipped
+                if str(data["model"]) != self.model_name or "codes" not in data.files:
+                    return
+                entries = zip(
+                    (key.tobytes() for key in data["keys"]),
+                    zip(data["codes"], data["scales"].tolist())
+                )
+                with self._lock:
+                    self._entries.update(entries)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        except Exception as e:
+            logger.warning(f"Failed to load embedding cache from {self.path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_caches: Dict[str, EmbeddingCache] = {}
+
+def get_embedding_cache(directory: str, model_name: str) -> EmbeddingCache:
+    """Get (once per process) the embedding cache persisted in a directory, saved at exit."""
+    path = os.path.join(directory, "embed_cache.npz")
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = EmbeddingCache(path, model_name=model_name)
+        atexit.register(cache.save)
+    return cache
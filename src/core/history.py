@@ -0,0 +1,100 @@
+"""Conversation history persisted to SQLite, so it survives server restarts.
+
+The database is opened in WAL mode and every query runs on one dedicated thread, so
+the connection never crosses threads and the event loop never waits on disk I/O.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Iterable, List, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PATH = os.path.abspath(os.getenv("HELIUM_HISTORY_PATH", "./data/history.db"))
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS msgs(id INTEGER PRIMARY KEY, ts TEXT, type TEXT, content BLOB)"
+
+@dataclass(frozen=True)
+class Msg:
+    """One message in the conversation history; orjson serializes it as a JSON object."""
+    __slots__ = ('type', 'content', 'timestamp')
+    type: str  # 'user' or 'assistant'
+    content: Any
+    timestamp: str
+
+class HistoryStore:
+    """Append-only store of conversation messages."""
+
+    def __init__(self, path: str = HISTORY_PATH):
+        """Initialize the store; the database is opened by open().
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history")
+
+    async def _run(self, fn, *args) -> Any:
+        """Run fn on the store's thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args))
+
+    async def open(self) -> None:
+        """Open the database, creating it and its table if needed."""
+        await self._run(self._open)
+
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        self._conn = conn
+
+    async def append(self, messages: Iterable[Msg]) -> None:
+        """Store messages in order; errors are logged and ignored.
+
+        Args:
+            messages: The messages to store
+        """
+        rows = [(m.timestamp, m.type, orjson.dumps(m.content)) for m in messages]
+        try:
+            await self._run(self._append, rows)
+        except Exception as e:
+            logger.warning(f"Failed to save conversation history: {str(e)}")
+
+    def _append(self, rows: List[tuple]) -> None:
+        self._conn.executemany("INSERT INTO msgs(ts, type, content) VALUES (?, ?, ?)", rows)
+        self._conn.commit()
+
+    async def recent(self, limit: int) -> List[Msg]:
+        """Return the latest messages, oldest first; errors yield an empty list.
+
+        Args:
+            limit: Maximum number of messages to return
+        """
+        try:
+            rows = await self._run(self._recent, limit)
+        except Exception as e:
+            logger.warning(f"Failed to load conversation history: {str(e)}")
+            return []
+        return [Msg(type_, orjson.loads(content), ts) for ts, type_, content in reversed(rows)]
+
+    def _recent(self, limit: int) -> List[tuple]:
+        return self._conn.execute(
+            "SELECT ts, type, content FROM msgs ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    async def close(self) -> None:
+        """Close the database and stop the store's thread."""
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,61 @@
+"""Disk-backed key-value stores shared by all worker processes on a host.
+
+Stores are backed by diskcache when it is installed; without it get_store() returns
+None and callers fall back to their in-process caches.
+"""
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Optional
+
+try:
+    import diskcache
+except ImportError:  # Optional; caching stays per-process without it
+    diskcache = None
+
+from .concurrency import run_sync
+
+logger = logging.getLogger(__name__)
+
+KV_PATH = os.path.abspath(os.getenv("HELIUM_KV_PATH", "./data/kv"))
+
+# Keys are keyed BLAKE2b digests, so entries written with another secret never match
+_SECRET = os.getenv("HELIUM_CACHE_SECRET", "").encode("utf-8")[:64]
+
+_stores: Dict[str, Any] = {}
+
+def get_store(name: str, size_limit: int = 1 << 30) -> Optional["diskcache.Cache"]:
+    """Open (once per process) the named store.
+
+    Args:
+        name: Store name, used as its directory under KV_PATH
+        size_limit: Maximum size of the store on disk, in bytes
+
+    Returns:
+        The store, or None if diskcache is not installed
+    """
+    if diskcache is None:
+        return None
+    store = _stores.get(name)
+    if store is None:
+        store = _stores[name] = diskcache.Cache(os.path.join(KV_PATH, name), size_limit=size_limit)
+    return store
+
+def digest(text: str, person: bytes) -> bytes:
+    """Hash text into a 16-byte store key, separated by purpose via person (up to 16 bytes)."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16, key=_SECRET, person=person).digest()
+
+async def aget(store, key: bytes) -> Optional[Any]:
+    """Read a value from a store without blocking the event loop; errors count as misses."""
+    try:
+        return await run_sync(store.get, key)
+    except Exception as e:
+        logger.warning(f"Key-value store read failed: {str(e)}")
+        return None
+
+async def aset(store, key: bytes, value: Any, expire: Optional[float] = None) -> None:
+    """Write a value to a store without blocking the event loop; errors are logged and ignored."""
+    try:
+        await run_sync(store.set, key, value, expire=expire)
+    except Exception as e:
+        logger.warning(f"Key-value store write failed: {str(e)}")
@@ -0,0 +1,19 @@
+"""Logging configuration for Helium AI entry points.
+
+Library modules only create loggers; the script or server being run calls
+configure_logging() once at startup.
+"""
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Send log records to stderr, unless the root logger already has handlers.
+
+    Args:
+        level: Minimum level of records to log
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    logging.basicConfig(level=level, format=LOG_FORMAT)
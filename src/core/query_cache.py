@@ -0,0 +1,123 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+class SemanticQueryCache:
+    """LRU cache of query results, matched by exact query text or by embedding similarity.
+
+    This is the one semantic cache index in the project: it caches RAG search results
+    and web chat responses directly, and backs LLMCache's semantic lookups. Entries are
+    grouped by a scope string (e.g. the requested k and metadata filter), and a query only
+    matches entries from its own scope.
+    """
+
+    def __init__(self, max_entries: int = 1024, threshold: float = 0.97):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached queries
+            threshold: Minimum cosine similarity between query embeddings for a semantic hit
+        """
+        self.max_entries = max(1, max_entries)
+        self.threshold = threshold
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+        # Exact key -> slot, least recently used first. Each slot is one row of
+        # _vectors, so a semantic probe is a single matrix-vector product.
+        self._slots: "OrderedDict[bytes, int]" = OrderedDict()
+        self._results: List[Any] = [None] * self.max_entries
+        self._keys: List[Optional[bytes]] = [None] * self.max_entries
+        self._vectors: Optional[np.ndarray] = None  # (max_entries, dim) unit vectors, allocated on first put
+        self._scope_ids = np.full(self.max_entries, -1, dtype=np.int64)  # -1 marks an empty slot
+        self._scopes: Dict[str, int] = {}
+
+    @staticmethod
+    def make_key(query: str, scope: str) -> bytes:
+        """Build the exact-match key for a query within a scope."""
+        return hashlib.sha256(f"{scope}\0{query}".encode("utf-8")).digest()
+
+    def get(self, query: str, scope: str = "") -> Any:
+        """Return the results cached for exactly this query, or None."""
+        key = self.make_key(query, scope)
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        self._slots.move_to_end(key)
+        self.stats["hits"] += 1
+        return self._results[slot]
+
+    def match(self, embedding: Sequence[float], scope: str = "") -> Any:
+        """Return the results of the most similar cached query, if similar enough.
+
+        Args:
+            embedding: Embedding of the incoming query
+            scope: Scope the cached query must share
+
+        Returns:
+            The cached results, or None on a miss
+        """
+        scope_id = self._scopes.get(scope)
+        if scope_id is None or self._vectors is None:
+            self.stats["misses"] += 1
+            return None
+        vector = self._normalize(embedding)
+        if vector.shape[0] != self._vectors.shape[1]:
+            self.stats["misses"] += 1
+            return None
+
+        scores = np.where(self._scope_ids == scope_id, self._vectors @ vector, -np.inf)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self.stats["misses"] += 1
+            return None
+        self._slots.move_to_end(self._keys[best])
+        self.stats["semantic_hits"] += 1
+        return self._results[best]
+
+    def put(self, query: str, embedding: Sequence[float], results: Any, scope: str = "") -> None:
+        """Cache the results of a query, evicting the least recently used entry if full.
+
+        Args:
+            query: The query text
+            embedding: Embedding of the query
+            results: The results to return for this and similar queries
+            scope: Scope the results belong to
+        """
+        vector = self._normalize(embedding)
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            # First entry, or the embedding model changed: start over at the new width
+            self.clear()
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+        key = self.make_key(query, scope)
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            if len(self._slots) < self.max_entries:
+                slot = len(self._slots)
+            else:
+                _, slot = self._slots.popitem(last=False)
+        self._slots[key] = slot
+        self._keys[slot] = key
+        self._results[slot] = results
+        self._vectors[slot] = vector
+        self._scope_ids[slot] = self._scopes.setdefault(scope, len(self._scopes))
+
+    def clear(self) -> None:
+        """Drop every cached entry, e.g. after the underlying collection changes."""
+        self._slots.clear()
+        self._results = [None] * self.max_entries
+        self._keys = [None] * self.max_entries
+        self._scope_ids.fill(-1)
+        self._scopes.clear()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        """Return the embedding as a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
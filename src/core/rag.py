@@ -1,93 +1,57 @@
+import asyncio
+import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
-from .vector_db import get_vector_db
+from .query_cache import SemanticQueryCache
+from .text_splitter import SimpleTextSplitter
+from .vector_db import content_hash, get_vector_db
 from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
+# Chroma and embedding calls block; they run here so the event loop keeps serving
+# other requests. ONNX Runtime releases the GIL, so embeddings overlap with network I/O.
+_executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="rag")
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Run a blocking call on the RAG thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, partial(fn, *args, **kwargs))
+
+def warm_up() -> None:
+    """Load the embedding model and compile the sentence splitter before the first request.
+
+    Failures are logged rather than raised; the first query then pays the cost instead.
+    """
+    try:
+        SimpleTextSplitter(chunk_size=1000, chunk_overlap=200).split_text("a. b. c.")
+        get_vector_db().embed_query("warm up")
+    except Exception as e:
+        logger.warning(f"RAG warm-up failed: {str(e)}")
+
 class RAGSystem:
     """A Retrieval Augmented Generation system for document processing and querying."""
     
-    def __init__(self, collection_name: str = "documents"):
+    def __init__(self, collection_name: str = "documents", cache_size: int = 1024, cache_threshold: float = 0.97):
         """Initialize the RAG system.
         
         Args:
             collection_name: Name of the collection to use in the vector DB
+            cache_size: Number of recent queries whose results are cached
+            cache_threshold: Minimum cosine similarity for a query to reuse a cached query's results
         """
         self.collection_name = collection_name
         self.vector_db = get_vector_db()
         self.text_splitter = self._get_text_splitter()
+        self.query_cache = SemanticQueryCache(max_entries=cache_size, threshold=cache_threshold)
     
     def _get_text_splitter(self):
         """Get a text splitter for chunking documents."""
         # Using a simple character-based splitter for now
         # Could be replaced with more sophisticated splitters like RecursiveCharacterTextSplitter
-        class SimpleTextSplitter:
-            def __init__(self, chunk_size=1000, chunk_overlap=200):
-                self.chunk_size = chunk_size
-                self.chunk_overlap = chunk_overlap
-            
-            def split_text(self, text: str) -> List[str]:
-                """Split text into chunks."""
-                if not text:
-                    return []
-                
-                # First, try to split on paragraphs
-                chunks = []
-                paragraphs = re.split(r'\n\s*\n', text)
-                
-                current_chunk = []
-                current_length = 0
-                
-                for para in paragraphs:
-                    para = para.strip()
-                    if not para:
-                        continue
-                        
-                    para_length = len(para)
-                    
-                    # If paragraph is too big, split it further
-                    if para_length > self.chunk_size:
-                        if current_chunk:
-                            chunks.append("\n".join(current_chunk))
-                            current_chunk = []
-                            current_length = 0
-                        
-                        # Split the large paragraph into sentences
-                        sentences = re.split(r'(?<=[.!?])\s+', para)
-                        sentence_chunk = []
-                        chunk_len = 0
-                        
-                        for sentence in sentences:
-                            sent_len = len(sentence)
-                            if chunk_len + sent_len > self.chunk_size and sentence_chunk:
-                                chunks.append(" ".join(sentence_chunk))
-                                sentence_chunk = sentence_chunk[-self.chunk_overlap:] if self.chunk_overlap > 0 else []
-                                chunk_len = sum(len(s) + 1 for s in sentence_chunk)
-                            
-                            sentence_chunk.append(sentence)
-                            chunk_len += sent_len + 1
-                        
-                        if sentence_chunk:
-                            chunks.append(" ".join(sentence_chunk))
-                    else:
-                        if current_length + para_length > self.chunk_size and current_chunk:
-                            chunks.append("\n".join(current_chunk))
-                            # Keep some overlap between chunks
-                            current_chunk = current_chunk[-self.chunk_overlap:] if self.chunk_overlap > 0 else []
-                            current_length = sum(len(p) + 2 for p in current_chunk)
-                        
-                        current_chunk.append(para)
-                        current_length += para_length + 2
-                
-                if current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                
-                return chunks
-        
         return SimpleTextSplitter(chunk_size=1000, chunk_overlap=200)
     
     async def add_documents(self, documents: List[Dict[str, Any]], **kwargs) -> bool:
@@ -106,7 +70,10 @@ class RAGSystem:
         chunk_size = kwargs.get('chunk_size', 1000)
         chunk_overlap = kwargs.get('chunk_overlap', 200)
         
-        processed_docs = []
+        # Parallel lists, as the vector DB takes them, rather than one dict per chunk
+        ids = []
+        texts = []
+        metadatas = []
         
         for doc in documents:
             text = doc.get('text', '').strip()
@@ -119,22 +86,24 @@ class RAGSystem:
             # Split the document into chunks
             chunks = self.text_splitter.split_text(text)
             
+            total_chunks = len(chunks)
+            source = metadata.get('source', 'unknown')
             for i, chunk in enumerate(chunks):
-                chunk_id = f"{doc_id}_chunk_{i}" if doc_id else f"chunk_{hash(chunk)}"
-                processed_docs.append({
-                    'id': chunk_id,
-                    'text': chunk,
-                    'metadata': {
-                        **metadata,
-                        'chunk_index': i,
-                        'total_chunks': len(chunks),
-                        'source': metadata.get('source', 'unknown')
-                    }
+                ids.append(f"{doc_id}_chunk_{i}" if doc_id else f"chunk_{content_hash(chunk)}")
+                texts.append(chunk)
+                metadatas.append({
+                    **metadata,
+                    'chunk_index': i,
+                    'total_chunks': total_chunks,
+                    'source': source
                 })
         
         # Add to vector DB
-        if processed_docs:
-            return self.vector_db.add_documents(processed_docs, self.collection_name)
+        if ids:
+            added = await _run_blocking(self.vector_db.add_documents_soa, ids, texts, metadatas, self.collection_name)
+            # Cached results may no longer be the best matches
+            self.query_cache.clear()
+            return added
         return False
     
     async def query(self, query: str, k: int = 5, filter_metadata: Optional[Dict] = None, **kwargs) -> List[Dict[str, Any]]:
@@ -149,23 +118,35 @@ class RAGSystem:
         Returns:
             List of relevant document chunks with scores and metadata
         """
+        k = min(k, 10)  # Limit to 10 results max
         try:
-            results = self.vector_db.search(
+            # Exact repeats skip embedding; near-duplicates skip the vector search
+            scope = json.dumps([k, filter_metadata], sort_keys=True, default=str)
+            cached = self.query_cache.get(query, scope)
+            if cached is None:
+                query_embedding = await _run_blocking(self.vector_db.embed_query, query)
+                cached = self.query_cache.match(query_embedding, scope)
+            if cached is not None:
+                return [dict(result) for result in cached]
+            
+            results = await _run_blocking(
+                self.vector_db.search,
                 query=query,
-                k=min(k, 10),  # Limit to 10 results max
+                k=k,
                 collection_name=self.collection_name,
-                filter_metadata=filter_metadata
+                filter_metadata=filter_metadata,
+                query_embedding=query_embedding
             )
             
             # Process and format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'content': result['text'],
-                    'metadata': result['metadata'],
-                    'score': result.get('score', 0.0)
-                })
+            formatted_results = [
+                {'content': result['text'], 'metadata': result['metadata'], 'score': result.get('score', 0.0)}
+                for result in results
+            ]
             
+            if formatted_results:
+                self.query_cache.put(query, query_embedding, formatted_results, scope)
+                return [dict(result) for result in formatted_results]
             return formatted_results
             
         except Exception as e:
@@ -174,7 +155,9 @@ class RAGSystem:
     
     async def delete_collection(self) -> bool:
         """Delete the current collection."""
-        return self.vector_db.delete_collection(self.collection_name)
+        deleted = await _run_blocking(self.vector_db.delete_collection, self.collection_name)
+        self.query_cache.clear()
+        return deleted
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the current collection."""
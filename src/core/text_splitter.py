@@ -0,0 +1,86 @@
+"""Text splitting for the RAG system.
+
+Fully annotated so it can be compiled with mypyc (see setup.py); the compiled extension,
+when built, is imported in place of this file.
+"""
+from collections import deque
+from typing import Deque, List
+
+from ._chunker import split_paragraphs, split_sentences
+
+class SimpleTextSplitter:
+    """Split text into chunks of about chunk_size characters on paragraph and sentence boundaries.
+    
+    Consecutive chunks share up to chunk_overlap characters of whole paragraphs or sentences.
+    """
+    
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200) -> None:
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+    
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks."""
+        if not text:
+            return []
+        
+        # Parameters are fixed after construction; bind them once as locals
+        chunk_size = self.chunk_size
+        emit = self._emit
+        chunks: List[str] = []
+        # Pieces of the chunk being built, with their lengths (plus separator) kept
+        # alongside so trimming the overlap never re-measures the window
+        current: Deque[str] = deque()
+        lengths: Deque[int] = deque()
+        current_length = 0
+        
+        # First, try to split on paragraphs
+        for para in split_paragraphs(text):
+            para = para.strip()
+            if not para:
+                continue
+            
+            para_length = len(para)
+            
+            # If paragraph is too big, split it further
+            if para_length > chunk_size:
+                if current:
+                    chunks.append("\n".join(current))
+                    current.clear()
+                    lengths.clear()
+                    current_length = 0
+                
+                # Split the large paragraph into sentences
+                sentences: Deque[str] = deque()
+                sentence_lengths: Deque[int] = deque()
+                chunk_len = 0
+                for sentence in split_sentences(para):
+                    sent_len = len(sentence)
+                    if chunk_len + sent_len > chunk_size and sentences:
+                        chunk_len = emit(sentences, sentence_lengths, chunk_len, " ", chunks)
+                    sentences.append(sentence)
+                    sentence_lengths.append(sent_len + 1)
+                    chunk_len += sent_len + 1
+                
+                if sentences:
+                    chunks.append(" ".join(sentences))
+            else:
+                if current_length + para_length > chunk_size and current:
+                    current_length = emit(current, lengths, current_length, "\n", chunks)
+                
+                current.append(para)
+                lengths.append(para_length + 2)
+                current_length += para_length + 2
+        
+        if current:
+            chunks.append("\n".join(current))
+        
+        return chunks
+    
+    def _emit(self, pieces: Deque[str], lengths: Deque[int], length: int, separator: str, chunks: List[str]) -> int:
+        """Append the pieces as a chunk, keep the trailing overlap, and return its length."""
+        chunks.append(separator.join(pieces))
+        # Keep some overlap between chunks
+        while pieces and length > self.chunk_overlap:
+            pieces.popleft()
+            length -= lengths.popleft()
+        return length
@@ -1,19 +1,23 @@
-import json
+import mmap
+import os
+from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
+import orjson
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Files at least this large are parsed from a memory map instead of being read into memory first
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """Load JSON data from a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
     except Exception as e:
         logger.error(f"Error loading JSON file {file_path}: {str(e)}")
         raise
@@ -21,8 +25,7 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
 def save_json_file(data: Dict[str, Any], file_path: str) -> None:
     """Save data to a JSON file."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     except Exception as e:
         logger.error(f"Error saving JSON file {file_path}: {str(e)}")
         raise
@@ -1,12 +1,25 @@
+import hashlib
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import chromadb
+import numpy as np
 from chromadb.config import Settings
-from chromadb.utils import embedding_functions
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from .embeddings import BatchedONNXEmbedder, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
+# Texts per embedding model call
+EMBED_BATCH_SIZE = 64
+# Documents per collection.add call (capped at the client's maximum batch size); the next
+# group is embedded while one is inserted
+INSERT_BATCH_SIZE = 1024
+
+def content_hash(text: str) -> str:
+    """Return a stable ID fragment for text: the first 16 hex digits of its SHA-256 digest."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
 class VectorDB:
     """A wrapper around ChromaDB for vector storage and retrieval."""
     
@@ -18,7 +31,12 @@ class VectorDB:
         """
         self.config = config
         self.client = self._init_client()
+        self.insert_batch_size = min(INSERT_BATCH_SIZE, self.client.get_max_batch_size())
         self.embedding_function = self._init_embedding_function()
+        # Embeddings of previously ingested text, shared by every VectorDB on this path
+        self.embedding_cache = get_embedding_cache(self.config['path'], self.embedding_function.name())
+        # Collection handles by name, so each is looked up on the client once
+        self._collections: Dict[str, chromadb.Collection] = {}
         self.collection = self._get_or_create_collection()
     
     def _init_client(self) -> chromadb.Client:
@@ -34,18 +52,23 @@ class VectorDB:
     
     def _init_embedding_function(self):
         """Initialize the embedding function."""
-        # For now, we'll use the default all-MiniLM-L6-v2 model
-        return embedding_functions.DefaultEmbeddingFunction()
+        # all-MiniLM-L6-v2, as Chroma's default, batched and with a tuned ONNX Runtime session
+        return BatchedONNXEmbedder(batch_size=EMBED_BATCH_SIZE)
     
     def _get_or_create_collection(self, name: Optional[str] = None) -> chromadb.Collection:
         """Get or create a collection in the database."""
         collection_name = name or self.config.get('collection_name', 'documents')
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
         try:
-            return self.client.get_or_create_collection(
+            collection = self.client.get_or_create_collection(
                 name=collection_name,
                 embedding_function=self.embedding_function,
                 metadata={"hnsw:space": "cosine"}  # Use cosine similarity
             )
+            self._collections[collection_name] = collection
+            return collection
         except Exception as e:
             logger.error(f"Failed to get or create collection '{collection_name}': {str(e)}")
             raise
@@ -62,35 +85,96 @@ class VectorDB:
         """
         if not documents:
             return False
+        
+        # Prepare batch data
+        ids = []
+        texts = []
+        metadatas = []
+        
+        for i, doc in enumerate(documents):
+            doc_id = doc.get('id') or f"doc_{i}_{content_hash(doc['text'])}"
+            ids.append(doc_id)
+            texts.append(doc['text'])
+            metadatas.append(doc.get('metadata', {}))
+        
+        return self.add_documents_soa(ids, texts, metadatas, collection_name)
+    
+    def add_documents_soa(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]],
+                          collection_name: Optional[str] = None) -> bool:
+        """Add documents given as parallel lists, the layout collection.add takes.
+        
+        Args:
+            ids: Document IDs
+            texts: Document texts, one per ID
+            metadatas: Document metadata, one per ID
+            collection_name: Optional collection name (uses default if None)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not ids:
+            return False
             
         try:
             collection = self._get_or_create_collection(collection_name)
             
-            # Prepare batch data
-            ids = []
-            texts = []
-            metadatas = []
-            
-            for i, doc in enumerate(documents):
-                doc_id = doc.get('id', f"doc_{i}_{hash(doc['text'])}")
-                ids.append(doc_id)
-                texts.append(doc['text'])
-                metadatas.append(doc.get('metadata', {}))
+            batch_size = self.insert_batch_size
+            if len(texts) <= batch_size:
+                collection.add(
+                    embeddings=self.embed(texts),
+                    documents=texts,
+                    metadatas=metadatas,
+                    ids=ids
+                )
+                return True
             
-            # Add to collection
-            collection.add(
-                documents=texts,
-                metadatas=metadatas,
-                ids=ids
-            )
+            # Large ingests: embed group n + 1 in the background while group n is inserted
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = executor.submit(self.embed, texts[:batch_size])
+                for start in range(0, len(texts), batch_size):
+                    end = start + batch_size
+                    embeddings = pending.result()
+                    if end < len(texts):
+                        pending = executor.submit(self.embed, texts[end:end + batch_size])
+                    collection.add(
+                        embeddings=embeddings,
+                        documents=texts[start:end],
+                        metadatas=metadatas[start:end],
+                        ids=ids[start:end]
+                    )
             return True
             
         except Exception as e:
             logger.error(f"Error adding documents to vector DB: {str(e)}")
             return False
     
+    def embed(self, texts: List[str]) -> List[Any]:
+        """Embed texts with the collection's embedding function, EMBED_BATCH_SIZE at a time.
+        
+        Texts embedded before (by any VectorDB on this path) are served from the embedding cache.
+        
+        Args:
+            texts: The texts to embed
+            
+        Returns:
+            One embedding per text, in order
+        """
+        return self.embedding_cache.embed(texts, self._embed_uncached)
+    
+    def _embed_uncached(self, texts: List[str]) -> List[Any]:
+        """Run the embedding function over texts in batches."""
+        embeddings = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            embeddings.extend(self.embedding_function(texts[start:start + EMBED_BATCH_SIZE]))
+        return embeddings
+    
+    def embed_query(self, query: str) -> Any:
+        """Embed a search query."""
+        return self.embedding_function([query])[0]
+    
     def search(self, query: str, k: int = 5, collection_name: Optional[str] = None, 
-               filter_metadata: Optional[Dict] = None) -> List[Dict[str, Any]]:
+               filter_metadata: Optional[Dict] = None,
+               query_embedding: Optional[Sequence[float]] = None) -> List[Dict[str, Any]]:
         """Search for similar documents in the vector database.
         
         Args:
@@ -98,6 +182,8 @@ class VectorDB:
             k: Number of results to return
             collection_name: Optional collection name
             filter_metadata: Optional metadata filters
+            query_embedding: Embedding of the query, if the caller already has one;
+                otherwise the query is embedded here
             
         Returns:
             List of matching documents with scores
@@ -105,23 +191,22 @@ class VectorDB:
         try:
             collection = self._get_or_create_collection(collection_name)
             
+            if query_embedding is None:
+                query_embedding = self.embed_query(query)
+            # Always pass the vector, so Chroma never embeds the query text itself
             results = collection.query(
-                query_texts=[query],
+                query_embeddings=[np.asarray(query_embedding, dtype=np.float32).tolist()],
                 n_results=k,
                 where=filter_metadata
             )
             
-            # Format results
-            formatted_results = []
-            for i in range(len(results['ids'][0])):
-                formatted_results.append({
-                    'id': results['ids'][0][i],
-                    'text': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i],
-                    'score': results['distances'][0][i] if results.get('distances') else None
-                })
-                
-            return formatted_results
+            # Format results, zipping Chroma's per-field columns row by row
+            ids = results['ids'][0]
+            distances = results['distances'][0] if results.get('distances') else [None] * len(ids)
+            return [
+                {'id': doc_id, 'text': text, 'metadata': metadata, 'score': score}
+                for doc_id, text, metadata, score in zip(ids, results['documents'][0], results['metadatas'][0], distances)
+            ]
             
         except Exception as e:
             logger.error(f"Error searching vector DB: {str(e)}")
@@ -129,6 +214,7 @@ class VectorDB:
     
     def delete_collection(self, collection_name: str) -> bool:
         """Delete a collection from the database."""
+        self._collections.pop(collection_name, None)
         try:
             self.client.delete_collection(collection_name)
             return True
@@ -155,6 +241,6 @@ def get_vector_db() -> VectorDB:
     from ..core.config import config
     return VectorDB({
         'type': config.VECTOR_DB_TYPE,
-        'path': config.VECTOR_DB_PATH,
+        'path': config.vector_db_path,
         'collection_name': 'default'
     })
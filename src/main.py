@@ -7,12 +7,12 @@ from agents.mira import Mira
 from agents.chloe import Chloe
 from agents.axel import Axel
 from core.config import Config
+from core.logging_setup import configure_logging
+from core.rag import warm_up
+from tools.web_search import WebSearchTool
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 class HeliumAI:
@@ -29,6 +29,9 @@ class HeliumAI:
         """Initialize all agents and set up the team."""
         logger.info("Initializing Helium AI...")
         
+        # Load the embedding model and JIT-compile the chunker while the agents are created
+        warm_up_task = asyncio.get_running_loop().run_in_executor(None, warm_up)
+        
         # Initialize all agents
         self.zane = Zane()
         self.mira = Mira()
@@ -40,8 +43,14 @@ class HeliumAI:
         self.zane.add_team_member(self.chloe)
         self.zane.add_team_member(self.axel)
         
+        await warm_up_task
         logger.info("Helium AI initialization complete")
     
+    async def shutdown(self):
+        """Release resources shared by the agents, such as the web search connection pool."""
+        await WebSearchTool.aclose_shared()
+        logger.info("Helium AI shut down")
+    
     async def process_task(self, task: str) -> dict:
         """Process a task using the Helium AI team."""
         logger.info(f"Processing task: {task}")
@@ -61,9 +70,9 @@ class HeliumAI:
 
 async def demo():
     """Run a demo of Helium AI's capabilities."""
+    helium_ai = HeliumAI()
     try:
         # Initialize the application
-        helium_ai = HeliumAI()
         await helium_ai.initialize()
         
         # Example tasks to demonstrate different capabilities
@@ -95,6 +104,8 @@ async def demo():
     except Exception as e:
         logger.error(f"An error occurred during the demo: {str(e)}", exc_info=True)
         return 1
+    finally:
+        await helium_ai.shutdown()
     
     return 0
 
@@ -1,19 +1,71 @@
 import os
+import asyncio
+import importlib.util
 import httpx
 from typing import Dict, List, Optional
-from ..core.config import Config
+from ..core import kv
+from ..core.config import config
 from ..core.utils import logger
 
+# Titles of the placeholder results search() returns when no real search was made
+_ERROR_TITLES = frozenset(("Error: No API Key", "Search Error"))
+
+def is_search_error(results: List[Dict[str, str]]) -> bool:
+    """Return True if search results are an error placeholder rather than real results."""
+    return any(result.get("title") in _ERROR_TITLES for result in results)
+
 class WebSearchTool:
     """A tool for performing web searches."""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or Config.SEARCH_API_KEY
+    # Client shared by every tool created without one, so connections are kept alive between calls
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key or config.SEARCH_API_KEY
+        self.client = client  # Client owned by the caller; None uses the class-level shared client
         self.base_url = "https://www.googleapis.com/customsearch/v1"
+        # Fetched pages shared with other processes and restarts (None without diskcache)
+        self._page_cache = kv.get_store("web_pages")
+        self._page_cache_ttl = 3600
         
         if not self.api_key:
             logger.warning("No search API key provided. Web search functionality will be limited.")
     
+    @classmethod
+    async def get_client(cls) -> httpx.AsyncClient:
+        """Get the shared client, creating it on first use in the running event loop.
+        
+        A client left from an earlier event loop is closed before it is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            if cls._client is not None and not cls._client.is_closed:
+                try:
+                    await cls._client.aclose()
+                except Exception as e:
+                    # Its connections belong to the old loop, which may already be closed
+                    logger.debug(f"Error closing previous web search client: {str(e)}")
+            cls._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=importlib.util.find_spec("h2") is not None,  # HTTP/2 needs the h2 package
+                timeout=httpx.Timeout(10.0)
+            )
+            cls._client_loop = loop
+        return cls._client
+    
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close the shared client, if it was created."""
+        client, cls._client, cls._client_loop = cls._client, None, None
+        if client is not None:
+            await client.aclose()
+    
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request with the caller's client or the shared one."""
+        client = self.client or await self.get_client()
+        return await client.get(url, **kwargs)
+    
     async def search(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """Perform a web search and return results.
         
@@ -39,16 +91,15 @@ class WebSearchTool:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                return [{
-                    "title": item.get("title", "No title"),
-                    "link": item.get("link", ""),
-                    "snippet": item.get("snippet", "No description available.")
-                } for item in data.get("items", [])]
+            response = await self._get(self.base_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            return [{
+                "title": item.get("title", "No title"),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet", "No description available.")
+            } for item in data.get("items", [])]
                 
         except Exception as e:
             logger.error(f"Error performing web search: {str(e)}")
@@ -67,15 +118,46 @@ class WebSearchTool:
         Returns:
             The page content as text, or None if an error occurs
         """
+        cache_key = None
+        if self._page_cache is not None:
+            cache_key = kv.digest(url, person=b"web-page")
+            cached = await kv.aget(self._page_cache, cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             headers = {
                 "User-Agent": "HeliumAI/1.0 (https://example.com/helium-ai; contact@example.com)"
             }
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, follow_redirects=True, timeout=10.0)
-                response.raise_for_status()
-                return response.text
+            response = await self._get(url, headers=headers, follow_redirects=True, timeout=10.0)
+            response.raise_for_status()
+            content = response.text
                 
         except Exception as e:
             logger.error(f"Error fetching page content from {url}: {str(e)}")
             return None
+        
+        if cache_key is not None:
+            await kv.aset(self._page_cache, cache_key, content, expire=self._page_cache_ttl)
+        return content
+    
+    async def get_pages(self, urls: List[str], max_concurrency: int = 20) -> List[Optional[str]]:
+        """Fetch several web pages concurrently.
+        
+        Args:
+            urls: The URLs of the pages to fetch
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            The page contents in the order of urls, with None for pages that could not be fetched
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.get_page_content(url)
+        
+        # Each distinct URL is fetched once
+        distinct = list(dict.fromkeys(urls))
+        pages = dict(zip(distinct, await asyncio.gather(*(fetch(url) for url in distinct))))
+        return [pages[url] for url in urls]
@@ -1,13 +1,23 @@
 import os
 import sys
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from typing import Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
+from typing import Optional, Dict, Any, Tuple
+from pydantic import BaseModel
 import json
 import asyncio
+import orjson
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import format_datetime
 
 # Set Windows event loop policy if on Windows
 if sys.platform == 'win32':
@@ -15,359 +25,275 @@ if sys.platform == 'win32':
 
 # Import agents
 try:
-    from agents import Zane, Mira, Chloe, Axel
+    from .agents import Zane, Mira, Chloe, Axel
 except ImportError as e:
     print(f"Error importing agents: {e}")
-    print("Make sure you're running from the project root directory.")
+    print("Make sure you're running from the project root directory (python -m src.web_app).")
     sys.exit(1)
+from .core.concurrency import run_sync
+from .core.history import HistoryStore, Msg
+from .core.query_cache import SemanticQueryCache
+from .core.vector_db import get_vector_db
+from .tools.web_search import WebSearchTool
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # Optional; responses are gzip-compressed without it
+    BrotliMiddleware = None
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def get_team() -> Zane:
+    """Create the agent team on first use: Zane, leading Mira, Chloe and Axel."""
+    zane = Zane()
+    zane.add_team_member(Mira())
+    zane.add_team_member(Chloe())
+    zane.add_team_member(Axel())
+    return zane
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up and tear down the server's shared resources.
+    
+    Builds the agent team, loads the message embedding model and loads saved history
+    at startup. On shutdown, closes the history store and the connection pool shared by
+    the agents' web searches.
+    """
+    print("Helium AI Web Interface is starting up...")
+    app.state.team = get_team()
+    try:
+        # Compile the page template now rather than on the first request
+        templates.get_template("index.html")
+    except TemplateNotFound:
+        logger.warning("index.html not found; run build_assets.py to generate it")
+    # Load the embedding model now, so a missing model is found before the first message
+    await embed_message("warm up")
+    try:
+        await history_store.open()
+        conversation_history.extend(await history_store.recent(conversation_history.maxlen))
+    except Exception as e:
+        logger.warning(f"Conversation history will not be saved: {str(e)}")
+    yield
+    await history_store.close()
+    await WebSearchTool.aclose_shared()
 
 # Create FastAPI app
-app = FastAPI(title="Helium AI", description="Multi-agent AI Research Assistant")
+app = FastAPI(
+    title="Helium AI",
+    description="Multi-agent AI Research Assistant",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
-# Set up templates
-templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
+# Paths whose responses are sent uncompressed, so streamed events are not held in a compressor buffer
+_UNCOMPRESSED_PATHS = frozenset(("/api/chat/stream",))
 
-# Initialize agents
-zane = Zane()
-mira = Mira()
-chloe = Chloe()
-axel = Axel()
+class CompressionMiddleware:
+    """Compress responses of at least 512 bytes with Brotli if installed and accepted, else gzip."""
+    
+    def __init__(self, app):
+        self.app = app
+        if BrotliMiddleware is not None:
+            self.compressed = BrotliMiddleware(app, minimum_size=512, gzip_fallback=True)
+        else:
+            self.compressed = GZipMiddleware(app, minimum_size=512, compresslevel=5)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] not in _UNCOMPRESSED_PATHS:
+            await self.compressed(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
 
-# Set up the team
-zane.add_team_member(mira)
-zane.add_team_member(chloe)
-zane.add_team_member(axel)
+app.add_middleware(CompressionMiddleware)
 
-# Store conversation history as a global variable
-conversation_history = []
+# Set up templates. Compiled templates are cached as bytecode across restarts, and
+# outside development they are not re-checked on disk for every render.
+templates = Jinja2Templates(
+    directory=os.path.join(os.path.dirname(__file__), "templates"),
+    auto_reload=os.getenv('HELIUM_SERVE', 'dev') != 'prod',
+    bytecode_cache=FileSystemBytecodeCache()
+)
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the application."""
-    print("Helium AI Web Interface is starting up...")
-    # Any initialization code can go here
+# Responses to earlier messages, reused for repeated and near-identical messages
+response_cache = SemanticQueryCache(max_entries=1024, threshold=0.95)
+
+@lru_cache(maxsize=None)
+def get_message_db():
+    """Open the vector DB whose embedding model embeds chat messages, once."""
+    return get_vector_db()
+
+# Set once embedding fails, so an unavailable model is not retried on every message
+_embedding_disabled = False
+
+async def embed_message(message: str):
+    """Embed a message with the RAG embedding model, or return None if it is unavailable.
+    
+    The first failure turns off the semantic cache tier; exact-text matches still work.
+    """
+    global _embedding_disabled
+    if _embedding_disabled:
+        return None
+    try:
+        # Opening the vector DB on first use blocks too, so it runs on the worker thread as well
+        return await run_sync(lambda: get_message_db().embed_query(message))
+    except Exception as e:
+        _embedding_disabled = True
+        logger.warning(f"Semantic response cache disabled; could not embed messages: {str(e)}")
+        return None
+
+async def cached_reply(message: str) -> Tuple[Optional[Tuple[bool, Any]], Any]:
+    """Look up the reply to a repeated or near-identical message.
+    
+    Returns:
+        The cached (success, content) pair or None, and the message's embedding if it
+        was computed (None otherwise), for caching the new reply
+    """
+    cached = response_cache.get(message)
+    embedding = None
+    if cached is None:
+        embedding = await embed_message(message)
+        if embedding is not None:
+            cached = response_cache.match(embedding)
+    return cached, embedding
+
+# Utility function to get current UTC time
+def utcnow():
+    return datetime.now(timezone.utc)
+
+# Store conversation history as a global ring buffer of the last 20 messages, backed by
+# SQLite so it survives restarts; the deque serves reads without touching the database
+conversation_history: "deque[Msg]" = deque(maxlen=20)
+history_store = HistoryStore()
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     """Render the main chat interface."""
-    return templates.TemplateResponse("index.html", {"request": request, "history": conversation_history})
+    return templates.TemplateResponse("index.html", {"request": request, "history": list(conversation_history)})
+
+class ChatIn(BaseModel):
+    """JSON body of a chat request."""
+    message: str
 
 @app.post("/api/chat")
-async def chat(message: str = Form(...)):
+async def chat(payload: ChatIn):
     """Handle chat messages and return agent responses."""
+    message = payload.message
+    # One timestamp for the response and both history entries
+    timestamp = utcnow().isoformat()
     try:
-        # Process the message with Zane (who will delegate as needed)
-        result = await zane.process(message)
+        cached, embedding = await cached_reply(message)
+        if cached is not None:
+            success, content = cached
+        else:
+            # Process the message with Zane (who will delegate as needed)
+            result = await get_team().process(message)
+            success, content = result.success, result.content
+            if success and embedding is not None:
+                response_cache.put(message, embedding, (success, content))
         
         # Format the response
         response = {
-            "success": result.success,
-            "message": result.content,
+            "success": success,
+            "message": content,
             "agent": "Zane (Team Leader)",
-            "timestamp": str(utcnow())
+            "timestamp": timestamp
         }
         
-        # Add to conversation history
-        conversation_history.append({
-            "type": "user",
-            "content": message,
-            "timestamp": str(utcnow())
-        })
-        conversation_history.append({
-            "type": "assistant",
-            "content": response,
-            "timestamp": str(utcnow())
-        })
-        
-        # Keep only the last 20 messages
-        global conversation_history
-        conversation_history = conversation_history[-20:] if len(conversation_history) > 20 else conversation_history
-        
+        await remember(message, response, timestamp)
         return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/history")
-async def get_history():
-    """Get the conversation history."""
-    return {"history": conversation_history}
+def sse_event(data: Dict, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Events message."""
+    prefix = b'event: ' + event.encode('utf-8') + b'\n' if event else b''
+    return prefix + b'data: ' + orjson.dumps(data) + b'\n\n'
 
-# Utility function to get current UTC time
-from datetime import datetime, timezone
+@app.get("/api/chat/stream")
+async def chat_stream(message: str = ""):
+    """Stream the reply to a chat message as Server-Sent Events.
+    
+    Each message carries a piece of the reply as {"success", "content"}; a final 'done'
+    event closes the exchange. Replies are cached as for /api/chat, and a cached reply
+    arrives as a single message.
+    """
+    message = message.strip()
+    if not message:
+        return ORJSONResponse({"success": False, "error": "Empty message"}, status_code=400)
+    
+    async def events():
+        timestamp = utcnow().isoformat()
+        parts = []
+        success = True
+        try:
+            # A cached reply is sent whole, as one message
+            cached, embedding = await cached_reply(message)
+            if cached is not None:
+                success, content = cached
+                parts.append(content)
+                yield sse_event({"success": success, "content": content})
+            else:
+                async for chunk in get_team().stream(message):
+                    success = success and chunk.success
+                    parts.append(chunk.content)
+                    yield sse_event({"success": chunk.success, "content": chunk.content})
+                if success and embedding is not None:
+                    response_cache.put(message, embedding, (success, parts[0] if len(parts) == 1 else parts))
+        except Exception as e:
+            logger.error(f"Error streaming chat reply: {str(e)}", exc_info=True)
+            success = False
+            yield sse_event({"success": False, "content": f"Error: {str(e)}"})
+        
+        await remember(message, {
+            "success": success,
+            "message": parts[0] if len(parts) == 1 else parts,
+            "agent": "Zane (Team Leader)",
+            "timestamp": timestamp
+        }, timestamp)
+        yield sse_event({}, event="done")
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-def utcnow():
-    return datetime.now(timezone.utc)
+async def remember(message: str, response: Dict[str, Any], timestamp: str) -> None:
+    """Add a chat exchange to the history; the deque drops the oldest messages past 20."""
+    entries = (Msg("user", message, timestamp), Msg("assistant", response, timestamp))
+    conversation_history.extend(entries)
+    await history_store.append(entries)
+
+@app.get("/api/history")
+async def get_history(request: Request):
+    """Get the conversation history.
+    
+    The response carries an ETag built from the history's length and newest timestamp;
+    a request whose If-None-Match matches it gets 304 Not Modified without a body.
+    """
+    last_timestamp = conversation_history[-1].timestamp if conversation_history else ""
+    etag = f'W/"{len(conversation_history)}-{last_timestamp}"'
+    # Browsers revalidate on every load and reuse their copy on a 304
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_timestamp:
+        headers["Last-Modified"] = format_datetime(datetime.fromisoformat(last_timestamp), usegmt=True)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse({"history": list(conversation_history)}, headers=headers)
 
-# Create necessary directories
+# Create necessary directories; the files themselves are written by build_assets.py
 os.makedirs(os.path.join(os.path.dirname(__file__), "static"), exist_ok=True)
 os.makedirs(os.path.join(os.path.dirname(__file__), "templates"), exist_ok=True)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")), name="static")
 
-def create_web_interface():
-    """Create the web interface files if they don't exist."""
-    # Create static directory if it doesn't exist
-    static_dir = os.path.join(os.path.dirname(__file__), "static")
-    os.makedirs(static_dir, exist_ok=True)
-    
-    # Create CSS file
-    css_path = os.path.join(static_dir, "style.css")
-    if not os.path.exists(css_path):
-        with open(css_path, "w") as f:
-            f.write("""
-            body {
-                font-family: Arial, sans-serif;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }
-            .chat-container {
-                background: white;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            .chat-header {
-                background: #4a6fa5;
-                color: white;
-                padding: 15px 20px;
-                font-size: 1.2em;
-            }
-            .chat-messages {
-                height: 500px;
-                overflow-y: auto;
-                padding: 20px;
-            }
-            .message {
-                margin-bottom: 15px;
-                padding: 10px 15px;
-                border-radius: 18px;
-                max-width: 70%;
-                word-wrap: break-word;
-            }
-            .user-message {
-                background: #e3f2fd;
-                margin-left: auto;
-                border-bottom-right-radius: 0;
-            }
-            .assistant-message {
-                background: #f1f1f1;
-                margin-right: auto;
-                border-bottom-left-radius: 0;
-            }
-            .message-sender {
-                font-weight: bold;
-                margin-bottom: 5px;
-                font-size: 0.9em;
-            }
-            .message-time {
-                font-size: 0.7em;
-                color: #666;
-                text-align: right;
-                margin-top: 5px;
-            }
-            .input-area {
-                display: flex;
-                padding: 15px;
-                background: #f9f9f9;
-                border-top: 1px solid #eee;
-            }
-            #user-input {
-                flex-grow: 1;
-                padding: 10px 15px;
-                border: 1px solid #ddd;
-                border-radius: 20px;
-                outline: none;
-            }
-            #send-button {
-                background: #4a6fa5;
-                color: white;
-                border: none;
-                border-radius: 20px;
-                padding: 0 20px;
-                margin-left: 10px;
-                cursor: pointer;
-            }
-            #send-button:hover {
-                background: #3a5a80;
-            }
-            .typing-indicator {
-                display: none;
-                padding: 10px 15px;
-                color: #666;
-                font-style: italic;
-            }
-            """)
-    
-    # Create JavaScript file
-    js_path = os.path.join(static_dir, "script.js")
-    if not os.path.exists(js_path):
-        with open(js_path, "w") as f:
-            f.write("""
-            document.addEventListener('DOMContentLoaded', function() {
-                const chatMessages = document.getElementById('chat-messages');
-                const userInput = document.getElementById('user-input');
-                const sendButton = document.getElementById('send-button');
-                const typingIndicator = document.getElementById('typing-indicator');
-                
-                // Auto-scroll to bottom of chat
-                function scrollToBottom() {
-                    chatMessages.scrollTop = chatMessages.scrollHeight;
-                }
-                
-                // Add a message to the chat
-                function addMessage(content, isUser = false) {
-                    const messageDiv = document.createElement('div');
-                    messageDiv.className = `message ${isUser ? 'user-message' : 'assistant-message'}`;
-                    
-                    const senderDiv = document.createElement('div');
-                    senderDiv.className = 'message-sender';
-                    senderDiv.textContent = isUser ? 'You' : 'Helium AI';
-                    
-                    const contentDiv = document.createElement('div');
-                    contentDiv.className = 'message-content';
-                    
-                    // Check if content is an object (from the API response)
-                    if (typeof content === 'object') {
-                        contentDiv.textContent = JSON.stringify(content, null, 2);
-                    } else {
-                        contentDiv.textContent = content;
-                    }
-                    
-                    const timeDiv = document.createElement('div');
-                    timeDiv.className = 'message-time';
-                    timeDiv.textContent = new Date().toLocaleTimeString();
-                    
-                    messageDiv.appendChild(senderDiv);
-                    messageDiv.appendChild(contentDiv);
-                    messageDiv.appendChild(timeDiv);
-                    
-                    chatMessages.appendChild(messageDiv);
-                    scrollToBottom();
-                }
-                
-                // Send message to the server
-                async function sendMessage() {
-                    const message = userInput.value.trim();
-                    if (!message) return;
-                    
-                    // Add user message to chat
-                    addMessage(message, true);
-                    userInput.value = '';
-                    
-                    // Show typing indicator
-                    typingIndicator.style.display = 'block';
-                    scrollToBottom();
-                    
-                    try {
-                        const response = await fetch('/api/chat', {
-                            method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/x-www-form-urlencoded',
-                            },
-                            body: `message=${encodeURIComponent(message)}`
-                        });
-                        
-                        if (!response.ok) {
-                            throw new Error('Network response was not ok');
-                        }
-                        
-                        const data = await response.json();
-                        
-                        // Add assistant's response to chat
-                        if (data.success && data.message) {
-                            addMessage(data.message);
-                        } else {
-                            addMessage('I encountered an error processing your request.');
-                        }
-                    } catch (error) {
-                        console.error('Error:', error);
-                        addMessage('Sorry, there was an error connecting to the server.');
-                    } finally {
-                        // Hide typing indicator
-                        typingIndicator.style.display = 'none';
-                    }
-                }
-                
-                // Event listeners
-                sendButton.addEventListener('click', sendMessage);
-                userInput.addEventListener('keypress', function(e) {
-                    if (e.key === 'Enter') {
-                        sendMessage();
-                    }
-                });
-                
-                // Load any existing conversation history
-                async function loadHistory() {
-                    try {
-                        const response = await fetch('/api/history');
-                        const data = await response.json();
-                        
-                        if (data.history && Array.isArray(data.history)) {
-                            data.history.forEach(item => {
-                                if (item.type === 'user') {
-                                    addMessage(item.content, true);
-                                } else if (item.type === 'assistant') {
-                                    addMessage(item.content.content);
-                                }
-                            });
-                        }
-                    } catch (error) {
-                        console.error('Error loading history:', error);
-                    }
-                }
-                
-                loadHistory();
-            });
-            """)
-    
-    # Create templates directory if it doesn't exist
-    templates_dir = os.path.join(os.path.dirname(__file__), "templates")
-    os.makedirs(templates_dir, exist_ok=True)
-    
-    # Create HTML template
-    html_path = os.path.join(templates_dir, "index.html")
-    if not os.path.exists(html_path):
-        with open(html_path, "w") as f:
-            f.write("""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Helium AI - Multi-agent Research Assistant</title>
-                <link rel="stylesheet" href="/static/style.css">
-            </head>
-            <body>
-                <div class="chat-container">
-                    <div class="chat-header">
-                        Helium AI Research Assistant
-                    </div>
-                    <div id="chat-messages" class="chat-messages">
-                        <div id="typing-indicator" class="typing-indicator">
-                            Helium AI is typing...
-                        </div>
-                    </div>
-                    <div class="input-area">
-                        <input type="text" id="user-input" placeholder="Type your message here..." autofocus>
-                        <button id="send-button">Send</button>
-                    </div>
-                </div>
-                <script src="/static/script.js"></script>
-            </body>
-            </html>
-            """)
-
-# Create the web interface files
-create_web_interface()
-
 def start_server(host: str = "0.0.0.0", port: int = 8000):
     """Start the FastAPI server with uvicorn."""
     config = uvicorn.Config(
-        "web_app:app",
+        "src.web_app:app",
         host=host,
         port=port,
         reload=True,
@@ -5,17 +5,19 @@ This script tests the integration between all agents in the Helium AI system.
 """
 
 import asyncio
-import json
 import logging
+import sys
+import orjson
 from src.agents import Zane, Mira, Chloe, Axel
+from src.core.logging_setup import configure_logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Results are printed indented; numpy arrays and naive datetimes serialize natively
+_PRINT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
 class TestHeliumAI:
     """Integration test class for Helium AI."""
     
@@ -33,25 +35,32 @@ class TestHeliumAI:
     
     async def run_test(self, task: str):
         """Run a test with the given task."""
+        # Process the task with Zane (who will delegate as needed)
+        self.print_result(task, await self.zane.process(task))
+    
+    def print_result(self, task: str, result):
+        """Print a task's result and Zane's latest memories."""
         print(f"\n{'='*80}")
         print(f"TESTING TASK: {task}")
         print(f"{'='*80}")
         
-        # Process the task with Zane (who will delegate as needed)
-        result = await self.zane.process(task)
-        
         # Print the result
         print("\nRESULT:")
-        print(json.dumps(result.content, indent=2, default=str))
+        print(orjson.dumps(result.content, default=str, option=_PRINT_OPTIONS).decode())
         print(f"\nSuccess: {result.success}")
         
         # Print agent's memory
         print("\nZane's memory:")
-        for i, memory in enumerate(self.zane.memory[-3:], 1):  # Show last 3 memories
+        for i, memory in enumerate(list(self.zane.memory)[-3:], 1):  # Show last 3 memories
             print(f"{i}. {memory}")
 
-async def main():
-    """Main test function."""
+async def main(interactive: bool = False):
+    """Main test function.
+    
+    Args:
+        interactive: Run the tasks one at a time, pausing between them; otherwise
+            all tasks run concurrently and their results are printed in order
+    """
     tester = TestHeliumAI()
     
     # Test cases
@@ -62,14 +71,19 @@ async def main():
         "Create a business strategy for an AI-powered research platform"
     ]
     
-    for task in test_cases:
-        await tester.run_test(task)
-        
-        # Add a separator between tests
-        if task != test_cases[-1]:
-            input("\nPress Enter to run the next test...")
+    if interactive:
+        for task in test_cases:
+            await tester.run_test(task)
+            
+            # Add a separator between tests
+            if task != test_cases[-1]:
+                input("\nPress Enter to run the next test...")
+    else:
+        results = await asyncio.gather(*(tester.zane.process(task) for task in test_cases))
+        for task, result in zip(test_cases, results):
+            tester.print_result(task, result)
     
     print("\nAll tests completed!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(interactive="--interactive" in sys.argv[1:]))
@@ -0,0 +1,44 @@
+import asyncio
+from collections import deque
+
+import pytest
+from src.agents.base_agent import BaseAgent, AgentResponse
+
+class EchoAgent(BaseAgent):
+    """A test implementation of BaseAgent for testing purposes."""
+    
+    async def process(self, task: str, context: dict = None) -> AgentResponse:
+        """Echo the task back as a response."""
+        return AgentResponse(
+            success=True,
+            content={"echo": task, "context": context or {}}
+        )
+
+@pytest.fixture(scope="session")
+def shared_agent():
+    """One EchoAgent for the whole session; use the agent fixture to get it with empty memory."""
+    return EchoAgent("TestAgent", "Tester")
+
+@pytest.fixture
+def agent(shared_agent):
+    """The shared EchoAgent, with its memory emptied after each test."""
+    yield shared_agent
+    shared_agent.memory = deque(maxlen=shared_agent.memory_size)
+    shared_agent._reset_memory_index()
+
+@pytest.fixture(scope="session")
+def team():
+    """Zane leading Mira, Chloe and Axel, built once for the whole session."""
+    from src.agents import Zane, Mira, Chloe, Axel
+    zane = Zane()
+    for member in (Mira(), Chloe(), Axel()):
+        zane.add_team_member(member)
+    return zane
+
+@pytest.fixture(scope="session")
+def rag():
+    """A RAG system on 'test_collection', opened once and deleted when the session ends."""
+    from src.core.rag import get_rag_system
+    system = get_rag_system("test_collection")
+    yield system
+    asyncio.run(system.delete_collection())
@@ -1,28 +1,17 @@
+import json
 import pytest
 from src.agents.base_agent import BaseAgent, AgentResponse
 
-class TestAgent(BaseAgent):
-    """A test implementation of BaseAgent for testing purposes."""
-    
-    async def process(self, task: str, context: dict = None) -> AgentResponse:
-        """Echo the task back as a response."""
-        return AgentResponse(
-            success=True,
-            content={"echo": task, "context": context or {}}
-        )
-
 @pytest.mark.asyncio
-async def test_base_agent_initialization():
+async def test_base_agent_initialization(agent):
     """Test that a BaseAgent can be initialized."""
-    agent = TestAgent("TestAgent", "Tester")
     assert agent.name == "TestAgent"
     assert agent.role == "Tester"
     assert len(agent.memory) == 0
 
 @pytest.mark.asyncio
-async def test_base_agent_process():
+async def test_base_agent_process(agent):
     """Test the process method of a BaseAgent implementation."""
-    agent = TestAgent("TestAgent", "Tester")
     task = "test task"
     context = {"test": "value"}
     
@@ -33,10 +22,8 @@ async def test_base_agent_process():
     assert response.content["context"] == context
 
 @pytest.mark.asyncio
-async def test_memory_functions():
+async def test_memory_functions(agent):
     """Test the memory-related functions of BaseAgent."""
-    agent = TestAgent("TestAgent", "Tester")
-    
     # Test adding to memory
     agent.add_to_memory("Test memory content", {"type": "test"})
     assert len(agent.memory) == 1
@@ -53,3 +40,110 @@ async def test_memory_functions():
     
     non_matching = agent.get_memory("nonexistent")
     assert len(non_matching) == 0
+
+@pytest.mark.asyncio
+async def test_memory_index(agent):
+    """Test that memory queries match whole words, phrases and partial words."""
+    agent.add_to_memory("Quarterly revenue grew", {"type": "finance"})
+    agent.add_to_memory("Revenue forecast for Q3", {"type": "forecast"})
+    agent.add_to_memory({"task": "market analysis"})
+    
+    assert len(agent.get_memory("revenue")) == 2
+    assert agent.get_memory("REVENUE GREW") == [agent.memory[0]]
+    assert agent.get_memory("grew revenue") == []
+    assert agent.get_memory("forec") == [agent.memory[1]]
+    assert agent.get_memory("market") == [agent.memory[2]]
+    
+    # Whole-word index hits do not hide longer words containing the query
+    agent.add_to_memory("markets grow")
+    assert agent.get_memory("market") == [agent.memory[2], agent.memory[3]]
+    assert agent.get_memory("'content': 'markets grow'") == [agent.memory[3]]
+    
+    # Entries appended directly are picked up by the next query
+    agent.memory.append({"content": "direct revenue note", "metadata": {}})
+    assert len(agent.get_memory("revenue")) == 3
+
+@pytest.mark.asyncio
+async def test_memory_is_bounded(agent):
+    """Test that the oldest memories are evicted and no longer match queries."""
+    agent.memory = type(agent.memory)(maxlen=2)
+    
+    for n in ("first", "second", "third"):
+        agent.add_to_memory(f"{n} revenue note")
+    
+    assert [m["content"] for m in agent.memory] == ["second revenue note", "third revenue note"]
+    assert agent.get_memory("first") == []
+    assert [m["content"] for m in agent.get_memory("third revenue")] == ["third revenue note"]
+    assert len(agent.get_memory("revenue")) == 2
+
+@pytest.mark.asyncio
+async def test_response_cache(agent):
+    """Test that repeated tasks are served from the shared response cache."""
+    BaseAgent.clear_cache()
+    
+    first = await agent.process("cached task", {"test": "value"})
+    assert len(BaseAgent._response_cache) == 1
+    second = await agent.process("cached task", {"test": "value"})
+    assert second == first and second is not first
+    assert len(BaseAgent._response_cache) == 1
+    await agent.process("cached task", {"test": "other"})
+    assert len(BaseAgent._response_cache) == 2
+    
+    # Callers get copies, so changing a response leaves the cached one intact
+    second.content["echo"] = "changed"
+    assert (await agent.process("cached task", {"test": "value"})).content["echo"] == "cached task"
+    
+    # A missing context and an empty one share an entry
+    await agent.process("no context")
+    await agent.process("no context", {})
+    assert len(BaseAgent._response_cache) == 3
+
+@pytest.mark.asyncio
+async def test_response_cache_expires(monkeypatch):
+    """Test that cached responses are recomputed once they are older than cache_ttl."""
+    calls = []
+    
+    class CountingAgent(BaseAgent):
+        async def process(self, task, context=None):
+            calls.append(task)
+            return AgentResponse(success=True, content=len(calls))
+    
+    agent = CountingAgent("Counting", "Tester")
+    BaseAgent.clear_cache()
+    await agent.process("task")
+    await agent.process("task")
+    assert len(calls) == 1
+    
+    monkeypatch.setattr(BaseAgent, "cache_ttl", 0.0)
+    BaseAgent.clear_cache()
+    await agent.process("task")
+    await agent.process("task")
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_process_batch(agent):
+    """Test that process_batch returns one response per task, in order."""
+    responses = await agent.process_batch(["first", "second"], [{"n": 1}, None])
+    
+    assert [r.content["echo"] for r in responses] == ["first", "second"]
+    assert responses[0].content["context"] == {"n": 1}
+
+@pytest.mark.asyncio
+async def test_process_batch_isolates_errors():
+    """Test that a task that raises fails only its own slot in the batch."""
+    class PickyAgent(BaseAgent):
+        async def process(self, task, context=None):
+            if task == "bad":
+                raise ValueError("boom")
+            return AgentResponse(success=True, content=task)
+    
+    responses = await PickyAgent("Picky", "Tester").process_batch(["good", "bad"])
+    
+    assert responses[0].content == "good"
+    assert isinstance(responses[1], ValueError)
+
+@pytest.mark.asyncio
+async def test_team_response_without_context_encodes(team):
+    """Test that responses to tasks sent without a context can be JSON-encoded."""
+    response = await team.process("collect market data")
+    assert "content" in json.loads(json.dumps(response.dict()))
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from src.core.batching import MicroBatcher
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_a_batch():
+    """Test that concurrent submissions are handled in one batch, in order."""
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, max_size=8, max_wait=0.05)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    await batcher.aclose()
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+@pytest.mark.asyncio
+async def test_batch_size_and_errors():
+    """Test that batches are capped and per-item errors reach only their caller."""
+    batches = []
+
+    async def handler(items):
+        batches.append(len(items))
+        return [ValueError(item) if item == 1 else item for item in items]
+
+    batcher = MicroBatcher(handler, max_size=2, max_wait=0.05)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+    await batcher.aclose()
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    assert batches == [2, 1]
+
+@pytest.mark.asyncio
+async def test_slow_batch_does_not_block_later_ones():
+    """Test that a slow batch does not hold up batches queued after it."""
+    async def handler(items):
+        await asyncio.sleep(max(items))
+        return items
+
+    batcher = MicroBatcher(handler, max_size=1, max_wait=0)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    slow = asyncio.ensure_future(batcher.submit(1.0))
+    await asyncio.sleep(0)
+    await asyncio.gather(batcher.submit(0.01), batcher.submit(0.01))
+    elapsed = loop.time() - start
+    await batcher.aclose()
+
+    assert elapsed < 0.5
+    with pytest.raises(RuntimeError):
+        await slow
+
+@pytest.mark.asyncio
+async def test_short_result_list_fails_every_caller():
+    """Test that a handler returning too few results fails the whole batch."""
+    async def handler(items):
+        return items[:1]
+
+    batcher = MicroBatcher(handler, max_size=8, max_wait=0.05)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True), 1
+    )
+    await batcher.aclose()
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+@pytest.mark.asyncio
+async def test_close_fails_batch_being_collected():
+    """Test that closing the batcher fails items collected into a batch that was not yet dispatched."""
+    async def handler(items):
+        return items
+
+    batcher = MicroBatcher(handler, max_size=8, max_wait=1.0)
+    pending = asyncio.ensure_future(batcher.submit(1))
+    await asyncio.sleep(0.05)
+    await batcher.aclose()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(pending, 1)
@@ -0,0 +1,43 @@
+import pytest
+from src.agents.cache import LLMCache
+
+async def fake_embed(text: str):
+    """Embed text by its first word, so paraphrases starting alike are similar."""
+    return [1.0, 0.0] if text.split()[0].lower() == "revenue" else [0.0, 1.0]
+
+@pytest.mark.asyncio
+async def test_exact_match():
+    """Test that a cached message is returned and counted as a hit."""
+    cache = LLMCache()
+    assert await cache.get("hello") is None
+    await cache.set("hello", "Hi there")
+
+    assert await cache.get("hello") == "Hi there"
+    assert cache.stats == {"hits": 1, "semantic_hits": 0, "misses": 1}
+
+@pytest.mark.asyncio
+async def test_semantic_match():
+    """Test that similar messages hit the cache and dissimilar ones miss."""
+    cache = LLMCache(embed_fn=fake_embed, threshold=0.92)
+    await cache.set("revenue for 2023", "$1M")
+
+    assert await cache.get("Revenue in 2023?") == "$1M"
+    assert await cache.get("market strategy") is None
+    assert cache.stats["semantic_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_ttl_expiry():
+    """Test that expired entries are not served."""
+    cache = LLMCache(ttl=-1)
+    await cache.set("hello", "Hi there")
+    assert await cache.get("hello") is None
+
+@pytest.mark.asyncio
+async def test_recaching_keeps_one_vector():
+    """Test that caching a message again replaces its embedding instead of adding another."""
+    cache = LLMCache(embed_fn=fake_embed)
+    await cache.set("revenue for 2023", "$1M")
+    await cache.set("revenue for 2023", "$2M")
+
+    assert len(cache._index) == 1
+    assert await cache.get("Revenue in 2023?") == "$2M"
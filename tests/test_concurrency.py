@@ -0,0 +1,37 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from src.core import concurrency
+
+@pytest.mark.asyncio
+async def test_run_sync_respects_limit(monkeypatch):
+    """Test that run_sync passes arguments through and caps concurrent blocking calls."""
+    monkeypatch.setattr(concurrency, "SYNC_LIMIT", 2)
+    monkeypatch.setattr(concurrency, "_limiter", None)
+    running = []
+    peak = []
+    lock = threading.Lock()
+    
+    def work(delay, scale=1):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(delay)
+        with lock:
+            running.pop()
+        return delay * scale
+    
+    results = await asyncio.gather(*(concurrency.run_sync(work, 0.02, scale=10) for _ in range(6)))
+    assert results == [0.2] * 6
+    assert max(peak) == 2
+
+def test_shared_client_closed_when_loop_changes():
+    """Test that the shared web search client from an earlier event loop is closed, not leaked."""
+    from src.tools.web_search import WebSearchTool
+    
+    first = asyncio.run(WebSearchTool.get_client())
+    second = asyncio.run(WebSearchTool.get_client())
+    assert first.is_closed and second is not first
+    asyncio.run(WebSearchTool.aclose_shared())
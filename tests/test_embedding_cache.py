@@ -0,0 +1,48 @@
+import numpy as np
+from src.core.embeddings import EmbeddingCache, dequantize, quantize
+
+def embed_lengths(texts):
+    """Embed each text as a vector filled with its length."""
+    embed_lengths.calls.append(list(texts))
+    return [np.full(4, len(text), dtype=np.float32) for text in texts]
+
+def test_embeds_each_distinct_text_once():
+    """Test that repeated and cached texts skip the embedding function."""
+    embed_lengths.calls = []
+    cache = EmbeddingCache(max_entries=3)
+
+    vectors = cache.embed(["a", "bb", "a"], embed_lengths)
+    assert [v[0] for v in vectors] == [1.0, 2.0, 1.0]
+    assert embed_lengths.calls == [["a", "bb"]]
+
+    vectors = cache.embed(["bb", "cccc"], embed_lengths)
+    assert [v[0] for v in vectors] == [2.0, 4.0]
+    assert embed_lengths.calls[-1] == ["cccc"]
+
+def test_persists_across_instances(tmp_path):
+    """Test that a saved cache is reloaded only for the same embedding model."""
+    embed_lengths.calls = []
+    path = str(tmp_path / "embed_cache.npz")
+    cache = EmbeddingCache(path, model_name="minilm")
+    cache.embed(["hello", "world"], embed_lengths)
+    cache.save()
+
+    reloaded = EmbeddingCache(path, model_name="minilm")
+    assert len(reloaded) == 2
+    reloaded.embed(["world"], embed_lengths)
+    assert embed_lengths.calls == [["hello", "world"]]
+
+    assert len(EmbeddingCache(path, model_name="other")) == 0
+
+def test_quantized_round_trip_keeps_similarity():
+    """Test that int8 quantization keeps unit embeddings nearly identical."""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(100, 384)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    for vector in vectors:
+        codes, scale = quantize(vector)
+        assert codes.dtype == np.int8
+        restored = dequantize(codes, scale)
+        cosine = restored @ vector / np.linalg.norm(restored)
+        assert cosine > 0.9999
@@ -0,0 +1,17 @@
+from src.agents import fastpath
+
+def test_direct_replies():
+    """Test that greetings and acknowledgements are answered from the canned table."""
+    assert fastpath.route("Hi!") == (fastpath.DIRECT, fastpath._CANNED_REPLIES["hi"])
+    assert fastpath.classify("thanks") is not None
+
+def test_reject_and_render():
+    """Test that invalid input is rejected and real tasks go to the agents."""
+    before = dict(fastpath.stats)
+    
+    assert fastpath.route("?!")[0] == fastpath.REJECT
+    assert fastpath.route("x" * (fastpath.MAX_MESSAGE_LENGTH + 1))[0] == fastpath.REJECT
+    assert fastpath.route("hi, what is our revenue forecast?") == (fastpath.RENDER, None)
+    
+    assert fastpath.stats[fastpath.REJECT] == before[fastpath.REJECT] + 2
+    assert fastpath.stats[fastpath.RENDER] == before[fastpath.RENDER] + 1
@@ -0,0 +1,30 @@
+from src.core.query_cache import SemanticQueryCache
+
+RESULTS = [{"content": "Helium AI is a multi-agent system", "metadata": {}, "score": 0.1}]
+
+def test_exact_and_semantic_hits():
+    """Test that repeats and near-duplicate embeddings hit, and other scopes miss."""
+    cache = SemanticQueryCache(threshold=0.97)
+    cache.put("What is Helium AI?", [1.0, 0.0, 0.0], RESULTS, scope="k=2")
+
+    assert cache.get("What is Helium AI?", scope="k=2") == RESULTS
+    assert cache.match([0.99, 0.05, 0.0], scope="k=2") == RESULTS
+    assert cache.match([0.0, 1.0, 0.0], scope="k=2") is None
+    assert cache.match([1.0, 0.0, 0.0], scope="k=5") is None
+    assert cache.stats == {"hits": 1, "semantic_hits": 1, "misses": 2}
+
+def test_lru_eviction_and_clear():
+    """Test that the least recently used query is evicted and clear() empties the cache."""
+    cache = SemanticQueryCache(max_entries=2)
+    cache.put("a", [1.0, 0.0], RESULTS)
+    cache.put("b", [0.0, 1.0], RESULTS)
+    cache.get("a")
+    cache.put("c", [1.0, 1.0], RESULTS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULTS
+    assert cache.match([0.0, 1.0]) is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("a") is None
@@ -3,6 +3,8 @@ import os
 import asyncio
 from pathlib import Path
 
+import pytest
+
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -15,11 +17,12 @@ def print_header(text: str) -> None:
     print(f" {text} ".center(80, "#"))
     print("=" * 80 + "\n")
 
-async def test_rag_system():
-    """Test the RAG system with sample documents and queries."""
-    # Initialize RAG system
-    print_header("Initializing RAG System")
-    rag = get_rag_system("test_collection")
+@pytest.mark.asyncio
+async def test_rag_system(rag):
+    """Test the RAG system with sample documents and queries.
+    
+    Under pytest, rag is the session's shared RAG system (see conftest.py).
+    """
     
     # Sample documents
     documents = [
@@ -71,9 +74,16 @@ async def test_rag_system():
         "How do I use the RAG system?"
     ]
     
-    for query in test_queries:
+    # The queries are independent, so run them concurrently
+    all_results = await asyncio.gather(*(rag.query(query, k=2) for query in test_queries))
+    assert len(all_results) == len(test_queries)
+    assert all(len(results) <= 2 for results in all_results)
+    if success:
+        # Each query's results come back in its own slot
+        assert all(all_results)
+        assert all_results[0][0]['metadata']['source'] == "introduction.txt"
+    for query, results in zip(test_queries, all_results):
         print_header(f"Query: {query}")
-        results = await rag.query(query, k=2)
         
         print(f"Found {len(results)} results:")
         for i, result in enumerate(results, 1):
@@ -92,4 +102,7 @@ async def test_rag_system():
     # print("\nTest collection deleted.")
 
 if __name__ == "__main__":
-    asyncio.run(test_rag_system())
+    # Initialize RAG system; chunk IDs are content hashes, so rerunning the script
+    # against the persisted collection does not duplicate documents
+    print_header("Initializing RAG System")
+    asyncio.run(test_rag_system(get_rag_system("test_collection")))
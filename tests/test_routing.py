@@ -0,0 +1,24 @@
+from src.agents.routing import KeywordRouter
+
+ROUTER = KeywordRouter((
+    ("finance", ("market size", "valuation")),
+    ("strategy", ("market", "plan")),
+), default="general")
+
+def test_route_priority_and_default():
+    """Test that the highest-priority route wins regardless of keyword position."""
+    assert ROUTER.route("Plan the valuation") == "finance"
+    assert ROUTER.route("Marketing plan") == "strategy"
+    assert ROUTER.route("hello") == "general"
+
+def test_matches_overlapping_keywords():
+    """Test that keywords sharing a prefix each count, as with substring checks."""
+    assert ROUTER.matches("What is the MARKET SIZE?") == ["finance", "strategy"]
+    assert ROUTER.matches("supermarkets") == ["strategy"]
+    assert ROUTER.matches("nothing here") == []
+
+def test_keyword_at_end_of_long_text():
+    """Test that a keyword is found however far into a long prompt it appears."""
+    text = "background " * 2000 + "Valuation"
+    assert ROUTER.route(text) == "finance"
+    assert ROUTER.matches(text) == ["finance"]
@@ -0,0 +1,37 @@
+import pytest
+
+@pytest.mark.asyncio
+async def test_zane_delegates_to_specialists(team):
+    """Test that Zane sends each task to the highest-priority matching team member."""
+    single = await team.process("analyze the data")
+    assert single.success is True
+    
+    # A task matching several specialties goes to the highest-priority one only
+    before = len(team.get_memory("'to': 'chloe'"))
+    multi = await team.process("financial valuation and competitive strategy")
+    assert multi.success is True
+    assert len(team.get_memory("'to': 'chloe'")) == before + 1
+    assert "delegated_to" not in multi.metadata
+
+@pytest.mark.asyncio
+async def test_zane_answers_greetings_directly(team):
+    """Test that greetings are answered by Zane without delegating."""
+    response = await team.process("Hello")
+    assert "team leader" in response.content["message"]
+
+@pytest.mark.asyncio
+async def test_zane_logs_repeated_delegations(team):
+    """Test that a repeated task is logged as a delegation each time it is handled."""
+    before = len(team.get_memory("'to': 'axel'"))
+    await team.process("competitive strategy for a bakery")
+    await team.process("competitive strategy for a bakery")
+    assert len(team.get_memory("'to': 'axel'")) == before + 2
+
+@pytest.mark.asyncio
+async def test_failed_searches_are_not_cached(team, monkeypatch):
+    """Test that Mira does not cache the placeholder results of a failed web search."""
+    mira = team.team_members["Mira"]
+    monkeypatch.setattr(mira.web_search, "api_key", None)
+    response = await team.process("collect data on failed searches")
+    assert response.success is False
+    assert not mira.data_cache
@@ -0,0 +1,21 @@
+from src.core.text_splitter import SimpleTextSplitter
+
+def test_paragraphs_packed_with_overlap():
+    """Test that paragraphs are packed up to chunk_size and the overlap repeats whole paragraphs."""
+    text = "\n\n".join(f"Paragraph {i} " + "x" * 40 for i in range(10))
+    chunks = SimpleTextSplitter(chunk_size=150, chunk_overlap=60).split_text(text)
+
+    assert all(len(chunk) <= 150 for chunk in chunks)
+    assert chunks[0].startswith("Paragraph 0")
+    assert chunks[1].startswith(chunks[0].split("\n")[-1])
+    assert chunks[-1].endswith("Paragraph 9 " + "x" * 40)
+
+def test_long_paragraph_split_on_sentences():
+    """Test that a paragraph over chunk_size is split into sentence chunks without overlap."""
+    text = " ".join(f"Sentence number {i} is here." for i in range(20))
+    chunks = SimpleTextSplitter(chunk_size=100, chunk_overlap=0).split_text(text)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert " ".join(chunks) == text
+    assert SimpleTextSplitter().split_text("") == []
@@ -0,0 +1,86 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from src import web_app
+from src.core.history import HistoryStore, Msg
+from src.core.query_cache import SemanticQueryCache
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A client for the web app, with history saved to a temporary database and an empty response cache."""
+    monkeypatch.setattr(web_app, "history_store", HistoryStore(str(tmp_path / "history.db")))
+    monkeypatch.setattr(web_app, "response_cache", SemanticQueryCache(max_entries=16, threshold=0.95))
+    web_app.conversation_history.clear()
+    with TestClient(web_app.app) as client:
+        yield client
+    web_app.conversation_history.clear()
+
+def parse_sse(body: str):
+    """Split a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for block in body.split("\n\n"):
+        if not block:
+            continue
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields.get("event"), orjson.loads(fields["data"])))
+    return events
+
+def test_chat_stream_events(client):
+    """Test that a streamed reply is framed as SSE messages ending with a 'done' event."""
+    response = client.get("/api/chat/stream", params={"message": "hello"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = parse_sse(response.text)
+    assert events[-1] == ("done", {})
+    assert all(event is None and data["success"] for event, data in events[:-1])
+    assert [m.type for m in web_app.conversation_history] == ["user", "assistant"]
+
+    assert client.get("/api/chat/stream", params={"message": " "}).status_code == 400
+
+def test_chat_stream_uses_response_cache(client):
+    """Test that the stream path answers from the response cache like /api/chat."""
+    web_app.response_cache.put("cached question", [1.0, 0.0], (True, "cached answer"))
+
+    events = parse_sse(client.get("/api/chat/stream", params={"message": "cached question"}).text)
+    assert events == [(None, {"success": True, "content": "cached answer"}), ("done", {})]
+
+def test_history_etag(client):
+    """Test that /api/history answers 304 to a matching If-None-Match until the history changes."""
+    first = client.get("/api/history")
+    etag = first.headers["etag"]
+    assert client.get("/api/history", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/chat", json={"message": "hello"})
+    second = client.get("/api/history", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["etag"] != etag
+    assert "last-modified" in second.headers
+    assert len(second.json()["history"]) == 2
+
+@pytest.mark.asyncio
+async def test_history_store_round_trip(tmp_path):
+    """Test that stored messages are read back oldest first, limited to the latest ones."""
+    store = HistoryStore(str(tmp_path / "history.db"))
+    await store.open()
+    await store.append([Msg("user", "hi", "t1"), Msg("assistant", {"message": "hello"}, "t1")])
+    await store.append([Msg("user", "bye", "t2")])
+    recent = await store.recent(2)
+    await store.close()
+
+    assert recent == [Msg("assistant", {"message": "hello"}, "t1"), Msg("user", "bye", "t2")]
+
+@pytest.mark.asyncio
+async def test_embedding_failure_disables_semantic_cache(monkeypatch):
+    """Test that a failing embedding model is tried once, not on every message."""
+    calls = []
+
+    def unavailable():
+        calls.append(1)
+        raise OSError("model unavailable")
+
+    monkeypatch.setattr(web_app, "get_message_db", unavailable)
+    monkeypatch.setattr(web_app, "_embedding_disabled", False)
+    assert await web_app.embed_message("first") is None
+    assert await web_app.embed_message("second") is None
+    assert len(calls) == 1